@@ -4,6 +4,7 @@ import React, { useState, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import { SkillNode } from '@/types/skills';
 import Image from 'next/image';
+import { getIconVariantSrc } from '@/utils/iconVariants';
 
 interface NodeEditorProps {
   node: SkillNode;
@@ -188,7 +189,7 @@ export default function NodeEditor({ node, onClose, onSave }: NodeEditorProps) {
                         title={`Icon ${index + 1}`}
                       >
                         <Image
-                          src={iconPath}
+                          src={getIconVariantSrc(iconPath, 48)}
                           alt={`Icon ${index + 1}`}
                           width={48}
                           height={48}
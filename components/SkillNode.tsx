@@ -1,8 +1,11 @@
 'use client';
 
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import { SkillNode, SkillState } from '@/types/skills';
+import { getIconPlaceholder } from '@/data/iconPlaceholders';
+import { getIconSprite } from '@/utils/iconAtlas';
+import { getIconVariantSrc } from '@/utils/iconVariants';
 
 interface SkillNodeProps {
   node: SkillNode;
@@ -15,6 +18,7 @@ interface SkillNodeProps {
   onHover: (hover: boolean, e?: React.MouseEvent<SVGCircleElement>) => void;
   isMobilePortrait?: boolean;
   portraitActiveTree?: string | null;
+  pixelsPerUnit?: number; // Screen pixels per SVG unit, used to pick the icon sprite or variant
 }
 
 export default function SkillNodeComponent({
@@ -28,6 +32,7 @@ export default function SkillNodeComponent({
   onHover,
   isMobilePortrait,
   portraitActiveTree,
+  pixelsPerUnit,
 }: SkillNodeProps) {
   // Tooltip yellow color for hover state
   const hoverColor = '#f5f0dc';
@@ -112,6 +117,34 @@ export default function SkillNodeComponent({
   const iconScale = getIconScale();
   const iconSize = node.radius * iconScale;
   const iconOffset = iconSize / 2;
+  const iconDisplaySize = iconSize * (pixelsPerUnit ?? 0);
+  // Packed icons come from the shared atlas (one request for the whole tree)
+  // unless they are shown larger than the sprite
+  const iconSprite = node.iconPath ? getIconSprite(node.iconPath, iconDisplaySize) : null;
+  const iconHref = node.iconPath && pixelsPerUnit ? getIconVariantSrc(node.iconPath, iconDisplaySize) : node.iconPath;
+  const iconSrc = iconSprite?.href ?? iconHref;
+  // Until the icon image arrives, the inlined thumbnail stands in for it
+  const [loadedIconSrc, setLoadedIconSrc] = useState<string | null>(null);
+  const iconLoaded = !!iconSrc && loadedIconSrc === iconSrc;
+  const iconPlaceholder = node.iconPath && !iconLoaded ? getIconPlaceholder(node.iconPath) : undefined;
+
+  // The server-rendered <image> can finish loading before hydration, when React
+  // misses its load event, so check the image (usually cached by then) directly
+  useEffect(() => {
+    if (!iconSrc) return;
+    let cancelled = false;
+    const img = new Image();
+    const markLoaded = () => {
+      if (!cancelled) setLoadedIconSrc(iconSrc);
+    };
+    img.onload = markLoaded;
+    img.src = iconSrc;
+    if (img.complete && img.naturalWidth > 0) markLoaded();
+    return () => {
+      cancelled = true;
+      img.onload = null;
+    };
+  }, [iconSrc]);
 
   // Calculate counter-rotation for portrait mode
   const getIconTransform = () => {
@@ -207,10 +240,52 @@ export default function SkillNodeComponent({
         className="pointer-events-auto"
       />
 
+      {/* Icon placeholder - recolored like the icon, so only its silhouette shows */}
+      {iconPlaceholder && (
+        <image
+          href={iconPlaceholder.thumb}
+          x={node.x - iconOffset}
+          y={node.y - iconOffset}
+          width={iconSize}
+          height={iconSize}
+          opacity={skillState === 'locked' ? 0.45 : 1}
+          filter={`url(#${filterId})`}
+          transform={iconTransform}
+          preserveAspectRatio="none"
+          style={{ pointerEvents: 'none' }}
+        />
+      )}
+
       {/* Icon overlay - displayed on top of node */}
-      {node.iconPath && (
+      {node.iconPath && iconSprite && (
+        <g
+          opacity={skillState === 'locked' ? 0.45 : 1}
+          filter={`url(#${filterId})`}
+          transform={iconTransform}
+          style={{ pointerEvents: 'none' }}
+        >
+          {/* The viewBox crops the atlas to this icon's sprite */}
+          <svg
+            x={node.x - iconOffset}
+            y={node.y - iconOffset}
+            width={iconSize}
+            height={iconSize}
+            viewBox={`${iconSprite.x} ${iconSprite.y} ${iconSprite.width} ${iconSprite.height}`}
+            overflow="hidden"
+          >
+            <image
+              href={iconSprite.href}
+              width={iconSprite.atlasWidth}
+              height={iconSprite.atlasHeight}
+              onLoad={() => setLoadedIconSrc(iconSrc ?? null)}
+              style={{ imageRendering: 'auto' }}
+            />
+          </svg>
+        </g>
+      )}
+      {node.iconPath && !iconSprite && (
         <image
-          href={node.iconPath}
+          href={iconHref}
           x={node.x - iconOffset}
           y={node.y - iconOffset}
           width={iconSize}
@@ -218,6 +293,7 @@ export default function SkillNodeComponent({
           opacity={skillState === 'locked' ? 0.45 : 1}
           filter={`url(#${filterId})`}
           transform={iconTransform}
+          onLoad={() => setLoadedIconSrc(iconSrc ?? null)}
           style={{
             pointerEvents: 'none',
             imageRendering: 'auto'
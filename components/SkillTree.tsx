@@ -5,6 +5,7 @@ import { motion, AnimatePresence } from 'framer-motion';
 import { useRouter } from 'next/navigation';
 import { useSkillTree } from '@/context/SkillContext';
 import { skillNodes, skillPaths } from '@/data/configLoader';
+import { containerShapes, lockShapes, lockIcon } from '@/data/overlayData';
 import { getSkillState, canAddPoint, canRemovePoint } from '@/data/skillLogic';
 import SkillNodeComponent from './SkillNode';
 import SkillTooltip from './SkillTooltip';
@@ -1833,6 +1834,9 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
   // Get effective nodes with overrides applied
   const effectiveNodes = getEffectiveNodes();
 
+  // Id lookup for the per-overlay helpers (one pass per render instead of a find per overlay)
+  const effectiveNodeById = new Map(effectiveNodes.map((node) => [node.id, node]));
+
   // Re-constrain pan when card height changes - adjust based on two conditions:
   // 1. Node under card: scroll UP to place node just above card
   // 2. Tree bottom above card: scroll DOWN to keep tree bottom at card line
@@ -2021,7 +2025,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
   // Helper to check if a container should be shown
   const shouldShowContainer = (nodeId: string) => {
     // Show container if node has maxPoints > 1 and is available or unlocked
-    const node = effectiveNodes.find((n) => n.id === nodeId);
+    const node = effectiveNodeById.get(nodeId);
     if (!node) return false;
 
     // Check tree visibility (includes portrait mode logic)
@@ -2043,7 +2047,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
 
   // Helper to get node color based on tree (always returns tree color)
   const getNodeColor = (nodeId: string) => {
-    const node = effectiveNodes.find((n) => n.id === nodeId);
+    const node = effectiveNodeById.get(nodeId);
     if (!node) return '#6c7074';
 
     // Always return the tree color
@@ -2062,7 +2066,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
     // Debug mode: show all locks if containers are shown
     if (showAllContainers) return true;
 
-    const node = effectiveNodes.find((n) => n.id === nodeId);
+    const node = effectiveNodeById.get(nodeId);
     if (!node) return false;
 
     // Check tree visibility (includes portrait mode logic)
@@ -2126,8 +2130,8 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
 
   // Helper to get node's transformed position in the container/lock coordinate space
   const getNodeTransformedPosition = (nodeId: string, tree: TreeType): { x: number; y: number } => {
-    const node = filteredNodes.find(n => n.id === nodeId);
-    if (!node) return { x: 0, y: 0 };
+    const node = effectiveNodeById.get(nodeId);
+    if (!node || !isTreeVisible(node.tree)) return { x: 0, y: 0 };
 
     switch (tree) {
       case 'A': {
@@ -3180,6 +3184,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
                       onClick={(e) => handleNodeClick(node.id, e)}
                       isMobilePortrait={isMobilePortrait}
                       portraitActiveTree={portraitActiveTree}
+                      pixelsPerUnit={baseScale * zoom}
                       onHover={(hover, e) => {
                         if (hover && e) {
                           const rect = (e.target as SVGElement).getBoundingClientRect();
@@ -3221,6 +3226,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
                       onClick={(e) => handleNodeClick(node.id, e)}
                       isMobilePortrait={isMobilePortrait}
                       portraitActiveTree={portraitActiveTree}
+                      pixelsPerUnit={baseScale * zoom}
                       onHover={(hover, e) => {
                         if (hover && e) {
                           const rect = (e.target as SVGElement).getBoundingClientRect();
@@ -3339,6 +3345,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
                       onClick={(e) => handleNodeClick(node.id, e)}
                       isMobilePortrait={isMobilePortrait}
                       portraitActiveTree={portraitActiveTree}
+                      pixelsPerUnit={baseScale * zoom}
                       onHover={(hover, e) => {
                         if (hover && e) {
                           const rect = (e.target as SVGElement).getBoundingClientRect();
@@ -3457,6 +3464,7 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
                       onClick={(e) => handleNodeClick(node.id, e)}
                       isMobilePortrait={isMobilePortrait}
                       portraitActiveTree={portraitActiveTree}
+                      pixelsPerUnit={baseScale * zoom}
                       onHover={(hover, e) => {
                         if (hover && e) {
                           const rect = (e.target as SVGElement).getBoundingClientRect();
@@ -3485,590 +3493,17 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
             style={{ pointerEvents: 'none', zIndex: 1001 }}
           >
             <g id="all-point-containers">
-              {shouldShowContainer('tree-a-node-0') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-0', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-0"
-                      d="m 312.79808,355.32718 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-0')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 2-1 */}
-              {shouldShowContainer('tree-a-node-2-1') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-2-1', 'A');
+              {/* @generated:begin point-containers */}
+              {containerShapes.map((shape) => {
+                if (!shouldShowContainer(shape.nodeId)) return null;
+                const pos = getNodeTransformedPosition(shape.nodeId, shape.tree);
                 return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-2-1"
-                      d="m 246.03285,355.06749 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-2-1')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
+                  <g key={shape.id} transform={getContainerTransform(shape.tree, pos.x, pos.y)}>
+                    <path id={shape.id} d={shape.d} fill="#090c19" stroke={getNodeColor(shape.nodeId)} strokeWidth="0.7" opacity="1" />
                   </g>
                 );
-              })()}
-              {/* Tree A container node 2-2 */}
-              {shouldShowContainer('tree-a-node-2-2') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-2-2', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-2-2"
-                      d="m 232.43824,375.05615 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-2-2')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 2-3 */}
-              {shouldShowContainer('tree-a-node-2-3') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-2-3', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-2-3"
-                      d="m 195.8418,388.60631 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-2-3')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 2-4 */}
-              {shouldShowContainer('tree-a-node-2-4') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-2-4', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-2-4"
-                      d="m 142.27429,378.57747 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-2-4')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 2-5 */}
-              {shouldShowContainer('tree-a-node-2-5') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-2-5', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-2-5"
-                      d="m 118.29196,376.93355 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-2-5')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 1-3 */}
-              {shouldShowContainer('tree-a-node-1-3') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-1-3', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-1-3"
-                      d="m 200.9525,325.45013 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-1-3')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 3-1 */}
-              {shouldShowContainer('tree-a-node-3-1') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-3-1', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-3-1"
-                      d="m 144.50095,347.26454 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-3-1')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 1-4 */}
-              {shouldShowContainer('tree-a-node-1-4') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-1-4', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-1-4"
-                      d="m 146.84125,315.62514 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-1-4')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 1-1 */}
-              {shouldShowContainer('tree-a-node-1-1') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-1-1', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-1-1"
-                      d="m 260.60424,324.39817 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-1-1')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 1-5 */}
-              {shouldShowContainer('tree-a-node-1-5') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-1-5', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-1-5"
-                      d="m 122.89979,313.47799 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-1-5')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 3-2 */}
-              {shouldShowContainer('tree-a-node-3-2') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-3-2', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-3-2"
-                      d="m 120.86118,345.21238 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-3-2')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 1-6 3-3 */}
-              {shouldShowContainer('tree-a-node-1-6-3-3') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-1-6-3-3', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-1-6-3-3"
-                      d="m 69.205264,315.59659 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-1-6-3-3')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 1-2 */}
-              {shouldShowContainer('tree-a-node-1-2') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-1-2', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-1-2"
-                      d="m 236.37767,322.68423 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-1-2')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree A container node 2-6 3-3 */}
-              {shouldShowContainer('tree-a-node-2-6-3-3') && (() => {
-                const pos = getNodeTransformedPosition('tree-a-node-2-6-3-3', 'A');
-                return (
-                  <g transform={getContainerTransform('A', pos.x, pos.y)}>
-                    <path
-                      id="container-a-2-6-3-3"
-                      d="m 63.954124,378.74926 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                      fill="#090c19"
-                      stroke={getNodeColor('tree-a-node-2-6-3-3')}
-                      strokeWidth="0.7"
-                      opacity="1"
-                    />
-                  </g>
-                );
-              })()}
-              {/* Tree B container node 0 */}
-              {shouldShowContainer('tree-b-node-0') && (() => { const pos = getNodeTransformedPosition('tree-b-node-0', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-0" d="m 341.58229,294.94427 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-0')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 1-1 */}
-              {shouldShowContainer('tree-b-node-1-1') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-1', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-1-1" d="m 283.75772,279.87217 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-1-1')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 1-2 */}
-              {shouldShowContainer('tree-b-node-1-2') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-2', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-1-2" d="m 262.81805,268.09611 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-1-2')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 2-1 */}
-              {shouldShowContainer('tree-b-node-2-1') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-1', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-2-1" d="m 289.07237,246.20217 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-2-1')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 2-2 */}
-              {shouldShowContainer('tree-b-node-2-2') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-2', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-2-2" d="m 289.42091,222.30439 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-2-2')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 2-3 */}
-              {shouldShowContainer('tree-b-node-2-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-3', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-2-3" d="m 263.59166,201.16109 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-2-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 1-3 */}
-              {shouldShowContainer('tree-b-node-1-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-3', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-1-3" d="m 231.70546,256.12849 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-1-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 3-1 */}
-              {shouldShowContainer('tree-b-node-3-1') && (() => { const pos = getNodeTransformedPosition('tree-b-node-3-1', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-3-1" d="m 201.13889,195.70248 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-3-1')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 2-4 */}
-              {shouldShowContainer('tree-b-node-2-4') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-4', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-2-4" d="m 216.79077,167.86576 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-2-4')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 2-5 */}
-              {shouldShowContainer('tree-b-node-2-5') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-5', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-2-5" d="m 196.10315,155.90176 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-2-5')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 3-2 */}
-              {shouldShowContainer('tree-b-node-3-2') && (() => { const pos = getNodeTransformedPosition('tree-b-node-3-2', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-3-2" d="m 180.38959,183.89809 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-3-2')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 1-5 */}
-              {shouldShowContainer('tree-b-node-1-5') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-5', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-1-5" d="m 164.20784,211.23139 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-1-5')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 1-6 3-3 */}
-              {shouldShowContainer('tree-b-node-1-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-6-3-3', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-1-6-3-3" d="m 117.87634,189.87252 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-1-6-3-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 2-6 3-3 */}
-              {shouldShowContainer('tree-b-node-2-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-6-3-3', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-2-6-3-3" d="m 149.44436,134.89921 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-2-6-3-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree B container node 1-4 */}
-              {shouldShowContainer('tree-b-node-1-4') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-4', 'B'); return (
-                <g transform={getContainerTransform('B', pos.x, pos.y)}>
-                  <path id="container-b-1-4" d="m 185.14524,223.04544 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-b-node-1-4')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree C container node 0 */}
-              {shouldShowContainer('tree-c-node-0') && (
-                <path
-                  id="container-c-0"
-                  d="m 379.2802,274.00862 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-0')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 2-1 */}
-              {shouldShowContainer('tree-c-node-2-1') && (
-                <path
-                  id="container-c-2-1"
-                  d="m 421.72792,222.75379 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-2-1')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 2-2 */}
-              {shouldShowContainer('tree-c-node-2-2') && (
-                <path
-                  id="container-c-2-2"
-                  d="m 421.76623,200.20684 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-2-2')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 1-1 */}
-              {shouldShowContainer('tree-c-node-1-1') && (
-                <path
-                  id="container-c-1-1"
-                  d="m 336.90689,223.15684 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-1-1')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 1-3 */}
-              {shouldShowContainer('tree-c-node-1-3') && (
-                <path
-                  id="container-c-1-3"
-                  d="m 358.50838,183.64446 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-1-3')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 2-3 */}
-              {shouldShowContainer('tree-c-node-2-3') && (
-                <path
-                  id="container-c-2-3"
-                  d="m 400.52994,183.92975 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-2-3')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 2-6 3-3 */}
-              {shouldShowContainer('tree-c-node-2-6-3-3') && (
-                <path
-                  id="container-c-2-6-3-3"
-                  d="m 400.4042,70.553613 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-2-6-3-3')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 1-6 3-3 */}
-              {shouldShowContainer('tree-c-node-1-6-3-3') && (
-                <path
-                  id="container-c-1-6-3-3"
-                  d="m 358.57252,70.07087 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-1-6-3-3')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 1-5 */}
-              {shouldShowContainer('tree-c-node-1-5') && (
-                <path
-                  id="container-c-1-5"
-                  d="m 336.93804,109.77631 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-1-5')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 1-4 */}
-              {shouldShowContainer('tree-c-node-1-4') && (
-                <path
-                  id="container-c-1-4"
-                  d="m 336.72948,132.63913 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-1-4')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 3-2 */}
-              {shouldShowContainer('tree-c-node-3-2') && (
-                <path
-                  id="container-c-3-2"
-                  d="m 379.23155,110.13207 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-3-2')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 3-1 */}
-              {shouldShowContainer('tree-c-node-3-1') && (
-                <path
-                  id="container-c-3-1"
-                  d="m 379.42786,132.93581 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-3-1')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 2-4 */}
-              {shouldShowContainer('tree-c-node-2-4') && (
-                <path
-                  id="container-c-2-4"
-                  d="m 421.84324,132.66155 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-2-4')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 2-5 */}
-              {shouldShowContainer('tree-c-node-2-5') && (
-                <path
-                  id="container-c-2-5"
-                  d="m 421.84553,110.17747 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-2-5')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree C container node 1-2 */}
-              {shouldShowContainer('tree-c-node-1-2') && (
-                <path
-                  id="container-c-1-2"
-                  d="m 337.18076,200.17247 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z"
-                  fill="#090c19"
-                  stroke={getNodeColor('tree-c-node-1-2')}
-                  strokeWidth="0.7"
-                  opacity="1"
-                />
-              )}
-              {/* Tree D container node 0 */}
-              {shouldShowContainer('tree-d-node-0') && (() => { const pos = getNodeTransformedPosition('tree-d-node-0', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-0" d="m 433.14292,303.97127 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-0')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 1-1 */}
-              {shouldShowContainer('tree-d-node-1-1') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-1', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-1-1" d="m 490.36254,289.22477 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-1-1')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 1-2 */}
-              {shouldShowContainer('tree-d-node-1-2') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-2', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-1-2" d="m 511.47468,277.73166 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-1-2')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 1-3 */}
-              {shouldShowContainer('tree-d-node-1-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-3', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-1-3" d="m 542.58364,265.6915 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-1-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 2-1 */}
-              {shouldShowContainer('tree-d-node-2-1') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-1', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-2-1" d="m 484.69802,256.20866 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-2-1')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 2-2 */}
-              {shouldShowContainer('tree-d-node-2-2') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-2', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-2-2" d="m 484.79936,231.61201 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-2-2')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 2-4 */}
-              {shouldShowContainer('tree-d-node-2-4') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-4', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-2-4" d="m 557.11276,177.25914 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-2-4')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 2-3 */}
-              {shouldShowContainer('tree-d-node-2-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-3', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-2-3" d="m 510.27865,210.11988 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-2-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 1-4 */}
-              {shouldShowContainer('tree-d-node-1-4') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-4', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-1-4" d="m 589.10304,233.07716 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-1-4')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 1-5 */}
-              {shouldShowContainer('tree-d-node-1-5') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-5', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-1-5" d="m 609.60112,220.78385 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-1-5')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 3-1 */}
-              {shouldShowContainer('tree-d-node-3-1') && (() => { const pos = getNodeTransformedPosition('tree-d-node-3-1', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-3-1" d="m 573.20733,205.55815 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-3-1')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 2-5 */}
-              {shouldShowContainer('tree-d-node-2-5') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-5', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-2-5" d="m 578.06897,165.47027 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-2-5')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 3-2 */}
-              {shouldShowContainer('tree-d-node-3-2') && (() => { const pos = getNodeTransformedPosition('tree-d-node-3-2', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-3-2" d="m 593.78347,193.02282 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-3-2')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 1-6 3-3 */}
-              {shouldShowContainer('tree-d-node-1-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-6-3-3', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-1-6-3-3" d="m 656.454,198.93673 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-1-6-3-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
-              {/* Tree D container node 2-6 3-3 */}
-              {shouldShowContainer('tree-d-node-2-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-6-3-3', 'D'); return (
-                <g transform={getContainerTransform('D', pos.x, pos.y)}>
-                  <path id="container-d-2-6-3-3" d="m 625.03868,144.48747 c 0,0 3.15923,0.0973 3.58841,1.4e-4 0.42919,-0.0972 3.09232,-0.76068 3.10885,-3.70417 0.0164,-2.94349 -2.497,-4.00183 -3.27421,-4.01836 -0.77722,-0.0164 -7.24297,-0.0332 -7.24297,-0.0332 0,0 -2.97657,0.46302 -3.00964,3.93568 -0.0331,3.47266 3.09232,3.75378 3.09232,3.75378 z" fill="#090c19" stroke={getNodeColor('tree-d-node-2-6-3-3')} strokeWidth="0.7" opacity="1" />
-                </g>
-              ); })()}
+              })}
+              {/* @generated:end point-containers */}
             </g>
           </svg>
 
@@ -4083,324 +3518,34 @@ export default function SkillTree({ mode = 'current' }: SkillTreeProps = {}) {
             {/* All Lock icons - 16 total across all trees */}
             {/* Only show locks for gated/locked nodes */}
             <g id="all-lock-icons">
-              {/* Tree A lock 2-3 */}
-              {shouldShowLock('tree-a-node-2-3') && (() => { const pos = getNodeTransformedPosition('tree-a-node-2-3', 'A'); return (
-                <g id="lock-a-2-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('A', -34.969545, 133.64048, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-a-node-2-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-a-node-2-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-79"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-5"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-5" /></g>
-              ); })()}
-              {/* Tree A lock 1-3 */}
-              {shouldShowLock('tree-a-node-1-3') && (() => { const pos = getNodeTransformedPosition('tree-a-node-1-3', 'A'); return (
-                <g id="lock-a-1-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('A', -31.389998, 69.838135, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-a-node-1-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-a-node-1-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-79-1"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-5-6"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-5-3" /></g>
-              ); })()}
-              {/* Tree A lock 2-6 3-3 */}
-              {shouldShowLock('tree-a-node-2-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-a-node-2-6-3-3', 'A'); return (
-                <g id="lock-a-2-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('A', -167.63311, 124.05908, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-a-node-2-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-a-node-2-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-79-1-3"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-5-6-0"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-5-3-7" /></g>
-              ); })()}
-              {/* Tree A lock 1-6 3-3 */}
-              {shouldShowLock('tree-a-node-1-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-a-node-1-6-3-3', 'A'); return (
-                <g id="lock-a-1-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('A', -161.7236, 60.537817, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-a-node-1-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-a-node-1-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-79-1-3-9"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-5-6-0-8"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-5-3-7-5" /></g>
-              ); })()}
-              {/* Tree B lock 1-3 */}
-              {shouldShowLock('tree-b-node-1-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-3', 'B'); return (
-                <g id="lock-b-1-3" transform={getLockTransform('B', 0, 0, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-b-node-1-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-b-node-1-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104" /></g>
-              ); })()}
-              {/* Tree B lock 2-3 */}
-              {shouldShowLock('tree-b-node-2-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-3', 'B'); return (
-                <g id="lock-b-2-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('B', 31.600865, -55.033637, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-b-node-2-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-b-node-2-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3" /></g>
-              ); })()}
-              {/* Tree B lock 2-6 3-3 */}
-              {shouldShowLock('tree-b-node-2-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-2-6-3-3', 'B'); return (
-                <g id="lock-b-2-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('B', -82.302265, -121.31177, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-b-node-2-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-b-node-2-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8" /></g>
-              ); })()}
-              {/* Tree B lock 1-6 3-3 */}
-              {shouldShowLock('tree-b-node-1-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-b-node-1-6-3-3', 'B'); return (
-                <g id="lock-b-1-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('B', -114.31685, -66.013845, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-b-node-1-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-b-node-1-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0" /></g>
-              ); })()}
-              {/* Tree C lock 1-3 */}
-              {shouldShowLock('tree-c-node-1-3') && (() => { const pos = getNodeTransformedPosition('tree-c-node-1-3', 'C'); return (
-                <g id="lock-c-1-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('C', 125.9873, -72.424544, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-c-node-1-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-c-node-1-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5" /></g>
-              ); })()}
-              {/* Tree C lock 2-3 */}
-              {shouldShowLock('tree-c-node-2-3') && (() => { const pos = getNodeTransformedPosition('tree-c-node-2-3', 'C'); return (
-                <g id="lock-c-2-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('C', 168.35671, -71.930312, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-c-node-2-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-c-node-2-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-5"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-4"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-7" /></g>
-              ); })()}
-              {/* Tree C lock 1-6 3-3 */}
-              {shouldShowLock('tree-c-node-1-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-c-node-1-6-3-3', 'C'); return (
-                <g id="lock-c-1-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('C', 126.31228, -184.59419, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-c-node-1-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-c-node-1-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-7"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-2"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-5" /></g>
-              ); })()}
-              {/* Tree C lock 2-6 3-3 */}
-              {shouldShowLock('tree-c-node-2-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-c-node-2-6-3-3', 'C'); return (
-                <g id="lock-c-2-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('C', 168.75428, -185.34576, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-c-node-2-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-c-node-2-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-7-9"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-2-5"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-5-7" /></g>
-              ); })()}
-              {/* Tree D lock 2-3 */}
-              {shouldShowLock('tree-d-node-2-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-3', 'D'); return (
-                <g id="lock-d-2-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('D', 279.08136, -44.725905, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-d-node-2-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-d-node-2-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-7-2"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-2-1"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-5-0" /></g>
-              ); })()}
-              {/* Tree D lock 1-3 */}
-              {shouldShowLock('tree-d-node-1-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-3', 'D'); return (
-                <g id="lock-d-1-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('D', 311.52653, 11.301172, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-d-node-1-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-d-node-1-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-7-2-6"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-2-1-6"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-5-0-8" /></g>
-              ); })()}
-              {/* Tree D lock 1-6 3-3 */}
-              {shouldShowLock('tree-d-node-1-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-1-6-3-3', 'D'); return (
-                <g id="lock-d-1-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('D', 424.15886, -55.877901, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-d-node-1-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-d-node-1-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-7-2-7"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-2-1-0"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-5-0-2" /></g>
-              ); })()}
-              {/* Tree D lock 2-6 3-3 */}
-              {shouldShowLock('tree-d-node-2-6-3-3') && (() => { const pos = getNodeTransformedPosition('tree-d-node-2-6-3-3', 'D'); return (
-                <g id="lock-d-2-6 3-3"
-                         style={{ display: "inline" }}
-                         transform={getLockTransform('D', 392.78359, -111.11846, pos.x, pos.y)}><ellipse
-                           style={{ opacity: 1, mixBlendMode: "normal", fill: getLockColor('tree-d-node-2-6-3-3'), fillOpacity: 1, fillRule: "nonzero", stroke: getLockColor('tree-d-node-2-6-3-3'), strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
-                           id="path103-8-9-7-6-7-2-7-5"
-                           cx="221.57201"
-                           cy="247.53424"
-                           rx="5.3743491"
-                           ry="5.1593747" /><rect
-                           style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
-                           id="rect103-9-6-1-8-2-1-0-6"
-                           width="4.8520966"
-                           height="3.1253905"
-                           x="219.17422"
-                           y="247.36888"
-                           ry="0.14882609"
-                           rx="0.14882812" /><path style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }} d="m 220.41445,246.50898 c 0,0 -0.1819,-1.83555 1.20716,-1.81901 1.38906,0.0165 1.20716,1.81901 1.20716,1.81901" id="path104-3-8-0-5-5-0-2-1" /></g>
-              ); })()}
+              {/* @generated:begin lock-icons */}
+              {lockShapes.map((lock) => {
+                if (!shouldShowLock(lock.nodeId)) return null;
+                const pos = getNodeTransformedPosition(lock.nodeId, lock.tree);
+                const color = getLockColor(lock.nodeId);
+                return (
+                  <g
+                    key={lock.id}
+                    id={lock.id}
+                    style={{ display: "inline" }}
+                    transform={getLockTransform(lock.tree, lock.translateX, lock.translateY, pos.x, pos.y)}
+                  >
+                    <ellipse
+                      style={{ opacity: 1, mixBlendMode: "normal", fill: color, fillOpacity: 1, fillRule: "nonzero", stroke: color, strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
+                      {...lockIcon.ellipse}
+                    />
+                    <rect
+                      style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
+                      {...lockIcon.rect}
+                    />
+                    <path
+                      style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }}
+                      d={lock.d}
+                    />
+                  </g>
+                );
+              })}
+              {/* @generated:end lock-icons */}
             </g>
           </svg>
 
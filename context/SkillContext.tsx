@@ -5,7 +5,7 @@ import { usePathname } from 'next/navigation';
 import { SkillAction, SkillTreeState, TreeType } from '@/types/skills';
 import { updateUrlWithSkills, getSkillPointsFromUrl, encodeSkillPointsToUrl } from '@/utils/urlEncoder';
 import { skillNodes, getMaxSkillPoints as getDefaultMaxSkillPoints } from '@/data/configLoader';
-import { canRemovePoint } from '@/data/skillLogic';
+import { canRemovePoint, clearInvalidatedSkills } from '@/data/skillLogic';
 
 interface SkillContextType {
   state: SkillTreeState;
@@ -86,6 +86,8 @@ function createSkillReducer(maxSkillPointsRef: { current: number }) {
 
         if (clampedPoints === 0) {
           newSkillPoints.delete(action.skillId);
+          // Setting points skips the removal checks, so drop the skills left without prerequisites
+          clearInvalidatedSkills(action.skillId, newSkillPoints, skillNodes);
         } else {
           newSkillPoints.set(action.skillId, clampedPoints);
         }
@@ -0,0 +1,15 @@
+import iconPlaceholdersJson from './iconPlaceholders.json';
+
+// Generated by scripts/process_icons.py from the processed icons in public/icons
+
+export interface IconPlaceholder {
+  thumb: string; // 8x8 PNG data URI, drawn stretched while the icon loads
+  color: string | null; // Dominant color ('#rrggbb'), null for blank icons
+}
+
+const iconPlaceholders = iconPlaceholdersJson as Record<string, IconPlaceholder>;
+
+// Placeholder of an icon path ("/icons/skill_icon_1.png"), if it has one
+export function getIconPlaceholder(iconPath: string): IconPlaceholder | undefined {
+  return iconPlaceholders[iconPath];
+}
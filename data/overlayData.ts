@@ -0,0 +1,44 @@
+import overlayDataJson from './overlayData.json';
+import { TreeType } from '@/types/skills';
+
+// Generated by scripts/overlay_data.py from assets/ArcRaidersTree.svg
+
+export type OverlayKind = 'container' | 'lock';
+
+export interface OverlayShape {
+  nodeId: string; // Skill node the overlay belongs to, e.g. "tree-a-node-2-3"
+  tree: TreeType;
+  kind: OverlayKind;
+  id: string; // DOM id, e.g. "container-a-2-3" or "lock-a-2-3"
+  d: string; // Container outline, or the lock shackle in lock-local units
+  textX: number; // Point number anchor (containers) or icon center (locks)
+  textY: number;
+}
+
+export interface LockShape extends OverlayShape {
+  kind: 'lock';
+  translateX: number; // Lock group translation from the SVG
+  translateY: number;
+}
+
+export interface LockIconGeometry {
+  ellipse: { cx: number; cy: number; rx: number; ry: number };
+  rect: { x: number; y: number; width: number; height: number; rx: number; ry: number };
+}
+
+interface OverlayData {
+  lockIcon: LockIconGeometry;
+  shapes: OverlayShape[];
+}
+
+const overlayData = overlayDataJson as OverlayData;
+
+export const lockIcon: LockIconGeometry = overlayData.lockIcon;
+
+export const overlayShapes: OverlayShape[] = overlayData.shapes;
+
+export const containerShapes: OverlayShape[] = overlayShapes.filter((shape) => shape.kind === 'container');
+
+export const lockShapes: LockShape[] = overlayShapes.filter(
+  (shape): shape is LockShape => shape.kind === 'lock'
+);
@@ -0,0 +1,37 @@
+import skillIndexJson from './skillIndex.json';
+import { TreeType } from '@/types/skills';
+
+// Generated by scripts/skill_index.py from data/config/skillTreeConfig.json
+
+interface SkillIndex {
+  ids: string[]; // Node ids in config order; every list below holds positions in it
+  indexOf: Record<string, number>;
+  trees: Record<TreeType, number[]>;
+  prerequisites: number[][][]; // Alternative groups per node, each fully required
+  dependents: number[][]; // Nodes listing this one as a prerequisite
+  ancestors: number[][]; // Transitive prerequisites
+  cascade: number[][]; // Transitive dependents, prerequisites first, rechecked when a node is emptied
+  order: number[]; // Prerequisites before dependents
+}
+
+export const skillIndex = skillIndexJson as SkillIndex;
+
+const toIds = (indices: number[]): string[] => indices.map((i) => skillIndex.ids[i]);
+
+// Ids of the nodes listing a skill as a direct prerequisite, undefined for unknown skills
+export function getDependentIds(skillId: string): string[] | undefined {
+  const i = skillIndex.indexOf[skillId];
+  return i === undefined ? undefined : toIds(skillIndex.dependents[i]);
+}
+
+// Ids of every transitive prerequisite of a skill, undefined for unknown skills
+export function getAncestorIds(skillId: string): string[] | undefined {
+  const i = skillIndex.indexOf[skillId];
+  return i === undefined ? undefined : toIds(skillIndex.ancestors[i]);
+}
+
+// Ids of every skill that may become invalid when a skill is emptied, prerequisites first
+export function getCascadeIds(skillId: string): string[] {
+  const i = skillIndex.indexOf[skillId];
+  return i === undefined ? [] : toIds(skillIndex.cascade[i]);
+}
@@ -4,6 +4,20 @@
  */
 
 import { SkillNode, TreeType } from '@/types/skills';
+import { getAncestorIds, getCascadeIds, getDependentIds } from '@/data/skillIndex';
+
+// id -> node map per node array, so lookups don't scan the list. The arrays
+// passed in are rebuilt when overrides change, which drops their entry.
+const nodeMaps = new WeakMap<SkillNode[], Map<string, SkillNode>>();
+
+function getNodeMap(skillNodes: SkillNode[]): Map<string, SkillNode> {
+  let nodeMap = nodeMaps.get(skillNodes);
+  if (!nodeMap) {
+    nodeMap = new Map(skillNodes.map((node) => [node.id, node]));
+    nodeMaps.set(skillNodes, nodeMap);
+  }
+  return nodeMap;
+}
 
 /**
  * Get skill state based on current point allocation and prerequisites
@@ -52,9 +66,9 @@ export function getSkillState(
   }
 
   // Helper to check if a prerequisite is met
+  const nodeMap = getNodeMap(skillNodes);
   const isPrereqMet = (prereqId: string): boolean => {
-    const prereqNode = skillNodes.find(n => n.id === prereqId);
-    if (!prereqNode) return false;
+    if (!nodeMap.has(prereqId)) return false;
 
     // All prerequisites must have points allocated to be met
     return (skillPoints.get(prereqId) || 0) > 0;
@@ -125,7 +139,8 @@ export function canRemovePoint(
   }
 
   // Even if skill will have points after removal, check if removing one point would break tree requirements
-  const skillToRemove = skillNodes.find((node) => node.id === skillId);
+  const nodeMap = getNodeMap(skillNodes);
+  const skillToRemove = nodeMap.get(skillId);
   if (!skillToRemove) return false;
 
   const skillToRemoveRequirement = skillToRemove.pointsRequiredInTree ?? 0;
@@ -139,7 +154,7 @@ export function canRemovePoint(
   for (const [allocatedSkillId, points] of skillPoints) {
     if (allocatedSkillId === skillId || points === 0) continue;
 
-    const allocatedSkill = skillNodes.find((node) => node.id === allocatedSkillId);
+    const allocatedSkill = nodeMap.get(allocatedSkillId);
     if (!allocatedSkill || allocatedSkill.tree !== skillToRemove.tree) continue;
 
     const gateRequirement = allocatedSkill.pointsRequiredInTree ?? 0;
@@ -178,7 +193,8 @@ function canFullyRemoveSkill(
   skillPoints: Map<string, number>,
   skillNodes: SkillNode[]
 ): boolean {
-  const skillToRemove = skillNodes.find((node) => node.id === skillId);
+  const nodeMap = getNodeMap(skillNodes);
+  const skillToRemove = nodeMap.get(skillId);
   if (!skillToRemove) return false;
 
   const pointsToRemove = skillPoints.get(skillId) || 0;
@@ -194,7 +210,7 @@ function canFullyRemoveSkill(
   for (const [allocatedSkillId, points] of skillPoints) {
     if (allocatedSkillId === skillId || points === 0) continue;
 
-    const allocatedSkill = skillNodes.find((node) => node.id === allocatedSkillId);
+    const allocatedSkill = nodeMap.get(allocatedSkillId);
     if (!allocatedSkill || allocatedSkill.tree !== skillToRemove.tree) continue;
 
     const gateRequirement = allocatedSkill.pointsRequiredInTree ?? 0;
@@ -222,11 +238,14 @@ function canFullyRemoveSkill(
     }
   }
 
-  // Check all skills with points to see if any would become invalid due to prerequisites
-  for (const [allocatedSkillId, points] of skillPoints) {
+  // Check the allocated skills listing this one as a prerequisite (all allocated
+  // skills if the index doesn't know it) to see if any would become invalid
+  const candidateIds = getDependentIds(skillId) ?? Array.from(skillPoints.keys());
+  for (const allocatedSkillId of candidateIds) {
+    const points = skillPoints.get(allocatedSkillId) || 0;
     if (allocatedSkillId === skillId || points === 0) continue;
 
-    const dependentSkill = skillNodes.find((node) => node.id === allocatedSkillId);
+    const dependentSkill = nodeMap.get(allocatedSkillId);
     if (!dependentSkill) continue;
 
     // Check if this skill depends on the one we want to remove
@@ -273,6 +292,36 @@ function checkSkillDependsOn(
   }
 }
 
+/**
+ * Remove the allocations that lose their prerequisites once a skill is emptied
+ * (for changes that bypass canRemovePoint, like setting a skill to 0 points)
+ * @param skillPoints - Point map without the emptied skill, updated in place
+ */
+export function clearInvalidatedSkills(
+  skillId: string,
+  skillPoints: Map<string, number>,
+  skillNodes: SkillNode[]
+): void {
+  const nodeMap = getNodeMap(skillNodes);
+  const isAllocated = (prereqId: string) => (skillPoints.get(prereqId) || 0) > 0;
+
+  // The cascade lists prerequisites before their dependents, so one pass settles it
+  for (const dependentId of getCascadeIds(skillId)) {
+    const dependent = nodeMap.get(dependentId);
+    if (!dependent || !isAllocated(dependentId)) continue;
+
+    const prerequisites = dependent.prerequisites;
+    if (prerequisites.length === 0) continue;
+
+    const prerequisitesMet = Array.isArray(prerequisites[0])
+      ? (prerequisites as string[][]).some((group) => group.every(isAllocated))
+      : (prerequisites as string[]).every(isAllocated);
+    if (!prerequisitesMet) {
+      skillPoints.delete(dependentId);
+    }
+  }
+}
+
 /**
  * Calculate total points allocated in a specific tree
  */
@@ -281,9 +330,10 @@ export function calculateTreePoints(
   skillPoints: Map<string, number>,
   skillNodes: SkillNode[]
 ): number {
+  const nodeMap = getNodeMap(skillNodes);
   let total = 0;
   skillPoints.forEach((points, skillId) => {
-    const node = skillNodes.find((n) => n.id === skillId);
+    const node = nodeMap.get(skillId);
     if (node && node.tree === treeId) {
       total += points;
     }
@@ -303,9 +353,10 @@ function calculatePointsBeforeGate(
   skillPoints: Map<string, number>,
   skillNodes: SkillNode[]
 ): number {
+  const nodeMap = getNodeMap(skillNodes);
   let total = 0;
   skillPoints.forEach((points, skillId) => {
-    const node = skillNodes.find((n) => n.id === skillId);
+    const node = nodeMap.get(skillId);
     if (node && node.tree === treeId) {
       const nodeRequirement = node.pointsRequiredInTree ?? 0;
 
@@ -338,6 +389,14 @@ function hasPrerequisiteAtOrAboveGate(
     return false;
   }
 
+  const nodeMap = getNodeMap(skillNodes);
+
+  // Every transitive prerequisite is precomputed in the skill index
+  const ancestorIds = getAncestorIds(skill.id);
+  if (ancestorIds) {
+    return ancestorIds.some((ancestorId) => (nodeMap.get(ancestorId)?.pointsRequiredInTree ?? 0) >= gateRequirement);
+  }
+
   // Flatten prerequisites (handle both OR and AND logic)
   const prereqIds: string[] = Array.isArray(prerequisites[0])
     ? (prerequisites as string[][]).flat()
@@ -345,7 +404,7 @@ function hasPrerequisiteAtOrAboveGate(
 
   // Check each prerequisite
   for (const prereqId of prereqIds) {
-    const prereqNode = skillNodes.find((n) => n.id === prereqId);
+    const prereqNode = nodeMap.get(prereqId);
     if (!prereqNode) continue;
 
     const prereqRequirement = prereqNode.pointsRequiredInTree ?? 0;
@@ -371,6 +430,12 @@ export function getDependentSkills(
   skillId: string,
   skillNodes: SkillNode[]
 ): SkillNode[] {
+  const dependentIds = getDependentIds(skillId);
+  if (dependentIds) {
+    const nodeMap = getNodeMap(skillNodes);
+    return dependentIds.flatMap((dependentId) => nodeMap.get(dependentId) ?? []);
+  }
+
   return skillNodes.filter((node) => {
     const prerequisites = node.prerequisites;
 
@@ -396,9 +461,10 @@ export function validateSkillAllocation(
   skillNodes: SkillNode[]
 ): string[] {
   const errors: string[] = [];
+  const nodeMap = getNodeMap(skillNodes);
 
   skillPoints.forEach((points, skillId) => {
-    const node = skillNodes.find((n) => n.id === skillId);
+    const node = nodeMap.get(skillId);
 
     if (!node) {
       errors.push(`Unknown skill ID: ${skillId}`);
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the SVG processing tools in scripts/.
+
+Commands run in-process, in the order given, and share one lazily loaded
+SVG index, label table and skill tree config, so chaining them parses the
+SVG (or reads its cache) once:
+
+    python -m scripts extract-paths extract-locks bbox
+    python -m scripts check
+    python -m scripts icons --icons-dir public/icons
+    python -m scripts check watch
+
+Run it from the repository root, or as `python path/to/scripts <command>`
+from anywhere: every path is resolved from the repository root. NumPy and
+PIL are only imported by the commands that need them (bbox, point-numbers,
+match-containers, icons and the path binary part of check); extract-paths
+and extract-locks are pure Python.
+"""
+
+import argparse
+import json
+import sys
+import time
+from functools import cached_property
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+
+# The tools import each other as top-level modules
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+class Context:
+    """State shared by the commands of one invocation, loaded on first use."""
+
+    def __init__(self, args):
+        self.args = args
+
+    @cached_property
+    def index(self):
+        from svg_index import load_index
+        return load_index()
+
+    @cached_property
+    def labels(self):
+        from svg_labels import load_labels
+        return load_labels(self.index)
+
+    @cached_property
+    def config(self):
+        from skill_config import load_config
+        return load_config()
+
+
+def extract_paths(ctx):
+    """Write scripts/pathDataWithLabels.json (every labeled path)."""
+    import extractPathDataWithLabels
+    extractPathDataWithLabels.main(ctx.index)
+
+
+def extract_locks(ctx):
+    """Write scripts/locks_output.txt (lock icon JSX)."""
+    import extractLocksToJsx
+    extractLocksToJsx.main(ctx.index)
+
+
+def match_containers(ctx):
+    """Write scripts/container_mapping.json (containers matched to nodes)."""
+    import matchContainersWithTransform
+    matchContainersWithTransform.main(ctx.labels, ctx.config)
+
+
+def bbox(ctx):
+    """Write public/boundingBoxes.json (tree boxes and viewports)."""
+    import extractBoundingBoxes
+    extractBoundingBoxes.main(ctx.labels)
+
+
+def point_numbers(ctx):
+    """Print the point number JSX for multi-point containers."""
+    import generatePointNumbers
+    generatePointNumbers.main(ctx.labels, ctx.config)
+
+
+def icons(ctx):
+    """Process new or changed icons from assets/icons (or --icons-dir) into public/icons."""
+    import process_icons
+    if process_icons.process_all(ctx.args.icons_dir or process_icons.SOURCE_DIR):
+        return 1
+
+
+def watch(ctx):
+    """Patch generated data whenever the SVG or config is saved (Ctrl+C stops)."""
+    import watch as watcher
+    watcher.watch()
+
+
+def check(ctx):
+    """Fail if generated data no longer matches the SVG and config."""
+    import overlay_data
+    import path_binary
+    import skill_index
+    from skill_tree_regions import GENERATORS
+    from svg_transforms import to_string, tree_matrix_mismatches
+    from tsx_edit import SKILL_TREE_TSX, find_regions, read_text, render_regions
+
+    problems = []
+
+    for tree, matrix, config_matrix in tree_matrix_mismatches(ctx.index, ctx.config):
+        problems.append(f"Tree {tree} transform is {to_string(matrix)} in the SVG but "
+                        f"{to_string(config_matrix) if config_matrix else 'missing'} in the config")
+
+    overlay_path = overlay_data.OUTPUT_PATH
+    current = overlay_path.read_text(encoding='utf-8') if overlay_path.exists() else ''
+    if current != overlay_data.render(overlay_data.build(ctx.index)):
+        problems.append(f"{overlay_path.name} is out of date (python scripts/overlay_data.py)")
+
+    index_path = skill_index.OUTPUT_PATH
+    current = index_path.read_text(encoding='utf-8') if index_path.exists() else ''
+    if current != skill_index.render(skill_index.build(ctx.config)):
+        problems.append(f"{index_path.name} is out of date (python scripts/skill_index.py)")
+
+    text = read_text(SKILL_TREE_TSX)
+    present = [name for name in find_regions(text) if name in GENERATORS]
+    _, stale = render_regions(text, {name: GENERATORS[name]() for name in present})
+    for name in stale:
+        problems.append(f"{SKILL_TREE_TSX.name} region {name!r} is out of date "
+                        "(python scripts/skill_tree_regions.py)")
+
+    with open(path_binary.SOURCE_PATH, encoding='utf-8') as f:
+        path_data = json.load(f)
+    if path_binary.OUTPUT_PATH.exists():
+        binary_problems, _, _ = path_binary.verify(path_data, path_binary.OUTPUT_PATH.read_bytes())
+        problems.extend(f"{path_binary.OUTPUT_PATH.name}: {problem}" for problem in binary_problems)
+    else:
+        problems.append(f"{path_binary.OUTPUT_PATH.name} is missing (python scripts/path_binary.py)")
+
+    for problem in problems:
+        print(f"ERROR: {problem}", file=sys.stderr)
+    if problems:
+        return 1
+    print("✓ Transforms, overlay data, skill index, SkillTree.tsx regions and path binary are up to date")
+
+
+COMMANDS = {
+    'extract-paths': extract_paths,
+    'extract-locks': extract_locks,
+    'match-containers': match_containers,
+    'bbox': bbox,
+    'point-numbers': point_numbers,
+    'icons': icons,
+    'check': check,
+    'watch': watch,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m scripts',
+        description='Run SVG processing commands in one process, sharing the loaded SVG and config',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='commands:\n' + '\n'.join(f'  {name:<18}{command.__doc__}' for name, command in COMMANDS.items()))
+    parser.add_argument('commands', nargs='+', choices=COMMANDS, metavar='command',
+                        help='one or more commands, run in order')
+    parser.add_argument('--icons-dir', type=Path, help='icon source directory for the icons command')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print the time taken by each command')
+    args = parser.parse_args(argv)
+
+    ctx = Context(args)
+    for name in args.commands:
+        started = time.perf_counter()
+        status = COMMANDS[name](ctx)
+        if args.verbose:
+            print(f"[{name}] {time.perf_counter() - started:.2f}s", file=sys.stderr)
+        if status:
+            return status
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,47 +3,34 @@
 Analyze container positions relative to nodes to find the correct offset
 """
 
-import re
 import json
+from pathlib import Path
 
-# Read the SkillTree.tsx file
-with open('skill-tree-planner/components/SkillTree.tsx', 'r') as f:
-    tsx_content = f.read()
+from skill_config import load_config
+from svg_transforms import apply, tree_matrices
 
 # Load node data
-with open('skill-tree-planner/data/config/skillTreeConfig.json', 'r') as f:
-    config = json.load(f)
+config = load_config()
 
 # Load calculated container centers
-with open('skill-tree-planner/scripts/container_centers.json', 'r') as f:
+with open(Path(__file__).parent / 'container_centers.json', 'r') as f:
     container_centers = json.load(f)
 
-# Transformations for each tree
-transformations = {
-    'A': {'type': 'matrix', 'a': 0.82544171, 'b': 0.56448736, 'c': 0.56221371, 'd': -0.82211698, 'e': 81.266847, 'f': 463.85256},
-    'B': {'type': 'translate', 'tx': 221.93716, 'ty': 39.335736},
-    'C': {'type': 'translate', 'tx': 221.93716, 'ty': 39.335736},
-    'D': {'type': 'matrix', 'a': -1, 'b': 0, 'c': 0, 'd': 1, 'e': 552.10903, 'f': 48.512262},
-}
+# Transformations for each tree, read from the SVG tree layers
+transformations = tree_matrices()
+
 
 def apply_transform(x, y, tree):
     """Apply the appropriate transformation to node coordinates"""
-    t = transformations[tree]
-    if t['type'] == 'translate':
-        return x + t['tx'], y + t['ty']
-    else:  # matrix
-        new_x = t['a'] * x + t['c'] * y + t['e']
-        new_y = t['b'] * x + t['d'] * y + t['f']
-        return new_x, new_y
+    new_x, new_y = apply(transformations[tree], (x, y))[0]
+    return float(new_x), float(new_y)
 
 # Analyze offsets for each tree
 print("Container position analysis:\n")
 
 for tree_letter in ['A', 'B', 'C', 'D']:
-    tree_nodes = config['trees'][tree_letter]['nodes']
-
-    # Filter nodes with maxPoints > 1
-    multi_point_nodes = [n for n in tree_nodes if n.get('maxPoints', 1) > 1]
+    # Nodes with maxPoints > 1
+    multi_point_nodes = config.trees[tree_letter].multi_point
 
     if not multi_point_nodes:
         continue
@@ -55,15 +42,15 @@ for tree_letter in ['A', 'B', 'C', 'D']:
     offsets_y = []
 
     for node in multi_point_nodes[:5]:  # Show first 5
-        node_id = node['id']
+        node_id = node.id
         container_id = f"container-{tree_letter.lower()}-{node_id.split('node-')[1]}"
 
         if container_id not in container_centers:
             continue
 
         # Get node position
-        node_x, node_y = node['x'], node['y']
-        radius = node['radius']
+        node_x, node_y = node.x, node.y
+        radius = node.radius
 
         # Apply transformation
         trans_x, trans_y = apply_transform(node_x, node_y, tree_letter)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Incremental build graph for the generated assets.
+
+Every stage declares the files it reads and writes. Before running a stage
+the runner hashes its inputs (plus the stage script and the local modules it
+imports) and compares them with scripts/.cache/build-manifest.json; a stage
+whose inputs and outputs are unchanged since its last successful run is
+skipped. Stages run in dependency order, derived from which stage produces
+which file, so a changed SVG reruns exactly the stages downstream of it.
+Independent stages run concurrently (-j bounds how many), a failing stage
+only blocks its own dependents, and a timing summary is printed at the end
+and written to scripts/.cache/build-timings.json.
+
+File hashes are cached by (size, mtime), so a no-op build only stats files.
+
+Usage:
+    python build.py                      # bring every default stage up to date
+    python build.py bounding-boxes       # one stage (and whatever it depends on)
+    python build.py --force              # rerun everything
+    python build.py --list               # show stages and whether they are stale
+    python build.py -j 2                 # at most two stages at a time
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).parent
+REPO_ROOT = SCRIPTS_DIR.parent
+MANIFEST_PATH = SCRIPTS_DIR / '.cache' / 'build-manifest.json'
+MANIFEST_VERSION = 1
+TIMINGS_PATH = SCRIPTS_DIR / '.cache' / 'build-timings.json'
+
+SVG = 'assets/ArcRaidersTree.svg'
+CONFIG = 'data/config/skillTreeConfig.json'
+PATH_DATA = 'data/pathData.json'
+SKILL_TREE_TSX = 'components/SkillTree.tsx'
+
+# Top-level and function-local imports alike; a line scan is much cheaper than ast
+IMPORT_RE = re.compile(r'^[ \t]*(?:from[ \t]+(\w+)[\w.]*[ \t]+import|import[ \t]+([\w., \t]+))', re.MULTILINE)
+
+
+class Stage(NamedTuple):
+    name: str
+    script: str                        # file in scripts/
+    inputs: Tuple[str, ...]            # repo-relative data files (glob patterns allowed)
+    outputs: Tuple[str, ...]           # repo-relative files the stage writes (glob patterns allowed)
+    args: Tuple[str, ...] = ()
+    stdout: Optional[str] = None       # capture stdout into this output
+    default: bool = True               # part of a plain `build.py` run
+
+
+STAGES = [
+    Stage('extract-containers', 'extractContainers.py',
+          (SVG,), ('scripts/containers_output.txt',), stdout='scripts/containers_output.txt'),
+    Stage('update-containers', 'updateContainersByDistance.py',
+          ('scripts/containers_output.txt',), ('data/overlayData.json',)),
+    Stage('extract-paths', 'extractPathDataWithLabels.py',
+          (SVG,), ('scripts/pathDataWithLabels.json',)),
+    Stage('extract-locks', 'extractLocksToJsx.py',
+          (SVG,), ('scripts/locks_output.txt',)),
+    Stage('point-numbers', 'generatePointNumbers.py',
+          (SVG, CONFIG), ('scripts/point_numbers_output.txt',), stdout='scripts/point_numbers_output.txt'),
+    Stage('bounding-boxes', 'extractBoundingBoxes.py',
+          (SVG,), ('public/boundingBoxes.json',)),
+    Stage('skill-index', 'skill_index.py',
+          (CONFIG,), ('data/skillIndex.json',)),
+    Stage('path-lods', 'generatePathLods.py',
+          (PATH_DATA,), ('data/pathData.lod1.json', 'data/pathData.lod2.json',
+                         'data/pathData.lod3.json', 'data/pathDataLods.json')),
+    Stage('path-binary', 'path_binary.py',
+          (PATH_DATA,), ('public/pathData.bin',)),
+    # The regions splice point_numbers_tsx.txt and map over overlayData.json's shapes
+    Stage('skill-tree-regions', 'skill_tree_regions.py',
+          ('scripts/point_numbers_tsx.txt', 'data/overlayData.json'), (SKILL_TREE_TSX,)),
+    Stage('optimize-svg', 'optimizeSvg.py',
+          (SVG, CONFIG, PATH_DATA, SKILL_TREE_TSX), ('assets/ArcRaidersTree.min.svg',)),
+    Stage('icons', 'process_icons.py',
+          ('assets/icons/*.png',), ('public/icons/*.png', 'public/icons/variants/*', 'public/icons/variants.json',
+                                    'data/iconPlaceholders.json', 'assets/icons/manifest.json')),
+    Stage('icon-atlas', 'pack_icons.py',
+          ('public/icons/*.png',), ('public/icons/atlas/*', 'public/icons/atlas.json')),
+    Stage('app-icons', 'png_optimize.py',
+          ('assets/app-icon.png',), ('public/icon-192.png', 'public/icon-256.png', 'public/icon-512.png',
+                                     'public/apple-touch-icon.png')),
+    # The committed mapping is hand-reviewed; only rebuild it on request
+    Stage('container-mapping', 'matchContainersWithTransform.py',
+          (SVG, CONFIG), ('scripts/container_mapping.json',), default=False),
+]
+
+
+def script_dependencies(script, seen=None):
+    """The script plus every scripts/ module it imports, transitively."""
+    seen = set() if seen is None else seen
+    path = SCRIPTS_DIR / script
+    if path.name in seen or not path.exists():
+        return seen
+    seen.add(path.name)
+    for from_module, imported in IMPORT_RE.findall(path.read_text(encoding='utf-8')):
+        names = [from_module] if from_module else imported.split(',')
+        for name in names:
+            name = name.strip().split(' ')[0].split('.')[0]
+            if name and (SCRIPTS_DIR / f'{name}.py').exists():
+                script_dependencies(f'{name}.py', seen)
+    return seen
+
+
+class FileHasher:
+    """sha256 of files, reusing the previous hash while (size, mtime) is unchanged."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def __call__(self, relative):
+        path = REPO_ROOT / relative
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = [stat.st_size, stat.st_mtime_ns]
+        cached = self.cache.get(relative)
+        if cached and cached[:2] == key:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.cache[relative] = key + [digest]
+        return digest
+
+
+def load_manifest():
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {'version': MANIFEST_VERSION, 'files': {}, 'stages': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'version': MANIFEST_VERSION, 'files': {}, 'stages': {}}
+    return manifest
+
+
+def save_manifest(manifest):
+    MANIFEST_PATH.parent.mkdir(exist_ok=True)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+
+def expand(patterns):
+    """Repo-relative files for a list of paths and glob patterns."""
+    files = set()
+    for pattern in patterns:
+        if any(char in pattern for char in '*?['):
+            files.update(path.relative_to(REPO_ROOT).as_posix() for path in REPO_ROOT.glob(pattern))
+        else:
+            files.add(pattern)
+    return sorted(files)
+
+
+def stage_inputs(stage, code_deps):
+    return sorted(set(expand(stage.inputs)) | {f'scripts/{name}' for name in code_deps[stage.name]})
+
+
+def stage_outputs(stage):
+    return expand(stage.outputs)
+
+
+def plan(stages, targets=None):
+    """Stages to consider, in dependency order (targets pull in their producers)."""
+    by_name = {stage.name: stage for stage in stages}
+    producers = {output: stage.name for stage in stages for output in stage.outputs}
+    if targets:
+        unknown = [name for name in targets if name not in by_name]
+        if unknown:
+            raise SystemExit(f"Unknown stage(s): {', '.join(unknown)} (known: {', '.join(by_name)})")
+        wanted = list(targets)
+    else:
+        wanted = [stage.name for stage in stages if stage.default]
+
+    order, state = [], {}
+
+    def visit(name):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'active':
+            raise SystemExit(f"Dependency cycle through stage {name!r}")
+        state[name] = 'active'
+        for relative in by_name[name].inputs:
+            producer = producers.get(relative)
+            if producer and producer != name:
+                visit(producer)
+        state[name] = 'done'
+        order.append(by_name[name])
+
+    for name in wanted:
+        visit(name)
+    return order
+
+
+def stale_reason(stage, record, input_hashes, hasher):
+    if record is None:
+        return 'never built'
+    if record['inputs'] != input_hashes:
+        changed = sorted(path for path in set(record['inputs']) | set(input_hashes)
+                         if record['inputs'].get(path) != input_hashes.get(path))
+        return 'changed: ' + ', '.join(changed)
+    outputs = stage_outputs(stage)
+    if sorted(record['outputs']) != outputs:
+        return 'output files changed'
+    for relative in outputs:
+        digest = hasher(relative)
+        if digest is None:
+            return f'missing {relative}'
+        if record['outputs'].get(relative) != digest:
+            return f'modified {relative}'
+    return None
+
+
+def run_stage(stage):
+    """Run the stage script; returns (ok, seconds, captured output)."""
+    command = [sys.executable, str(SCRIPTS_DIR / stage.script), *stage.args]
+    start = time.perf_counter()
+    try:
+        if stage.stdout:
+            with open(REPO_ROOT / stage.stdout, 'wb') as out:
+                result = subprocess.run(command, cwd=SCRIPTS_DIR, stdout=out, stderr=subprocess.PIPE)
+            output = result.stderr
+        else:
+            result = subprocess.run(command, cwd=SCRIPTS_DIR, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            output = result.stdout
+    except OSError as e:
+        return False, time.perf_counter() - start, str(e)
+    return result.returncode == 0, time.perf_counter() - start, output.decode('utf-8', 'replace')
+
+
+def dependencies(stages):
+    """{stage name: names of the planned stages producing its inputs}"""
+    producers = {output: stage.name for stage in stages for output in stage.outputs}
+    return {stage.name: {producers[relative] for relative in stage.inputs
+                         if relative in producers and producers[relative] != stage.name}
+            for stage in stages}
+
+
+def list_stages(targets=None):
+    manifest = load_manifest()
+    hasher = FileHasher(manifest['files'])
+    for stage in plan(STAGES, targets):
+        code_deps = {stage.name: script_dependencies(stage.script)}
+        input_hashes = {relative: hasher(relative) for relative in stage_inputs(stage, code_deps)}
+        reason = stale_reason(stage, manifest['stages'].get(stage.name), input_hashes, hasher)
+        print(f"  {stage.name:<20} {reason or 'up to date'}")
+
+
+def build(targets=None, force=False, verbose=False, jobs=None):
+    """
+    Bring the planned stages up to date, running independent stages
+    concurrently. Returns {stage name: (status, seconds)}.
+
+    A stage starts once every stage producing its inputs has finished; a
+    failure only blocks the stages downstream of it. Each stage runs in its
+    own interpreter, so the worker threads here just wait on processes.
+    """
+    manifest = load_manifest()
+    hasher = FileHasher(manifest['files'])
+    stages = plan(STAGES, targets)
+    by_name = {stage.name: stage for stage in stages}
+    deps = dependencies(stages)
+    code_deps = {stage.name: script_dependencies(stage.script) for stage in stages}
+
+    results = {}
+    running = {}
+    pending = [stage.name for stage in stages]
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name in list(pending):
+                if any(dep not in results for dep in deps[name]):
+                    continue
+                pending.remove(name)
+                stage = by_name[name]
+                blocked = sorted(dep for dep in deps[name] if results[dep][0] in ('failed', 'blocked'))
+                if blocked:
+                    results[name] = ('blocked', 0.0)
+                    print(f"  {name:<20} blocked by {', '.join(blocked)}")
+                    continue
+                # Hashed here, after upstream stages ran, so their new outputs count
+                input_hashes = {relative: hasher(relative) for relative in stage_inputs(stage, code_deps)}
+                reason = 'forced' if force else stale_reason(stage, manifest['stages'].get(name),
+                                                            input_hashes, hasher)
+                if reason is None:
+                    results[name] = ('up to date', 0.0)
+                    print(f"  {name:<20} up to date")
+                    continue
+                print(f"  {name:<20} running ({reason})", flush=True)
+                running[pool.submit(run_stage, stage)] = name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                stage = by_name[name]
+                ok, seconds, output = future.result()
+                if verbose or not ok:
+                    print(output.rstrip())
+                if not ok:
+                    manifest['stages'].pop(name, None)
+                    results[name] = ('failed', seconds)
+                    print(f"✗ {name} failed after {seconds:.2f}s")
+                    continue
+                # Rehash: a stage may rewrite one of its own inputs in place
+                manifest['stages'][name] = {
+                    'inputs': {relative: hasher(relative) for relative in stage_inputs(stage, code_deps)},
+                    'outputs': {relative: hasher(relative) for relative in stage_outputs(stage)},
+                }
+                results[name] = ('built', seconds)
+                print(f"  {name:<20} done in {seconds:.2f}s")
+
+    save_manifest(manifest)
+    return results
+
+
+def timing_summary(results, wall_seconds):
+    """Per-stage table plus wall time against the sequential sum."""
+    lines = [f"\n{'stage':<20}{'status':>12}{'seconds':>10}"]
+    for name, (status, seconds) in results.items():
+        lines.append(f"{name:<20}{status:>12}{seconds:>10.2f}")
+    sequential = sum(seconds for _, seconds in results.values())
+    slowest = max((seconds for _, seconds in results.values()), default=0.0)
+    lines.append(f"{'wall time':<20}{'':>12}{wall_seconds:>10.2f}")
+    lines.append(f"{'sequential sum':<20}{'':>12}{sequential:>10.2f}")
+    lines.append(f"{'slowest stage':<20}{'':>12}{slowest:>10.2f}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incrementally regenerate build artifacts')
+    parser.add_argument('stages', nargs='*', help='stages to build (default: all default stages)')
+    parser.add_argument('--force', action='store_true', help='rerun stages even if up to date')
+    parser.add_argument('--list', action='store_true', help='list stages and why they would run')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show stage output')
+    parser.add_argument('-j', '--jobs', type=int, help='maximum concurrent stages (default: CPU count)')
+    parser.add_argument('--timings', type=Path, default=TIMINGS_PATH,
+                        help='where to write the JSON timing summary')
+    args = parser.parse_args()
+
+    if args.list:
+        list_stages(args.stages or None)
+        return
+
+    start = time.perf_counter()
+    results = build(args.stages or None, args.force, args.verbose, args.jobs)
+    wall_seconds = time.perf_counter() - start
+
+    print(timing_summary(results, wall_seconds))
+    args.timings.parent.mkdir(exist_ok=True)
+    args.timings.write_text(json.dumps({
+        'wallSeconds': round(wall_seconds, 3),
+        'stages': {name: {'status': status, 'seconds': round(seconds, 3)}
+                   for name, (status, seconds) in results.items()},
+    }, indent=2) + '\n', encoding='utf-8')
+
+    failed = [name for name, (status, _) in results.items() if status in ('failed', 'blocked')]
+    if failed:
+        print(f"\n✗ Build failed: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\n✓ Build finished in {wall_seconds:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,54 +5,27 @@ Calculate the center position of each container path to properly align the text
 
 import re
 import json
+from pathlib import Path
 
-# Read the SkillTree.tsx file
-with open('skill-tree-planner/components/SkillTree.tsx', 'r') as f:
-    content = f.read()
+from svg_paths import PathBatch
 
-# Extract all container paths with their IDs and d attributes
-pattern = r'id="(container-[a-z]-[^"]+)"\s+d="([^"]+)"'
-containers = re.findall(pattern, content)
+repo_root = Path(__file__).parent.parent
 
-print(f"Found {len(containers)} containers\n")
-
-# Function to calculate approximate center from path
-def get_path_center(path_string):
-    """
-    Parse SVG path and calculate its approximate center.
-    Containers are simple rounded rectangles, so we can extract key coordinates.
-    """
-    # Extract all coordinates from the path
-    # Pattern: numbers (including negative and decimals)
-    coords = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', path_string)
-    coords = [float(c) for c in coords]
-
-    if len(coords) < 4:
-        return None, None
+# Container outlines live in the overlay data (see overlay_data.py)
+with open(repo_root / 'data' / 'overlayData.json', 'r') as f:
+    overlay = json.load(f)
 
-    # Get x and y coordinates separately
-    # First coordinate is the starting point from 'm'
-    x_coords = [coords[i] for i in range(0, len(coords), 2)]
-    y_coords = [coords[i] for i in range(1, len(coords), 2)]
+containers = [(shape['id'], shape['d']) for shape in overlay['shapes'] if shape['kind'] == 'container']
 
-    # Calculate bounding box
-    min_x = min(x_coords)
-    max_x = max(x_coords)
-    min_y = min(y_coords)
-    max_y = max(y_coords)
-
-    # Calculate center
-    center_x = (min_x + max_x) / 2
-    center_y = (min_y + max_y) / 2
+print(f"Found {len(containers)} containers\n")
 
-    return center_x, center_y
+# Exact bounding boxes for all container paths in one batch
+boxes = PathBatch.from_strings([path_d for _, path_d in containers]).bounds()
 
-# Calculate centers for each container
+# Calculate centers for each container (center of the exact bounding box)
 results = {}
-for container_id, path_d in containers:
-    center_x, center_y = get_path_center(path_d)
-    if center_x is not None:
-        results[container_id] = {'x': center_x, 'y': center_y}
+for (container_id, _), (min_x, min_y, max_x, max_y) in zip(containers, boxes):
+    results[container_id] = {'x': float(min_x + max_x) / 2, 'y': float(min_y + max_y) / 2}
 
 # Group by tree
 tree_results = {'A': {}, 'B': {}, 'C': {}, 'D': {}}
@@ -71,7 +44,7 @@ for tree in ['A', 'B', 'C', 'D']:
         print(f"  {node_id}: x={coords['x']:.2f}, y={coords['y']:.2f}")
 
 # Save to JSON for easy use
-with open('skill-tree-planner/scripts/container_centers.json', 'w') as f:
+with open(repo_root / 'scripts' / 'container_centers.json', 'w') as f:
     json.dump(results, f, indent=2)
 
 print(f"\n✓ Calculated centers for {len(results)} containers")
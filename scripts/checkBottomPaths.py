@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 import xml.etree.ElementTree as ET
+from pathlib import Path
 
 # Parse SVG
-tree = ET.parse('../assets/ArcRaidersTree.svg')
+tree = ET.parse(Path(__file__).parent.parent / 'assets' / 'ArcRaidersTree.svg')
 root = tree.getroot()
 
 # Known bottom paths that work:
@@ -1,31 +1,15 @@
 #!/usr/bin/env python3
 """
-Clean up extra blank lines in container formatting
-"""
-
-import re
-from pathlib import Path
+Normalize the formatting of the generated blocks in SkillTree.tsx
 
-# Read the SkillTree.tsx file
-tsx_path = Path(__file__).parent.parent / 'components' / 'SkillTree.tsx'
-with open(tsx_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+Generated regions always come out in the same canonical format, so
+regenerating every region in one pass replaces the old blank-line cleanup.
 
-# Fix pattern: remove extra blank lines within shouldShowContainer blocks
-# Pattern: blank lines between attributes in path elements
-content = re.sub(r'(\s+id="[^"]+")(\n\s*\n\s+)(d=")', r'\1\n\2', content)
-content = re.sub(r'(d="[^"]+")(\n\s*\n\s+)(fill=)', r'\1\n\2', content)
-content = re.sub(r'(fill="[^"]+")(\n\s*\n\s+)(stroke=)', r'\1\n\2', content)
-content = re.sub(r'(stroke="[^"]+")(\n\s*\n\s+)(strokeWidth=)', r'\1\n\2', content)
-content = re.sub(r'(strokeWidth="[^"]+")(\n\s*\n\s+)(opacity=)', r'\1\n\2', content)
-content = re.sub(r'(opacity="[^"]+")(\n\s*\n\s+)(/>)', r'\1\n\2', content)
-
-# Remove double blank lines
-while '\n\n\n' in content:
-    content = content.replace('\n\n\n', '\n\n')
+Usage:
+    python cleanFormatting.py [regions...] [--dry-run]
+"""
 
-# Write back
-with open(tsx_path, 'w', encoding='utf-8') as f:
-    f.write(content)
+from skill_tree_regions import main
 
-print("Formatting cleaned!")
+if __name__ == '__main__':
+    main(description='Regenerate every generated region of SkillTree.tsx')
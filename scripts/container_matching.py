@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Matching engine shared by the container scripts.
+
+Pairs two point sets (e.g. transformed node centers and container
+centroids) with a globally optimal one-to-one assignment instead of greedy
+nearest-first matching, so the result does not depend on iteration order:
+
+    from container_matching import match_points
+
+    result = match_points(node_ids, node_xy, container_ids, container_xy, tolerance=15)
+    for match in result.matches:
+        print(match.source, '->', match.target, match.distance)
+    result.report()
+
+The assignment minimizes the total distance over a vectorized distance
+matrix with a Jonker-Volgenant style shortest augmenting path solver
+(O(n^3), fine for several hundred items per tree). A KD-tree over the
+targets answers the nearest-neighbour queries used for reporting, e.g.
+flagging sources whose optimal partner is not their nearest target.
+
+Only NumPy is required; SciPy is deliberately not used.
+"""
+
+import sys
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class KDTree:
+    """Static 2-D KD-tree over an (N, 2) point array."""
+
+    def __init__(self, points, leaf_size=8):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(self.points))
+        # Flat node arrays: [start, end) slice of self.order, split axis/value, children
+        self.start, self.end, self.axis, self.split, self.left, self.right = [], [], [], [], [], []
+        self.lower = []
+        self.upper = []
+        if len(self.points):
+            self._build(0, len(self.points))
+
+    def _build(self, start, end):
+        node = len(self.start)
+        idx = self.order[start:end]
+        pts = self.points[idx]
+        self.start.append(start)
+        self.end.append(end)
+        self.lower.append(pts.min(axis=0))
+        self.upper.append(pts.max(axis=0))
+        self.axis.append(-1)
+        self.split.append(0.0)
+        self.left.append(-1)
+        self.right.append(-1)
+
+        if end - start <= self.leaf_size:
+            return node
+
+        axis = int(np.argmax(self.upper[node] - self.lower[node]))
+        # Stable sort keeps equal coordinates in input order (deterministic)
+        idx = idx[np.argsort(pts[:, axis], kind='stable')]
+        self.order[start:end] = idx
+        mid = start + (end - start) // 2
+        self.axis[node] = axis
+        self.split[node] = float(self.points[self.order[mid], axis])
+        self.left[node] = self._build(start, mid)
+        self.right[node] = self._build(mid, end)
+        return node
+
+    def _box_distance(self, node, point):
+        gap = np.maximum(0.0, np.maximum(self.lower[node] - point, point - self.upper[node]))
+        return float(np.hypot(gap[0], gap[1]))
+
+    def nearest(self, point):
+        """(distance, index) of the closest point; ties go to the lowest index."""
+        if not len(self.points):
+            return np.inf, -1
+        point = np.asarray(point, dtype=np.float64)
+        best_dist, best_index = np.inf, -1
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, point) > best_dist:
+                continue
+            if self.left[node] == -1:
+                idx = self.order[self.start[node]:self.end[node]]
+                dists = np.hypot(*(self.points[idx] - point).T)
+                i = int(np.argmin(dists))
+                for candidate in np.flatnonzero(dists == dists[i]):
+                    dist, index = float(dists[candidate]), int(idx[candidate])
+                    if dist < best_dist or (dist == best_dist and index < best_index):
+                        best_dist, best_index = dist, index
+                continue
+            # Visit the side containing the point first
+            near, far = self.left[node], self.right[node]
+            if point[self.axis[node]] >= self.split[node]:
+                near, far = far, near
+            stack.append(far)
+            stack.append(near)
+        return best_dist, best_index
+
+    def query(self, points):
+        """Nearest neighbour for each row of an (M, 2) array: (distances, indices)."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        distances = np.empty(len(points))
+        indices = np.empty(len(points), dtype=np.int64)
+        for row, point in enumerate(points):
+            distances[row], indices[row] = self.nearest(point)
+        return distances, indices
+
+    def query_radius(self, point, radius):
+        """Sorted indices of all points within `radius` of `point`."""
+        point = np.asarray(point, dtype=np.float64)
+        found = []
+        stack = [0] if len(self.points) else []
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, point) > radius:
+                continue
+            if self.left[node] == -1:
+                idx = self.order[self.start[node]:self.end[node]]
+                dists = np.hypot(*(self.points[idx] - point).T)
+                found.extend(idx[dists <= radius].tolist())
+            else:
+                stack.extend((self.left[node], self.right[node]))
+        return sorted(found)
+
+
+def distance_matrix(sources, targets):
+    """(N, M) Euclidean distances between two point arrays."""
+    sources = np.asarray(sources, dtype=np.float64).reshape(-1, 2)
+    targets = np.asarray(targets, dtype=np.float64).reshape(-1, 2)
+    diff = sources[:, None, :] - targets[None, :, :]
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+
+def linear_sum_assignment(cost):
+    """
+    Minimum-cost assignment for a rectangular cost matrix.
+
+    Returns (rows, cols) index arrays sorted by row, with min(N, M) pairs.
+    Shortest augmenting path (Jonker-Volgenant / Crouse); ties are broken
+    towards the lowest column index, so equal inputs give equal outputs.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError(f'Expected a 2-D cost matrix, got shape {cost.shape}')
+    if np.isnan(cost).any() or np.isneginf(cost).any():
+        raise ValueError('Cost matrix contains NaN or -inf')
+
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    u = np.zeros(n)
+    v = np.zeros(m)
+    col4row = np.full(n, -1, dtype=np.int64)
+    row4col = np.full(m, -1, dtype=np.int64)
+
+    for cur_row in range(n):
+        shortest = np.full(m, np.inf)
+        path = np.full(m, -1, dtype=np.int64)
+        remaining = np.ones(m, dtype=bool)
+        scanned_rows = np.zeros(n, dtype=bool)
+        min_val = 0.0
+        i = cur_row
+        sink = -1
+
+        while sink == -1:
+            scanned_rows[i] = True
+            reduced = min_val + cost[i] - u[i] - v
+            better = remaining & (reduced < shortest)
+            path[better] = i
+            shortest[better] = reduced[better]
+
+            candidates = np.flatnonzero(remaining)
+            values = shortest[candidates]
+            min_val = values.min()
+            if not np.isfinite(min_val):
+                raise ValueError('Cost matrix is infeasible')
+            ties = candidates[values == min_val]
+            free = ties[row4col[ties] == -1]
+            j = int(free[0] if len(free) else ties[0])
+
+            remaining[j] = False
+            if row4col[j] == -1:
+                sink = j
+            else:
+                i = row4col[j]
+
+        # Update the dual variables
+        u[cur_row] += min_val
+        others = scanned_rows.copy()
+        others[cur_row] = False
+        u[others] += min_val - shortest[col4row[others]]
+        scanned_cols = ~remaining
+        v[scanned_cols] -= min_val - shortest[scanned_cols]
+
+        # Augment along the alternating path back to cur_row
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur_row:
+                break
+
+    rows = np.arange(n)
+    if transposed:
+        order = np.argsort(col4row)
+        return col4row[order], rows[order]
+    return rows, col4row
+
+
+class Match(NamedTuple):
+    source: str
+    target: str
+    distance: float
+    nearest: Optional[str] = None   # nearest target to the source, when different
+
+
+class MatchResult:
+    """Outcome of match_points(): accepted pairs and everything left over."""
+
+    def __init__(self, matches, beyond_tolerance, unmatched_sources, unmatched_targets, tolerance):
+        self.matches = matches                      # Match, distance <= tolerance
+        self.beyond_tolerance = beyond_tolerance    # Match, assigned but too far apart
+        self.unmatched_sources = unmatched_sources  # ids with no partner at all
+        self.unmatched_targets = unmatched_targets
+        self.tolerance = tolerance
+
+    def mapping(self):
+        """{source id: target id} for the accepted matches."""
+        return {match.source: match.target for match in self.matches}
+
+    @property
+    def total_distance(self):
+        return sum(match.distance for match in self.matches)
+
+    def report(self, title='Matching', file=None):
+        file = file or sys.stdout
+        tolerance = f', tolerance {self.tolerance:g}' if self.tolerance is not None else ''
+        print(f"{title}: {len(self.matches)} matched (total distance {self.total_distance:.2f}{tolerance})",
+              file=file)
+        for match in self.beyond_tolerance:
+            print(f"  beyond tolerance: {match.source} -> {match.target} ({match.distance:.1f})", file=file)
+        contested = [match for match in self.matches if match.nearest]
+        for match in contested:
+            print(f"  not nearest: {match.source} -> {match.target} (nearest is {match.nearest})", file=file)
+        if self.unmatched_sources:
+            print(f"  unmatched sources: {', '.join(self.unmatched_sources)}", file=file)
+        if self.unmatched_targets:
+            print(f"  unmatched targets: {', '.join(self.unmatched_targets)}", file=file)
+
+
+def match_points(source_ids, source_points, target_ids, target_points, tolerance=None):
+    """
+    Optimal one-to-one matching of sources to targets by Euclidean distance.
+
+    Inputs are sorted by id before solving, so the result only depends on
+    the ids and coordinates, never on the order they were collected in.
+    Assigned pairs further apart than `tolerance` are reported in
+    `beyond_tolerance` instead of `matches`; the solver charges them a flat
+    penalty, so an out-of-range pair never displaces an in-range one.
+    """
+    source_ids = list(source_ids)
+    target_ids = list(target_ids)
+    source_points = np.asarray(source_points, dtype=np.float64).reshape(-1, 2)
+    target_points = np.asarray(target_points, dtype=np.float64).reshape(-1, 2)
+    if len(source_ids) != len(source_points) or len(target_ids) != len(target_points):
+        raise ValueError('Each id needs exactly one point')
+
+    source_order = sorted(range(len(source_ids)), key=source_ids.__getitem__)
+    target_order = sorted(range(len(target_ids)), key=target_ids.__getitem__)
+    source_ids = [source_ids[i] for i in source_order]
+    target_ids = [target_ids[i] for i in target_order]
+    source_points = source_points[source_order]
+    target_points = target_points[target_order]
+
+    if not source_ids or not target_ids:
+        return MatchResult([], [], source_ids, target_ids, tolerance)
+
+    distances = distance_matrix(source_points, target_points)
+    cost = distances
+    if tolerance is not None:
+        # Beyond the gate every pair costs the same as leaving both ends unmatched
+        cost = np.where(distances <= tolerance, distances, 2.0 * tolerance)
+    rows, cols = linear_sum_assignment(cost)
+
+    _, nearest = KDTree(target_points).query(source_points)
+
+    matches, beyond = [], []
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        nearest_id = target_ids[nearest[row]] if nearest[row] != col else None
+        match = Match(source_ids[row], target_ids[col], float(distances[row, col]), nearest_id)
+        if tolerance is not None and match.distance > tolerance:
+            beyond.append(match)
+        else:
+            matches.append(match)
+
+    matched_rows, matched_cols = set(rows.tolist()), set(cols.tolist())
+    unmatched_sources = [sid for i, sid in enumerate(source_ids) if i not in matched_rows]
+    unmatched_targets = [tid for j, tid in enumerate(target_ids) if j not in matched_cols]
+    return MatchResult(matches, beyond, unmatched_sources, unmatched_targets, tolerance)
+
+
+if __name__ == '__main__':
+    import time
+
+    rng = np.random.default_rng(0)
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    nodes = rng.uniform(0, 600, (size, 2))
+    containers = nodes[rng.permutation(size)] + rng.normal(0, 2, (size, 2))
+
+    start = time.perf_counter()
+    result = match_points([f'n{i:04d}' for i in range(size)], nodes,
+                          [f'c{i:04d}' for i in range(size)], containers, tolerance=15)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Matched {size} x {size} points in {elapsed:.1f} ms")
+    print(f"  matched: {len(result.matches)}, beyond tolerance: {len(result.beyond_tolerance)}, "
+          f"not nearest: {sum(1 for m in result.matches if m.nearest)}")
@@ -2,35 +2,55 @@
 """
 The containers currently have local coordinates (relative to tree transforms).
 Since locks work in the overlay, containers must use ABSOLUTE coordinates.
-This script extracts containers with their tree transforms already applied to get absolute coords.
+This script bakes the full transform chain (every enclosing group, see
+svg_transforms) into the geometry of each container and lock shape, so the
+overlay layers can render them without nested transforms.
+
+Output: scripts/baked_overlays.json
+
+    {
+      "containers": {"container-a-0": {"svgId": ..., "tag": "path", "attrs": {"d": ...}}},
+      "locks": {"lock-a-1-3": {"svgId": ..., "shapes": [{"svgId": ..., "tag": ..., "attrs": {...}}]}}
+    }
 """
 
-import re
-import svg.path
+import json
+import sys
 from pathlib import Path
 
-# Read SVG
-svg_path = Path(__file__).parent.parent / 'assets' / 'ARtreeforweb.svg'
-content = svg_path.read_text(encoding='utf-8')
-
-# Extract tree transforms - looking at where containers actually are in the SVG
-tree_data = {}
-for tree_letter in ['A', 'B', 'C', 'D']:
-    # Find the group that contains this tree's containers
-    # Pattern: find a <g> tag that has containers for this tree as children
-    pattern = f'<g[^>]*>.*?Tree {tree_letter} container node'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        # Now find the transform on this group
-        group_start = content.rfind('<g', 0, match.start())
-        group_tag = content[group_start:content.find('>', group_start)+1]
-
-        transform_match = re.search(r'transform="([^"]+)"', group_tag)
-        if transform_match:
-            transform = transform_match.group(1)
-            print(f"Tree {tree_letter}: {transform}")
-            tree_data[tree_letter] = transform
-
-print("\nThis shows what transforms need to be applied to container coordinates")
-print("Containers are INSIDE transformed groups, so their coordinates are relative")
-print("For overlay rendering, we need ABSOLUTE coordinates (like the locks have)")
+from svg_labels import load_labels
+from svg_transforms import bake_group, is_translation, to_string
+
+OUTPUT_PATH = Path(__file__).parent / 'baked_overlays.json'
+PRECISION = 5
+
+labels = load_labels()
+index = labels.index
+
+print("Tree layer transforms:")
+for tree_letter, layer in sorted(labels.tree_layers.items()):
+    print(f"  Tree {tree_letter}: {to_string(layer.ctm) or 'identity'}")
+
+containers = {}
+for parsed, element in labels.items('container'):
+    shapes = list(bake_group(index, element, PRECISION))
+    if len(shapes) != 1:
+        print(f"WARNING: {parsed.raw!r} ({element.id}) has {len(shapes)} shapes, skipping", file=sys.stderr)
+        continue
+    _, tag, attrs = shapes[0]
+    containers[parsed.container_id] = {'svgId': element.id, 'tag': tag, 'attrs': attrs}
+
+locks = {}
+for parsed, element in labels.items('lock'):
+    shapes = [{'svgId': shape.id, 'tag': tag, 'attrs': attrs}
+              for shape, tag, attrs in bake_group(index, element, PRECISION)]
+    locks[parsed.lock_id] = {'svgId': element.id, 'shapes': shapes}
+
+non_translated = sum(1 for _, element in labels.items('container') if not is_translation(element.ctm))
+print(f"\nBaked {len(containers)} containers ({non_translated} under rotating/flipping transforms)")
+print(f"Baked {len(locks)} locks ({sum(len(lock['shapes']) for lock in locks.values())} shapes)")
+
+with open(OUTPUT_PATH, 'w') as f:
+    json.dump({'containers': containers, 'locks': locks}, f, indent=2)
+
+print(f"\nSaved absolute coordinates to {OUTPUT_PATH.name}")
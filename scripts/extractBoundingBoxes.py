@@ -1,126 +1,319 @@
 #!/usr/bin/env python3
 """
 Extract tree bounding boxes from the SVG and calculate optimal viewport settings
+
+The boxes are computed from the geometry itself: every shape in a tree
+layer, plus the containers and locks labeled for that tree, is taken to
+document coordinates with its full transform chain (CTM) and measured
+exactly (cubic extrema, analytic ellipse extents) in one vectorized pass.
+
+Each tree gets a tight oriented box. The orientation comes from the
+hand-drawn rect in the "Tree BoundingBoxes" layer when there is one (so the
+portrait rotations in SkillTree.tsx keep lining up) and otherwise from the
+minimum-area rectangle around the tree's hull.
+
+Writes public/boundingBoxes.json:
+
+    trees[X]            name, x, y, width, height, rotation, corners (oriented box)
+                        and bounds (axis-aligned box)
+    overallBoundingBox  axis-aligned box around all trees
+    viewports           per tree and 'overall': {aspect: {viewBox, zoom}} presets
 """
 
-import re
 import json
 import math
+import sys
 from pathlib import Path
 
-# Read the SVG file
-svg_path = Path(__file__).parent.parent / 'assets' / 'ArcRaidersTree.svg'
-with open(svg_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+import numpy as np
 
-# First, find the Tree BoundingBoxes layer
-bbox_layer_match = re.search(r'inkscape:label="Tree BoundingBoxes"[^>]*>(.*?)</g>', content, re.DOTALL)
+from svg_labels import load_labels
+from svg_paths import parse_path, segment_bounds
+from svg_transforms import apply_segments
 
-if not bbox_layer_match:
-    print('{"error": "Tree BoundingBoxes layer not found"}')
-    exit(1)
+OUTPUT_PATH = Path(__file__).parent.parent / 'public' / 'boundingBoxes.json'
 
-bbox_layer_content = bbox_layer_match.group(1)
+# Common viewport aspect ratios (width / height)
+ASPECT_RATIOS = {
+    '21:9': 21 / 9,
+    '16:9': 16 / 9,
+    '16:10': 16 / 10,
+    '3:2': 3 / 2,
+    '4:3': 4 / 3,
+    '1:1': 1.0,
+    '3:4': 3 / 4,
+    '9:16': 9 / 16,
+    '9:19.5': 9 / 19.5,
+}
 
-# Pattern to match rect elements with tree labels in the BoundingBoxes layer
-pattern = r'<rect[^>]*inkscape:label="Tree ([A-D])"[^>]*>'
+# Half of the 1.5 unit outline the frontend adds around the boxes
+STROKE_OFFSET = 1.5 / 2
 
-trees = {}
 
-for match in re.finditer(pattern, bbox_layer_content):
-    rect_element = match.group(0)
-    tree_name = match.group(1)
+def rotation_matrix(degrees):
+    angle = math.radians(degrees)
+    return np.array([[math.cos(angle), -math.sin(angle)],
+                     [math.sin(angle), math.cos(angle)]])
 
-    # Extract attributes from the rect element
-    width_match = re.search(r'width="([^"]+)"', rect_element)
-    height_match = re.search(r'height="([^"]+)"', rect_element)
-    x_match = re.search(r'x="([^"]+)"', rect_element)
-    y_match = re.search(r'y="([^"]+)"', rect_element)
-    transform_match = re.search(r'transform="rotate\(([^)]+)\)"', rect_element)
 
-    if width_match and height_match and x_match and y_match:
-        tree_data = {
-            'name': f'Tree {tree_name}',
-            'width': float(width_match.group(1)),
-            'height': float(height_match.group(1)),
-            'x': float(x_match.group(1)),
-            'y': float(y_match.group(1)),
-        }
+def local_geometry(element):
+    """('cubics', (k, 4, 2)) or ('ellipse', (cx, cy, rx, ry)) in element coordinates."""
+    tag = element.tag
+    if tag == 'path':
+        return 'cubics', parse_path(element.get('d', '')).segments
+    if tag == 'circle':
+        r = float(element.get('r', 0))
+        return 'ellipse', (float(element.get('cx', 0)), float(element.get('cy', 0)), r, r)
+    if tag == 'ellipse':
+        return 'ellipse', (float(element.get('cx', 0)), float(element.get('cy', 0)),
+                           float(element.get('rx', 0)), float(element.get('ry', 0)))
+    if tag == 'rect':
+        x, y = float(element.get('x', 0)), float(element.get('y', 0))
+        w, h = float(element.get('width', 0)), float(element.get('height', 0))
+        return 'cubics', parse_path(f'M {x},{y} H {x + w} V {y + h} H {x} Z').segments
+    if tag in ('line', 'polyline', 'polygon'):
+        if tag == 'line':
+            points = f"{element.get('x1', 0)},{element.get('y1', 0)} {element.get('x2', 0)},{element.get('y2', 0)}"
+        else:
+            points = element.get('points', '')
+        close = ' Z' if tag == 'polygon' else ''
+        return 'cubics', parse_path(f'M {points}{close}').segments
+    return None, None
+
+
+class TreeGeometry:
+    """Document-space geometry of every tree, stacked for vectorized queries."""
+
+    def __init__(self, labels):
+        self.trees = sorted(labels.tree_layers)
+        index = labels.index
+        tree_number = {tree: i for i, tree in enumerate(self.trees)}
+
+        members = {tree: [] for tree in self.trees}
+        for tree, layer in labels.tree_layers.items():
+            members[tree].extend(index.descendants(layer))
+        for kind in ('container', 'lock'):
+            for parsed, element in labels.items(kind):
+                if parsed.tree in members:
+                    members[parsed.tree].append(element)
+                    members[parsed.tree].extend(index.descendants(element))
+
+        segments, segment_tree = [], []
+        centers, axes, ellipse_tree = [], [], []
+        for tree in self.trees:
+            seen = set()
+            for element in members[tree]:
+                if element.index in seen:
+                    continue
+                seen.add(element.index)
+                kind, geometry = local_geometry(element)
+                if kind == 'cubics' and len(geometry):
+                    segments.append(apply_segments(element.ctm, geometry))
+                    segment_tree.append(np.full(len(geometry), tree_number[tree]))
+                elif kind == 'ellipse':
+                    a, b, c, d, e, f = element.ctm
+                    cx, cy, rx, ry = geometry
+                    centers.append((a * cx + c * cy + e, b * cx + d * cy + f))
+                    # Columns: images of the two semi-axes
+                    axes.append(np.array([[a, c], [b, d]]) @ np.diag([rx, ry]))
+                    ellipse_tree.append(tree_number[tree])
+
+        self.segments = np.concatenate(segments) if segments else np.empty((0, 4, 2))
+        self.segment_tree = np.concatenate(segment_tree) if segment_tree else np.empty(0, dtype=np.int64)
+        self.centers = np.array(centers).reshape(-1, 2)
+        self.axes = np.array(axes).reshape(-1, 2, 2)
+        self.ellipse_tree = np.array(ellipse_tree, dtype=np.int64)
+
+    def bounds(self, rotations=None):
+        """
+        (T, 4) exact min_x, min_y, max_x, max_y per tree, measured in each
+        tree's frame: the geometry is rotated by -rotations[t] degrees first.
+        """
+        count = len(self.trees)
+        frames = np.stack([rotation_matrix(-(rotations[t] if rotations is not None else 0.0))
+                           for t in range(count)])
+
+        mins = np.full((count, 2), np.inf)
+        maxs = np.full((count, 2), -np.inf)
+
+        if len(self.segments):
+            rotated = np.einsum('sij,skj->ski', frames[self.segment_tree], self.segments)
+            boxes = segment_bounds(rotated)
+            np.minimum.at(mins, self.segment_tree, boxes[:, :2])
+            np.maximum.at(maxs, self.segment_tree, boxes[:, 2:])
+
+        if len(self.centers):
+            frame = frames[self.ellipse_tree]
+            centers = np.einsum('eij,ej->ei', frame, self.centers)
+            axes = np.einsum('eij,ejk->eik', frame, self.axes)
+            # Extent of an ellipse along an axis is the norm of that row of its axis matrix
+            half = np.linalg.norm(axes, axis=2)
+            np.minimum.at(mins, self.ellipse_tree, centers - half)
+            np.maximum.at(maxs, self.ellipse_tree, centers + half)
+
+        return np.concatenate([mins, maxs], axis=1)
+
+    def hull_points(self, tree):
+        """Points whose convex hull contains the tree (control points + ellipse samples)."""
+        t = self.trees.index(tree)
+        parts = [self.segments[self.segment_tree == t].reshape(-1, 2)]
+        if len(self.centers):
+            angles = np.linspace(0, 2 * np.pi, 32, endpoint=False)
+            unit = np.stack([np.cos(angles), np.sin(angles)])
+            # Sample on a slightly larger ellipse so the hull still contains it
+            grow = 1 / math.cos(math.pi / 32)
+            mask = self.ellipse_tree == t
+            samples = self.centers[mask][:, :, None] + grow * (self.axes[mask] @ unit)
+            parts.append(samples.transpose(0, 2, 1).reshape(-1, 2))
+        return np.concatenate(parts)
+
+
+def convex_hull(points):
+    """Monotone chain convex hull, counter-clockwise."""
+    pts = sorted(set(map(tuple, np.round(points, 9))))
+    if len(pts) <= 2:
+        return np.array(pts)
 
-        if transform_match:
-            tree_data['rotation'] = float(transform_match.group(1))
-
-        trees[tree_name] = tree_data
-
-# Calculate the overall bounding box that encompasses all trees
-if trees:
-    # For rotated rectangles, we need to calculate the actual bounding box
-    all_x_coords = []
-    all_y_coords = []
-
-    for tree_id, tree in trees.items():
-        x, y, w, h = tree['x'], tree['y'], tree['width'], tree['height']
-
-        if 'rotation' in tree:
-            # Convert rotation to radians
-            angle = math.radians(tree['rotation'])
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-
-            # Four corners of the rectangle before rotation (relative to top-left)
-            corners = [
-                (0, 0),
-                (w, 0),
-                (w, h),
-                (0, h)
-            ]
-
-            # Rotate each corner around origin, then translate to position
-            rotated_corners = []
-            for cx, cy in corners:
-                # Rotate
-                rx = cx * cos_a - cy * sin_a
-                ry = cx * sin_a + cy * cos_a
-                # Translate to actual position
-                rotated_corners.append((rx + x, ry + y))
-
-            all_x_coords.extend([c[0] for c in rotated_corners])
-            all_y_coords.extend([c[1] for c in rotated_corners])
-
-            # Store rotated corners for later use
-            tree['corners'] = rotated_corners
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return np.array(lower[:-1] + upper[:-1])
+
+
+def min_area_rotation(points):
+    """Rotation (degrees) of the minimum-area rectangle around the points."""
+    hull = convex_hull(points)
+    if len(hull) < 3:
+        return 0.0
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.unique(np.round(np.degrees(np.arctan2(edges[:, 1], edges[:, 0])) % 90, 9))
+    best_angle, best_area = 0.0, np.inf
+    for angle in angles:
+        local = hull @ rotation_matrix(-angle).T
+        extent = local.max(axis=0) - local.min(axis=0)
+        area = extent[0] * extent[1]
+        if area < best_area - 1e-9:
+            best_angle, best_area = float(angle), area
+    return best_angle
+
+
+def drawn_rotation(element):
+    """Rotation of a hand-drawn bounding-box rect, from its CTM."""
+    a, b = element.ctm[0], element.ctm[1]
+    return math.degrees(math.atan2(b, a))
+
+
+def fit_viewbox(box, aspect, padding=STROKE_OFFSET):
+    """Smallest viewBox of the given aspect ratio centered on an (x0, y0, x1, y1) box."""
+    x0, y0, x1, y1 = box
+    width = (x1 - x0) + 2 * padding
+    height = (y1 - y0) + 2 * padding
+    if width / height < aspect:
+        width = height * aspect
+    else:
+        height = width / aspect
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    return [cx - width / 2, cy - height / 2, width, height]
+
+
+def r(value):
+    return round(float(value), 6)
+
+
+def main(labels=None):
+    """Write public/boundingBoxes.json; `labels` may be a shared LabelTable."""
+    labels = load_labels() if labels is None else labels
+    geometry = TreeGeometry(labels)
+    if not geometry.trees:
+        print('{"error": "No tree layers found"}')
+        sys.exit(1)
+
+    svg_width = float(labels.index.root.get('viewBox', '0 0 0 0').split()[2])
+
+    # Orientation per tree: hand-drawn rect if present, minimum-area rectangle otherwise
+    rotations = []
+    sources = {}
+    for tree in geometry.trees:
+        drawn = labels.find(tree, 'bounding-box')
+        if drawn is not None:
+            rotations.append(drawn_rotation(drawn))
+            sources[tree] = 'BoundingBoxes layer'
         else:
-            # No rotation - simple bounding box
-            all_x_coords.extend([x, x + w])
-            all_y_coords.extend([y, y + h])
-
-            # Store corners for consistency
-            tree['corners'] = [
-                (x, y),
-                (x + w, y),
-                (x + w, y + h),
-                (x, y + h)
-            ]
-
-    min_x = min(all_x_coords)
-    max_x = max(all_x_coords)
-    min_y = min(all_y_coords)
-    max_y = max(all_y_coords)
+            rotations.append(min_area_rotation(geometry.hull_points(tree)))
+            sources[tree] = 'minimum-area rectangle'
+
+    oriented = geometry.bounds(rotations)
+    aligned = geometry.bounds()
+
+    trees = {}
+    for t, tree in enumerate(geometry.trees):
+        x0, y0, x1, y1 = oriented[t]
+        local_corners = np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1)])
+        corners = local_corners @ rotation_matrix(rotations[t]).T
+        ax0, ay0, ax1, ay1 = aligned[t]
+        trees[tree] = {
+            'name': f'Tree {tree}',
+            'width': r(x1 - x0),
+            'height': r(y1 - y0),
+            'x': r(x0),
+            'y': r(y0),
+            'rotation': r(rotations[t]),
+            'corners': [[r(cx), r(cy)] for cx, cy in corners],
+            'bounds': {'x': r(ax0), 'y': r(ay0), 'width': r(ax1 - ax0), 'height': r(ay1 - ay0)},
+        }
 
+    min_x, min_y = aligned[:, 0].min(), aligned[:, 1].min()
+    max_x, max_y = aligned[:, 2].max(), aligned[:, 3].max()
     overall_bbox = {
-        'x': min_x,
-        'y': min_y,
-        'width': max_x - min_x,
-        'height': max_y - min_y,
-        'centerX': (min_x + max_x) / 2,
-        'centerY': (min_y + max_y) / 2
+        'x': r(min_x),
+        'y': r(min_y),
+        'width': r(max_x - min_x),
+        'height': r(max_y - min_y),
+        'centerX': r((min_x + max_x) / 2),
+        'centerY': r((min_y + max_y) / 2),
     }
 
+    # zoom: factor at which a viewport of that aspect, as wide as the SVG
+    # container, shows exactly the viewBox
+    boxes = {tree: aligned[t] for t, tree in enumerate(geometry.trees)}
+    boxes['overall'] = (min_x, min_y, max_x, max_y)
+    viewports = {}
+    for name, box in boxes.items():
+        presets = {}
+        for aspect_name, aspect in ASPECT_RATIOS.items():
+            view_box = fit_viewbox(box, aspect)
+            presets[aspect_name] = {
+                'viewBox': [r(v) for v in view_box],
+                'zoom': r(svg_width / view_box[2]) if svg_width else None,
+            }
+        viewports[name] = presets
+
     output = {
         'trees': trees,
-        'overallBoundingBox': overall_bbox
+        'overallBoundingBox': overall_bbox,
+        'viewports': viewports,
     }
 
-    print(json.dumps(output, indent=2))
-else:
-    print('{"error": "No bounding boxes found"}')
+    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2)
+        f.write('\n')
+
+    for tree in geometry.trees:
+        data = trees[tree]
+        print(f"Tree {tree}: {data['width']:.2f} x {data['height']:.2f} at {data['rotation']:.2f} deg "
+              f"({sources[tree]})")
+    print(f"Overall: {overall_bbox['width']:.2f} x {overall_bbox['height']:.2f}")
+    print(f"Saved bounding boxes and {len(ASPECT_RATIOS)} viewport presets per tree to {OUTPUT_PATH.name}")
+
+
+if __name__ == '__main__':
+    main()
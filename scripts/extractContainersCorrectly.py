@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
 """
 Extract containers EXACTLY as they appear in the SVG, preserving order and labels
+
+With --data, writes data/overlayData.json (see overlay_data.py) instead of
+printing JSX.
 """
 
-import re
-from pathlib import Path
+import argparse
 
-svg_path = Path(__file__).parent.parent / 'assets' / 'ARtreeforweb.svg'
-svg_content = svg_path.read_text(encoding='utf-8')
+from svg_labels import load_labels
 
-# Pattern to match: path element with BOTH d attribute and inkscape:label on it
-# The label is an attribute on the path element itself, after the d attribute
-# Match: <path ... d="..." ... inkscape:label="Tree X container node Y"
-pattern = r'<path[^>]*\s+d="([^"]+)"[^>]*inkscape:label="Tree ([A-D]) container node ([^"]+)"'
+parser = argparse.ArgumentParser(description='Print container JSX in SVG order')
+parser.add_argument('--data', action='store_true', help='write data/overlayData.json instead')
+if parser.parse_args().data:
+    from overlay_data import write
+    write()
+    raise SystemExit
 
-matches = re.findall(pattern, svg_content)
+# Container paths in document order, labels parsed by the shared grammar
+matches = [(parsed, element) for parsed, element in load_labels().items('container')
+           if element.tag == 'path' and element.get('d')]
 
 print(f"Found {len(matches)} containers in SVG\n")
 
@@ -22,12 +27,12 @@ print(f"Found {len(matches)} containers in SVG\n")
 print("// Containers in exact SVG order:")
 print("<g id=\"all-point-containers\">")
 
-for path_d, tree, node_id in matches:
-    # Convert label to node ID: "A" + "0" -> "tree-a-node-0"
-    # Replace spaces with dashes for capstone nodes (e.g., "2-6 3-3" -> "2-6-3-3")
-    node_id_normalized = node_id.replace(' ', '-')
-    skill_id = f"tree-{tree.lower()}-node-{node_id_normalized}"
-    container_id = f"container-{tree.lower()}-{node_id_normalized.lower()}"
+for parsed, element in matches:
+    # "Tree A container node 2-6 3-3" -> tree-a-node-2-6-3-3 / container-a-2-6-3-3
+    path_d = element.get('d')
+    tree, node_id = parsed.tree, parsed.node
+    skill_id = parsed.skill_id
+    container_id = parsed.container_id
 
     print(f"  {{/* Tree {tree} container node {node_id} */}}")
     print(f"  {{shouldShowContainer('{skill_id}') && (")
@@ -1,124 +1,133 @@
 #!/usr/bin/env python3
 """
 Extract all lock icon groups from SVG and convert to React JSX
+
+With --data, writes data/overlayData.json (see overlay_data.py) instead of
+locks_output.txt.
 """
 
+import argparse
 import re
 from pathlib import Path
+from xml.sax.saxutils import escape
 
-svg_path = Path(__file__).parent.parent / 'assets' / 'ARtreeforweb.svg'
-output_path = Path(__file__).parent / 'locks_output.txt'
-
-with open(svg_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+from svg_index import SVG_PATH, load_index
+from svg_labels import LabelTable
 
-# Find lock groups with their content
-# Pattern to match entire group from opening to closing tag
-lock_groups = []
-
-lines = content.split('\n')
-i = 0
-while i < len(lines):
-    line = lines[i]
+svg_path = SVG_PATH
+output_path = Path(__file__).parent / 'locks_output.txt'
 
-    # Look for group with "Tree X lock Y" label
-    match = re.search(r'inkscape:label="Tree ([A-D]) lock ([^"]+)"', line)
-    if match:
-        tree_id = match.group(1)
-        node_id = match.group(2)
 
-        # Extract the entire group
-        group_lines = [line]
-        depth = line.count('<g') - line.count('</g>')
+def serialize(index, element, depth=0, keep_id=True):
+    """Write an indexed element back out as SVG markup, one attribute per line."""
+    pad = ' ' * (3 + 2 * depth)
+    attrs = [(name, value) for name, value in element.attrib.items()
+             if keep_id or name != 'id']
+    markup = f'<{element.tag}'
+    markup += ''.join(f'\n{pad}{name}="{escape(value, {chr(34): "&quot;"})}"' for name, value in attrs)
+    children = index.children(element)
+    if not children:
+        return markup + ' />'
+    return markup + '>' + ''.join(serialize(index, child, depth + 1) for child in children) + f'</{element.tag}>'
 
-        j = i + 1
-        while depth > 0 and j < len(lines):
-            group_lines.append(lines[j])
-            depth += lines[j].count('<g') - lines[j].count('</g>')
-            j += 1
 
-        group_content = '\n'.join(group_lines)
+def main(index=None):
+    """Write locks_output.txt; `index` may be a shared SvgIndex."""
+    # Find lock groups through the shared label table, in document order
+    index = load_index(svg_path) if index is None else index
+    lock_groups = []
 
+    for parsed, element in LabelTable(index).items('lock'):
         lock_groups.append({
-            'tree': tree_id,
-            'node': node_id,
-            'content': group_content
+            'tree': parsed.tree,
+            'node': parsed.node,
+            'lock_id': parsed.lock_id,
+            # The group id is replaced by the lock id below
+            'content': serialize(index, element, keep_id=False)
         })
 
-    i += 1
-
-print(f"Found {len(lock_groups)} lock groups")
-
-# Convert to JSX
-output_lines = []
-output_lines.append('{/* All Lock Icons - 16 total across all trees */}')
-output_lines.append('<g id="all-lock-icons">')
-
-for lock in lock_groups:
-    tree = lock['tree']
-    node = lock['node']
-    content = lock['content']
-
-    output_lines.append(f"  {{/* Tree {tree} lock {node} */}}")
-
-    # Clean up SVG to JSX conversion
-    # Remove inkscape and sodipodi attributes
-    content = re.sub(r'\s+inkscape:[^=]+="[^"]*"', '', content)
-    content = re.sub(r'\s+sodipodi:[^=]+="[^"]*"', '', content)
-
-    # Add custom ID to the main group
-    content = re.sub(r'(<g\s+)', f'<g id="lock-{tree.lower()}-{node}" ', content, count=1)
-
-    # Add visibility="hidden" to the main group
-    content = re.sub(r'(<g[^>]*)(>)', r'\1 visibility="hidden"\2', content, count=1)
-
-    # Convert style attribute values to JSX format
-    def style_to_jsx(match):
-        style_str = match.group(1)
-        # Convert CSS properties to camelCase and wrap in object notation
-        style_str = re.sub(r'mix-blend-mode', 'mixBlendMode', style_str)
-        style_str = re.sub(r'fill-opacity', 'fillOpacity', style_str)
-        style_str = re.sub(r'fill-rule', 'fillRule', style_str)
-        style_str = re.sub(r'stroke-width', 'strokeWidth', style_str)
-        style_str = re.sub(r'stroke-dasharray', 'strokeDasharray', style_str)
-        style_str = re.sub(r'stroke-opacity', 'strokeOpacity', style_str)
-        style_str = re.sub(r'stroke-linecap', 'strokeLinecap', style_str)
-        style_str = re.sub(r'stroke-miterlimit', 'strokeMiterlimit', style_str)
-
-        # Convert semicolon-separated CSS to comma-separated JS object
-        props = []
-        for prop in style_str.split(';'):
-            prop = prop.strip()
-            if ':' in prop:
-                key, value = prop.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Handle url() values
-                if 'url(' in value:
-                    value = f'"{value}"'
-                else:
-                    value = f'"{value}"'
-
-                props.append(f'{key}: {value}')
-
-        return f'style={{{{{", ".join(props)}}}}}'
-
-    content = re.sub(r'style="([^"]*)"', style_to_jsx, content)
-
-    # Indent properly
-    lines = content.split('\n')
-    indented_lines = []
-    for line in lines:
-        if line.strip():
-            indented_lines.append('  ' + line)
-
-    output_lines.append('\n'.join(indented_lines))
-
-output_lines.append('</g>')
-
-# Write output
-with open(output_path, 'w', encoding='utf-8') as f:
-    f.write('\n'.join(output_lines))
-
-print(f"Wrote {len(lock_groups)} lock groups to {output_path}")
+    print(f"Found {len(lock_groups)} lock groups")
+
+    # Convert to JSX
+    output_lines = []
+    output_lines.append('{/* All Lock Icons - 16 total across all trees */}')
+    output_lines.append('<g id="all-lock-icons">')
+
+    for lock in lock_groups:
+        tree = lock['tree']
+        node = lock['node']
+        content = lock['content']
+
+        output_lines.append(f"  {{/* Tree {tree} lock {node} */}}")
+
+        # Clean up SVG to JSX conversion
+        # Remove inkscape and sodipodi attributes
+        content = re.sub(r'\s+inkscape:[^=]+="[^"]*"', '', content)
+        content = re.sub(r'\s+sodipodi:[^=]+="[^"]*"', '', content)
+
+        # Add custom ID to the main group
+        content = re.sub(r'(<g\s+)', f'<g id="{lock["lock_id"]}" ', content, count=1)
+
+        # Add visibility="hidden" to the main group
+        content = re.sub(r'(<g[^>]*)(>)', r'\1 visibility="hidden"\2', content, count=1)
+
+        # Convert style attribute values to JSX format
+        def style_to_jsx(match):
+            style_str = match.group(1)
+            # Convert CSS properties to camelCase and wrap in object notation
+            style_str = re.sub(r'mix-blend-mode', 'mixBlendMode', style_str)
+            style_str = re.sub(r'fill-opacity', 'fillOpacity', style_str)
+            style_str = re.sub(r'fill-rule', 'fillRule', style_str)
+            style_str = re.sub(r'stroke-width', 'strokeWidth', style_str)
+            style_str = re.sub(r'stroke-dasharray', 'strokeDasharray', style_str)
+            style_str = re.sub(r'stroke-opacity', 'strokeOpacity', style_str)
+            style_str = re.sub(r'stroke-linecap', 'strokeLinecap', style_str)
+            style_str = re.sub(r'stroke-miterlimit', 'strokeMiterlimit', style_str)
+
+            # Convert semicolon-separated CSS to comma-separated JS object
+            props = []
+            for prop in style_str.split(';'):
+                prop = prop.strip()
+                if ':' in prop:
+                    key, value = prop.split(':', 1)
+                    key = key.strip()
+                    value = value.strip()
+
+                    # Handle url() values
+                    if 'url(' in value:
+                        value = f'"{value}"'
+                    else:
+                        value = f'"{value}"'
+
+                    props.append(f'{key}: {value}')
+
+            return f'style={{{{{", ".join(props)}}}}}'
+
+        content = re.sub(r'style="([^"]*)"', style_to_jsx, content)
+
+        # Indent properly
+        lines = content.split('\n')
+        indented_lines = []
+        for line in lines:
+            if line.strip():
+                indented_lines.append('  ' + line)
+
+        output_lines.append('\n'.join(indented_lines))
+
+    output_lines.append('</g>')
+
+    # Write output
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(output_lines))
+
+    print(f"Wrote {len(lock_groups)} lock groups to {output_path}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write lock icon JSX to locks_output.txt')
+    parser.add_argument('--data', action='store_true', help='write data/overlayData.json instead')
+    if parser.parse_args().data:
+        from overlay_data import write
+        write()
+    else:
+        main()
@@ -1,20 +1,17 @@
 #!/usr/bin/env python3
-import xml.etree.ElementTree as ET
 import json
 
-# Parse SVG
-tree = ET.parse('../assets/ArcRaidersTree.svg')
-root = tree.getroot()
+from svg_index import load_index
 
-# Define namespace
-ns = {'svg': 'http://www.w3.org/2000/svg', 'inkscape': 'http://www.inkscape.org/namespaces/inkscape'}
+# Load the shared SVG index (cached on disk, keyed on the SVG content hash)
+index = load_index()
 
 # Extract path data
 path_data = {}
 
 # Find all path elements
-for path in root.findall('.//svg:path', ns):
-    path_id = path.get('id')
+for path in index.iter('path'):
+    path_id = path.id
     if path_id and path_id.startswith('path'):
         d_attr = path.get('d')
         if d_attr:
@@ -1,32 +1,45 @@
 #!/usr/bin/env python3
-import xml.etree.ElementTree as ET
 import json
+from pathlib import Path
 
-tree = ET.parse('../assets/ArcRaidersTree.svg')
-root = tree.getroot()
+from svg_index import load_index
 
-path_data = {}
+OUTPUT_PATH = Path(__file__).parent / 'pathDataWithLabels.json'
 
-for path_elem in root.iter():
-    if path_elem.tag.endswith('path'):
-        path_id = path_elem.get('id')
+
+def extract(index):
+    """{id: {'d', 'label'}} for every path with an id and a d attribute."""
+    path_data = {}
+
+    for path_elem in index.iter('path'):
+        path_id = path_elem.id
         if path_id:
             d_attr = path_elem.get('d')
-            label = path_elem.get('{http://www.inkscape.org/namespaces/inkscape}label', '')
-            
+            label = path_elem.label
+
             if d_attr:
                 path_data[path_id] = {
                     'd': d_attr,
                     'label': label if label else None
                 }
+    return path_data
+
+
+def main(index=None):
+    index = load_index() if index is None else index
+    path_data = extract(index)
+
+    # Save to JSON
+    with open(OUTPUT_PATH, 'w') as f:
+        json.dump(path_data, f, indent=2)
+
+    print(f"Extracted {len(path_data)} paths with labels")
+    print("\nBottom connector paths:")
+    for pid in ['path1', 'path2', 'path21', 'path69']:
+        if pid in path_data:
+            label = path_data[pid]['label'] or 'NO LABEL'
+            print(f"  {pid}: {label}")
 
-# Save to JSON
-with open('pathDataWithLabels.json', 'w') as f:
-    json.dump(path_data, f, indent=2)
 
-print(f"Extracted {len(path_data)} paths with labels")
-print("\nBottom connector paths:")
-for pid in ['path1', 'path2', 'path21', 'path69']:
-    if pid in path_data:
-        label = path_data[pid]['label'] or 'NO LABEL'
-        print(f"  {pid}: {label}")
+if __name__ == '__main__':
+    main()
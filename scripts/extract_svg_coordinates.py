@@ -1,18 +1,13 @@
 #!/usr/bin/env python3
-import xml.etree.ElementTree as ET
-import json
+from svg_index import load_index
 
-# Parse the SVG
-tree = ET.parse('skill-tree-planner/assets/ArcRaidersTree.svg')
-root = tree.getroot()
-
-# Define SVG namespace
-ns = {'svg': 'http://www.w3.org/2000/svg', 'inkscape': 'http://www.inkscape.org/namespaces/inkscape'}
+# Load the shared SVG index
+index = load_index()
 
 # Find all circle elements
 circles = {}
-for circle in root.findall('.//svg:circle', ns):
-    circle_id = circle.get('id')
+for circle in index.iter('circle'):
+    circle_id = circle.id
     if circle_id:
         cx = float(circle.get('cx', 0))
         cy = float(circle.get('cy', 0))
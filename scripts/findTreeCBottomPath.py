@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import xml.etree.ElementTree as ET
 import json
+from pathlib import Path
 
 # Parse SVG
-tree = ET.parse('../assets/ArcRaidersTree.svg')
+tree = ET.parse(Path(__file__).parent.parent / 'assets' / 'ArcRaidersTree.svg')
 root = tree.getroot()
 
 # Find circle86 (Tree C node 0)
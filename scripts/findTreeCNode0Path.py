@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import xml.etree.ElementTree as ET
+from pathlib import Path
 
-tree = ET.parse('../assets/ArcRaidersTree.svg')
+tree = ET.parse(Path(__file__).parent.parent / 'assets' / 'ArcRaidersTree.svg')
 root = tree.getroot()
 
 print("Looking for paths in Tree C group (g100) that connect to node 0:\n")
@@ -4,29 +4,22 @@ Fix container mapping by matching container positions to closest nodes
 """
 
 import re
-import json
-import math
-from pathlib import Path
 
-# Load SVG
-svg_path = Path(__file__).parent.parent / 'assets' / 'ARtreeforweb.svg'
-svg_content = svg_path.read_text(encoding='utf-8')
+from container_matching import match_points
+from skill_config import load_config
+from svg_labels import load_labels
+from svg_transforms import apply, tree_matrices
 
 # Load config
-config_path = Path(__file__).parent.parent / 'data' / 'config' / 'skillTreeConfig.json'
-config = json.loads(config_path.read_text())
+config = load_config()
 
-# Tree transforms
-transforms = {
-    'A': (0.82544171, 0.56448736, 0.56221371, -0.82211698, 81.266847, 463.85256),
-    'B': (0.89936804, -0.43717992, -0.43524462, -0.89585089, 610.80536, 537.82782),
-    'C': (-0.52573371, -0.85068281, -0.84681827, 0.52357993, 572.66577, 88.767464),
-    'D': (-0.43320549, 0.90128931, 0.89741215, 0.43171024, 39.071412, -145.14677)
-}
+# Tree transforms, read from the SVG tree layers
+transforms = tree_matrices()
 
 # Extract all containers by tree
-pattern = r'inkscape:label="Tree ([A-D]) container node ([^"]+)"[^>]*\/><path[^>]*\s+d="([^"]+)"'
-all_containers = re.findall(pattern, svg_content)
+all_containers = [(parsed.tree, parsed.node, element.get('d'))
+                  for parsed, element in load_labels().items('container')
+                  if element.get('d')]
 
 print(f"Found {len(all_containers)} containers total")
 print()
@@ -36,11 +29,11 @@ for tree_letter in ['A', 'B', 'C', 'D']:
     print(f"=== Tree {tree_letter} ===")
 
     # Get nodes for this tree
-    tree_nodes = {node['id']: (node['x'], node['y'])
-                  for node in config['trees'][tree_letter]['nodes']}
+    nodes = config.trees[tree_letter].nodes
 
-    # Get transform
-    a, b, c, d, e, f = transforms[tree_letter]
+    # Transform all node positions of the tree at once
+    positions = apply(transforms[tree_letter], [(node.x, node.y) for node in nodes])
+    tree_nodes = {node.id: (float(x), float(y)) for node, (x, y) in zip(nodes, positions)}
 
     # Get containers for this tree
     tree_containers = [(label, path_d) for tree, label, path_d in all_containers
@@ -48,34 +41,29 @@ for tree_letter in ['A', 'B', 'C', 'D']:
 
     print(f"Nodes: {len(tree_nodes)}, Containers: {len(tree_containers)}")
 
-    # For each container, find closest node
-    mappings = []
+    # Extract starting position of each container path
+    starts = {}
     for label, path_d in tree_containers:
-        # Extract starting position from path
         coord_match = re.search(r'm\s+([\d.]+),([\d.]+)', path_d)
-        if not coord_match:
-            continue
-        cx, cy = float(coord_match.group(1)), float(coord_match.group(2))
-
-        # Find closest node
-        min_dist = float('inf')
-        closest_node_id = None
-        for node_id, (nx, ny) in tree_nodes.items():
-            # Transform node position
-            tx = a * nx + c * ny + e
-            ty = b * nx + d * ny + f
-            dist = math.sqrt((tx - cx)**2 + (ty - cy)**2)
-            if dist < min_dist:
-                min_dist = dist
-                closest_node_id = node_id
-
-        mappings.append((closest_node_id, path_d, label, cx, cy, min_dist))
+        if coord_match:
+            starts[label] = (float(coord_match.group(1)), float(coord_match.group(2)), path_d)
+
+    # Optimal one-to-one assignment of containers to nodes
+    result = match_points(list(starts), [(cx, cy) for cx, cy, _ in starts.values()],
+                          list(tree_nodes), list(tree_nodes.values()))
+
+    mappings = []
+    for match in result.matches:
+        cx, cy, path_d = starts[match.source]
+        mappings.append((match.target, path_d, match.source, cx, cy, match.distance))
+    for label in result.unmatched_sources:
+        print(f"  WARNING: container '{label}' has no node left to match")
 
     # Sort by node_id to get correct order
     mappings.sort(key=lambda x: x[0])
 
     # Generate TSX
-    print(f"\n  {/* Tree {tree_letter} Containers */}")
+    print(f"\n  {{/* Tree {tree_letter} Containers */}}")
     for node_id, path_d, orig_label, cx, cy, dist in mappings:
         container_id = node_id.replace('tree-', 'container-').replace('-node-', '-')
         print(f"  {{/* {node_id} (was labeled '{orig_label}', dist={dist:.1f}) */}}")
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 import re
+from pathlib import Path
+
+tsx_path = Path(__file__).parent.parent / 'components' / 'SkillTree.tsx'
 
 # Read the file
-with open('skill-tree-planner/components/SkillTree.tsx', 'r') as f:
+with open(tsx_path, 'r') as f:
     content = f.read()
 
 # Pattern to match container paths with their IDs
@@ -23,7 +26,7 @@ def replace_stroke(match):
 new_content = re.sub(pattern, replace_stroke, content)
 
 # Write back
-with open('skill-tree-planner/components/SkillTree.tsx', 'w') as f:
+with open(tsx_path, 'w') as f:
     f.write(new_content)
 
 print("✓ Updated all container stroke colors to use getNodeColor()")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Generate level-of-detail variants of data/pathData.json
+
+Every connector path is written once per LOD with a guaranteed maximum
+deviation (in SVG user units) from the original geometry:
+
+    1. flatten the cubics into a polyline          (error budget: 1/4)
+    2. Douglas-Peucker simplification              (error budget: 1/2)
+    3. quantize to the coarsest grid that fits     (error budget: 1/4)
+
+The quantized original curves are tried as well and whichever `d` string is
+shorter is kept, so curved paths never grow into long polylines. The
+deviation of every output path is then measured against a dense sampling of
+the original in both directions and checked against the LOD's bound.
+
+Writes data/pathData.<lod>.json (same {svgId: d} shape as pathData.json) and
+data/pathDataLods.json, a manifest the client can use to pick a payload:
+
+    {"source": {...}, "levels": [{"name", "file", "maxError", "measuredError", "bytes"}]}
+
+Usage:
+    python generatePathLods.py [--levels lod1=0.05 lod2=0.2 lod3=0.6]
+"""
+
+import argparse
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from svg_paths import cubic_points, flatten, parse_path, polyline_geometry
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+SOURCE_PATH = DATA_DIR / 'pathData.json'
+MANIFEST_PATH = DATA_DIR / 'pathDataLods.json'
+
+# name -> maximum deviation in SVG user units
+DEFAULT_LEVELS = {'lod1': 0.05, 'lod2': 0.2, 'lod3': 0.6}
+
+# Samples per segment when measuring deviation
+SAMPLES = 32
+
+
+def douglas_peucker(points, tolerance):
+    """Indices of the points kept by Douglas-Peucker simplification."""
+    count = len(points)
+    if count <= 2:
+        return np.arange(count)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        inner = points[first + 1:last]
+        distances = point_segment_distances(inner, points[first][None], points[last][None])[:, 0]
+        worst = int(np.argmax(distances))
+        if distances[worst] > tolerance:
+            index = first + 1 + worst
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return np.flatnonzero(keep)
+
+
+def point_segment_distances(points, starts, ends):
+    """(N, M) distances from N points to M segments."""
+    direction = ends - starts
+    length_sq = np.einsum('md,md->m', direction, direction)
+    offset = points[:, None, :] - starts[None, :, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.einsum('nmd,md->nm', offset, direction) / length_sq
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+    nearest = starts[None, :, :] + t[..., None] * direction[None, :, :]
+    return np.linalg.norm(points[:, None, :] - nearest, axis=2)
+
+
+def precision_for(error):
+    """Decimals whose rounding moves a point by at most `error` (half a step on both axes)."""
+    return max(0, math.ceil(-math.log10(error / (0.5 * math.sqrt(2)))))
+
+
+def simplify(geometry, max_error):
+    """Shortest `d` for the geometry within max_error."""
+    precision = precision_for(max_error / 4)
+
+    polylines = []
+    for points, closed in flatten(geometry, max_error / 4):
+        kept = douglas_peucker(points, max_error / 2)
+        polylines.append((points[kept], closed))
+    simplified = polyline_geometry(polylines)
+    candidates = [simplified.to_relative_d(precision) if len(simplified) else None,
+                  geometry.to_relative_d(precision_for(max_error))]
+    return min((d for d in candidates if d), key=len)
+
+
+def sample(geometry):
+    """Dense points along the geometry (segment-less paths: the move point)."""
+    if not len(geometry.segments):
+        return np.asarray(geometry.start, dtype=np.float64).reshape(1, 2)
+    t = np.linspace(0.0, 1.0, SAMPLES)
+    return cubic_points(geometry.segments, t).reshape(-1, 2)
+
+
+def deviation(original, simplified, resolution):
+    """Symmetric max distance between two paths (densely sampled vs. flattened)."""
+    def distance(from_geometry, to_geometry):
+        points = sample(from_geometry)
+        chords = []
+        for p, closed in flatten(to_geometry, resolution):
+            if closed:
+                p = np.concatenate([p, p[:1]])
+            if len(p) > 1:
+                chords.append((p[:-1], p[1:]))
+        if not chords:
+            target = np.asarray(to_geometry.start, dtype=np.float64).reshape(1, 2)
+            return float(np.linalg.norm(points - target, axis=1).max())
+        starts = np.concatenate([s for s, _ in chords])
+        ends = np.concatenate([e for _, e in chords])
+        return float(point_segment_distances(points, starts, ends).min(axis=1).max())
+
+    # Flattening the measured side adds at most `resolution`
+    return max(distance(original, simplified), distance(simplified, original)) + resolution
+
+
+def minified_size(data):
+    return len(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+
+def patch(path_data, path_ids):
+    """
+    Re-simplify only `path_ids` in the existing LOD files (used by watch.py).
+
+    Entries follow the order of path_data, as in a full run. measuredError
+    can only grow here, so it stays an upper bound until the next full run
+    measures every path again. Returns the names of the files written.
+    """
+    from tsx_edit import write_if_changed
+
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding='utf-8'))
+    manifest['source'].update(bytes=minified_size(path_data), paths=len(path_data))
+    geometries = {path_id: parse_path(path_data[path_id])
+                  for path_id in path_ids if path_id in path_data}
+
+    written = []
+    for level in manifest['levels']:
+        max_error = level['maxError']
+        output_path = DATA_DIR / level['file']
+        lod_data = json.loads(output_path.read_text(encoding='utf-8'))
+        for path_id, geometry in geometries.items():
+            d = simplify(geometry, max_error)
+            measured = deviation(geometry, parse_path(d), max_error / 100)
+            if measured > max_error:
+                raise ValueError(f"{level['name']}: {path_id} deviates {measured:.4f} (max {max_error})")
+            lod_data[path_id] = d
+            level['measuredError'] = round(max(level['measuredError'], measured), 6)
+        lod_data = {path_id: lod_data[path_id] for path_id in path_data if path_id in lod_data}
+        level['bytes'] = minified_size(lod_data)
+        if write_if_changed(output_path, json.dumps(lod_data, indent=2) + '\n'):
+            written.append(output_path.name)
+
+    if write_if_changed(MANIFEST_PATH, json.dumps(manifest, indent=2) + '\n'):
+        written.append(MANIFEST_PATH.name)
+    return written
+
+
+def parse_levels(values):
+    levels = {}
+    for value in values:
+        name, _, error = value.partition('=')
+        levels[name] = float(error)
+    return levels
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write LOD variants of data/pathData.json')
+    parser.add_argument('--levels', nargs='+', metavar='NAME=ERROR',
+                        help='LOD names and max deviations in user units '
+                             '(default: lod1=0.05 lod2=0.2 lod3=0.6)')
+    args = parser.parse_args()
+    levels = parse_levels(args.levels) if args.levels else DEFAULT_LEVELS
+
+    source_text = SOURCE_PATH.read_text(encoding='utf-8')
+    path_data = json.loads(source_text)
+    geometries = {path_id: parse_path(d) for path_id, d in path_data.items()}
+
+    source_bytes = minified_size(path_data)
+    manifest = {
+        'source': {'file': SOURCE_PATH.name, 'bytes': source_bytes, 'paths': len(path_data)},
+        'levels': [],
+    }
+
+    print(f"{SOURCE_PATH.name}: {len(path_data)} paths, {source_bytes:,} bytes (minified)")
+    print(f"\n{'LOD':<8}{'max error':>10}{'measured':>10}{'bytes':>10}{'saved':>8}")
+
+    for name, max_error in sorted(levels.items(), key=lambda item: item[1]):
+        lod_data = {}
+        measured = 0.0
+        for path_id, geometry in geometries.items():
+            d = simplify(geometry, max_error)
+            lod_data[path_id] = d
+            measured = max(measured, deviation(geometry, parse_path(d), max_error / 100))
+
+        if measured > max_error:
+            raise SystemExit(f"{name}: measured deviation {measured:.4f} exceeds {max_error}")
+
+        output_path = DATA_DIR / f'{SOURCE_PATH.stem}.{name}.json'
+        text = json.dumps(lod_data, indent=2) + '\n'
+        output_path.write_text(text, encoding='utf-8')
+
+        size = minified_size(lod_data)
+        manifest['levels'].append({
+            'name': name,
+            'file': output_path.name,
+            'maxError': max_error,
+            'measuredError': round(measured, 6),
+            'bytes': size,
+        })
+        print(f"{name:<8}{max_error:>10g}{measured:>10.4f}{size:>10,}{100 * (1 - size / source_bytes):>7.1f}%")
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+    print(f"\nSaved {len(manifest['levels'])} LOD files and {MANIFEST_PATH.name}")
+
+
+if __name__ == '__main__':
+    main()
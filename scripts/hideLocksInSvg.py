@@ -4,9 +4,11 @@ Add visibility="hidden" to all lock groups in the SVG file
 """
 
 import re
-from pathlib import Path
 
-svg_path = Path(__file__).parent.parent / 'assets' / 'ARtreeforweb.svg'
+from svg_index import SVG_PATH
+from svg_labels import parse_label
+
+svg_path = SVG_PATH
 
 with open(svg_path, 'r', encoding='utf-8') as f:
     content = f.read()
@@ -15,6 +17,10 @@ with open(svg_path, 'r', encoding='utf-8') as f:
 # and add visibility="hidden" to them
 def add_visibility(match):
     group_element = match.group(0)
+    label = re.search(r'inkscape:label="([^"]*)"', group_element)
+    parsed = parse_label(label.group(1)) if label else None
+    if not parsed or parsed.kind != 'lock':
+        return group_element
     # Check if visibility is already set
     if 'visibility=' in group_element:
         # Replace existing visibility
@@ -24,11 +30,10 @@ def add_visibility(match):
         group_element = re.sub(r'(<g[^>]*)(>)', r'\1 visibility="hidden"\2', group_element, count=1)
     return group_element
 
-# Pattern to match group elements with lock labels
-# Match the entire group from <g to its closing </g>
-pattern = r'<g[^>]*inkscape:label="Tree [A-D] lock [^"]*"[^>]*>.*?</g>'
+# Match every opening <g> tag; add_visibility only touches lock groups
+pattern = r'<g\b[^>]*>'
 
-content = re.sub(pattern, add_visibility, content, flags=re.DOTALL)
+content = re.sub(pattern, add_visibility, content)
 
 # Write back
 with open(svg_path, 'w', encoding='utf-8') as f:
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Production optimizer for assets/ArcRaidersTree.svg
+
+Writes a minified copy of the SVG (the Inkscape source is never touched):
+
+- removes editor metadata (sodipodi:namedview, inkscape:path-effect,
+  sodipodi:* / inkscape:* attributes, -inkscape-* style properties) while
+  keeping inkscape:label and inkscape:groupmode, so the output can still be
+  read with svg_index / svg_labels
+- de-duplicates <defs> entries (e.g. the copied blur filters) and rewrites
+  url(#...) / href references to the surviving entry, then drops unused defs
+- collapses redundant groups (attribute-less groups, and single-child groups
+  that only carry a transform)
+- drops ids nothing refers to
+- rewrites path data as compact relative commands on a 10**-precision grid
+  and rounds shape attributes; the precision is raised per element whenever
+  its transform would magnify the rounding beyond --max-error
+
+Ids and labels the frontend and scripts rely on are always kept: every
+labeled element, every svgId in the skill tree configs, every pathData key,
+every id quoted in components/*.tsx and everything that is referenced.
+
+After writing, the output is re-indexed and checked (labels, protected ids,
+geometric error) and a byte-savings report is printed.
+
+Usage:
+    python optimizeSvg.py [input.svg] [-o output.svg] [--precision 3] [--max-error 0.01]
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import zlib
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+from svg_index import NAMESPACES, SVG_PATH, build_index
+from svg_labels import LabelTable
+from svg_paths import parse_path
+from svg_transforms import IDENTITY, apply_segments, multiply, parse_transform, scale_factor
+
+REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_OUTPUT = REPO_ROOT / 'assets' / 'ArcRaidersTree.min.svg'
+
+CONFIG_PATHS = [
+    REPO_ROOT / 'data' / 'config' / 'skillTreeConfig.json',
+    REPO_ROOT / 'data' / 'proto' / 'skillTreeConfig.json',
+    REPO_ROOT / 'config' / 'skill-tree-config.json',
+]
+PATH_DATA_PATH = REPO_ROOT / 'data' / 'pathData.json'
+COMPONENTS_DIR = REPO_ROOT / 'components'
+
+SVG_NS = NAMESPACES['svg']
+EDITOR_NAMESPACES = (NAMESPACES['inkscape'], NAMESPACES['sodipodi'])
+KEEP_EDITOR_ATTRS = {f"{{{NAMESPACES['inkscape']}}}label", f"{{{NAMESPACES['inkscape']}}}groupmode"}
+XML_SPACE = f"{{{NAMESPACES['xml']}}}space"
+HREF_ATTRS = ('href', f"{{{NAMESPACES['xlink']}}}href")
+
+URL_RE = re.compile(r'url\(\s*#([^)\s]+)\s*\)')
+TSX_STRING_RE = re.compile(r'''["'`]#?([A-Za-z][\w-]*)["'`]''')
+
+# Shape attributes holding lengths/coordinates in user units
+GEOMETRY_ATTRS = ('x', 'y', 'width', 'height', 'cx', 'cy', 'r', 'rx', 'ry', 'x1', 'y1', 'x2', 'y2')
+
+
+def local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def namespace(name):
+    return name[1:].split('}', 1)[0] if name.startswith('{') else None
+
+
+class Stats:
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, key, amount=1):
+        self.counts[key] = self.counts.get(key, 0) + amount
+
+
+def protected_ids():
+    """Ids referenced from outside the SVG."""
+    ids = set()
+
+    def collect(value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key == 'svgId' and isinstance(item, str):
+                    ids.add(item)
+                else:
+                    collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+
+    for config_path in CONFIG_PATHS:
+        if config_path.exists():
+            collect(json.loads(config_path.read_text(encoding='utf-8')))
+    if PATH_DATA_PATH.exists():
+        ids.update(json.loads(PATH_DATA_PATH.read_text(encoding='utf-8')))
+    for component in sorted(COMPONENTS_DIR.glob('*.tsx')):
+        ids.update(TSX_STRING_RE.findall(component.read_text(encoding='utf-8')))
+    return ids
+
+
+def references(element):
+    """Ids an element points at through url(#...) or href="#..."."""
+    found = []
+    for name, value in element.attrib.items():
+        found.extend(URL_RE.findall(value))
+        if name in HREF_ATTRS and value.startswith('#'):
+            found.append(value[1:])
+    return found
+
+
+def rewrite_references(root, replacements):
+    for element in root.iter():
+        for name, value in list(element.attrib.items()):
+            new_value = URL_RE.sub(lambda m: f'url(#{replacements.get(m.group(1), m.group(1))})', value)
+            if name in HREF_ATTRS and new_value.startswith('#'):
+                new_value = '#' + replacements.get(new_value[1:], new_value[1:])
+            if new_value != value:
+                element.set(name, new_value)
+
+
+def referenced_ids(root):
+    return {ref for element in root.iter() for ref in references(element)}
+
+
+def strip_metadata(root, stats):
+    for parent in root.iter():
+        for child in list(parent):
+            if not isinstance(child.tag, str) or namespace(child.tag) in EDITOR_NAMESPACES \
+                    or local(child.tag) == 'metadata':
+                parent.remove(child)
+                stats.add('editor elements removed')
+
+    for element in root.iter():
+        for name in list(element.attrib):
+            if (namespace(name) in EDITOR_NAMESPACES and name not in KEEP_EDITOR_ATTRS) or name == XML_SPACE:
+                del element.attrib[name]
+                stats.add('editor attributes removed')
+        style = element.get('style')
+        if style:
+            declarations = [d.strip() for d in style.split(';') if d.strip()]
+            kept = [d for d in declarations if not d.startswith('-inkscape-')]
+            if len(kept) != len(declarations):
+                stats.add('editor style properties removed', len(declarations) - len(kept))
+            if kept:
+                element.set('style', ';'.join(kept))
+            else:
+                del element.attrib['style']
+
+
+def signature(element):
+    """Structural identity of a defs entry, ignoring its own id and child ids."""
+    attrs = tuple(sorted((k, v) for k, v in element.attrib.items() if k != 'id'))
+    return (element.tag, attrs, (element.text or '').strip(), tuple(signature(child) for child in element))
+
+
+def dedupe_defs(root, keep, stats):
+    """Merge structurally identical defs entries until nothing changes."""
+    while True:
+        replacements = {}
+        for defs in root.iter(f'{{{SVG_NS}}}defs'):
+            seen = {}
+            for child in list(defs):
+                child_id = child.get('id')
+                if child_id is None or child_id in keep:
+                    continue
+                key = signature(child)
+                if key in seen:
+                    replacements[child_id] = seen[key]
+                    defs.remove(child)
+                else:
+                    seen[key] = child_id
+        if not replacements:
+            return
+        stats.add('duplicate defs merged', len(replacements))
+        rewrite_references(root, replacements)
+
+
+def remove_unused_defs(root, keep, stats):
+    while True:
+        used = referenced_ids(root) | keep
+        removed = 0
+        for defs in list(root.iter(f'{{{SVG_NS}}}defs')):
+            for child in list(defs):
+                if child.get('id') not in used:
+                    defs.remove(child)
+                    removed += 1
+        if not removed:
+            break
+        stats.add('unused defs removed', removed)
+
+    for parent in root.iter():
+        for child in list(parent):
+            if local(child.tag) == 'defs' and len(child) == 0:
+                parent.remove(child)
+
+
+def collapse_groups(root, keep, stats):
+    """Inline groups that add nothing but nesting."""
+    def removable(group):
+        if local(group.tag) != 'g':
+            return False
+        if group.get('id') in keep or any(name in KEEP_EDITOR_ATTRS for name in group.attrib):
+            return False
+        extra = set(group.attrib) - {'id', 'transform'}
+        if extra:
+            return False
+        if 'transform' in group.attrib:
+            # Only fold a transform into a single child element
+            return len(group) == 1 and local(group[0].tag) != 'use'
+        return True
+
+    changed = True
+    while changed:
+        changed = False
+        for parent in list(root.iter()):
+            for position, child in enumerate(list(parent)):
+                if not removable(child):
+                    continue
+                transform = child.get('transform')
+                children = list(child)
+                if transform:
+                    inner = children[0].get('transform')
+                    children[0].set('transform', f'{transform} {inner}' if inner else transform)
+                index = list(parent).index(child)
+                parent.remove(child)
+                for offset, grandchild in enumerate(children):
+                    parent.insert(index + offset, grandchild)
+                stats.add('groups collapsed')
+                changed = True
+
+
+def strip_ids(root, keep, stats):
+    used = referenced_ids(root) | keep
+    for element in root.iter():
+        element_id = element.get('id')
+        if element_id is None or element_id in used:
+            continue
+        del element.attrib['id']
+        stats.add('unused ids removed')
+
+
+def element_precision(precision, max_error, magnification):
+    """Smallest precision >= `precision` whose worst-case rounding stays below max_error."""
+    # A snapped control point moves at most half a grid step on both axes
+    needed = math.ceil(-math.log10(max_error / (0.5 * math.sqrt(2) * max(magnification, 1e-12))))
+    return max(precision, needed)
+
+
+def format_number(value, precision):
+    text = f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+    if text in ('', '-0'):
+        return '0'
+    if text.startswith('0.'):
+        return text[1:]
+    if text.startswith('-0.'):
+        return '-' + text[2:]
+    return text
+
+
+def round_geometry(root, precision, max_error, stats):
+    """Rewrite path data and shape attributes, element by element."""
+    stack = [(root, IDENTITY)]
+    while stack:
+        element, parent_ctm = stack.pop()
+        transform = element.get('transform')
+        ctm = multiply(parent_ctm, parse_transform(transform)) if transform else parent_ctm
+        digits = element_precision(precision, max_error, scale_factor(ctm))
+        tag = local(element.tag)
+
+        if tag == 'path' and element.get('d'):
+            original = element.get('d')
+            compact = parse_path(original).to_relative_d(digits)
+            if len(compact) < len(original):
+                element.set('d', compact)
+                stats.add('paths rewritten')
+        elif tag in ('circle', 'ellipse', 'rect', 'line'):
+            for name in GEOMETRY_ATTRS:
+                value = element.get(name)
+                if value is None:
+                    continue
+                try:
+                    element.set(name, format_number(float(value), digits))
+                except ValueError:
+                    continue
+            stats.add('shapes rounded')
+
+        for child in element:
+            stack.append((child, ctm))
+
+
+def serialize(root):
+    """Compact serialization with only the namespace declarations in use."""
+    used = set()
+    for element in root.iter():
+        for name in [element.tag, *element.attrib]:
+            uri = namespace(name)
+            if uri and uri != SVG_NS and uri != NAMESPACES['xml']:
+                used.add(uri)
+    prefixes = {uri: prefix for prefix, uri in NAMESPACES.items()}
+
+    def qname(name):
+        uri = namespace(name)
+        if uri is None or uri == SVG_NS:
+            return local(name)
+        return f'{prefixes.get(uri, "ns")}:{local(name)}'
+
+    parts = []
+
+    def write(element, is_root=False):
+        attrs = []
+        if is_root:
+            attrs.append(f'xmlns="{SVG_NS}"')
+            for uri in sorted(used):
+                attrs.append(f'xmlns:{prefixes[uri]}="{uri}"')
+        attrs.extend(f'{qname(name)}={quoteattr(value)}' for name, value in element.attrib.items())
+        opening = qname(element.tag) + ''.join(' ' + a for a in attrs)
+        text = element.text.strip() if element.text and element.text.strip() else ''
+        if len(element) == 0 and not text:
+            parts.append(f'<{opening}/>')
+        else:
+            parts.append(f'<{opening}>{escape(text)}')
+            for child in element:
+                write(child)
+                if child.tail and child.tail.strip():
+                    parts.append(escape(child.tail.strip()))
+            parts.append(f'</{qname(element.tag)}>')
+
+    write(root, is_root=True)
+    return ''.join(parts)
+
+
+def verify(source_data, output_data, keep, max_error):
+    """Re-index both documents and compare labels, protected ids and geometry."""
+    source = build_index(source_data, 'source', 'source.svg')
+    output = build_index(output_data, 'output', 'output.svg')
+    problems = []
+
+    source_labels, output_labels = LabelTable(source), LabelTable(output)
+    missing_labels = set(source_labels.entries) - set(output_labels.entries)
+    if missing_labels:
+        problems.append(f'{len(missing_labels)} label entries lost, e.g. {sorted(missing_labels, key=str)[:3]}')
+
+    missing_ids = sorted(i for i in keep if i in source.by_id and i not in output.by_id)
+    if missing_ids:
+        problems.append(f'{len(missing_ids)} protected ids lost, e.g. {missing_ids[:5]}')
+
+    worst = 0.0
+    for element in source.iter('path'):
+        twin = output.get(element.id) if element.id else None
+        if twin is None or twin.tag != 'path':
+            continue
+        before = apply_segments(element.ctm, parse_path(element.get('d', '')).segments)
+        after = apply_segments(twin.ctm, parse_path(twin.get('d', '')).segments)
+        if before.shape != after.shape:
+            problems.append(f'{element.id}: segment count changed')
+            continue
+        if len(before):
+            worst = max(worst, float(np.linalg.norm(before - after, axis=-1).max()))
+    if worst > max_error:
+        problems.append(f'max geometric error {worst:.6f} exceeds {max_error}')
+    return problems, worst
+
+
+def optimize(source_data, precision=3, max_error=0.01, strip_images=False):
+    root = ET.fromstring(source_data)
+    stats = Stats()
+
+    labeled = {element.get('id') for element in root.iter()
+               if element.get(f"{{{NAMESPACES['inkscape']}}}label") and element.get('id')}
+    keep = protected_ids() | labeled
+
+    if strip_images:
+        for parent in root.iter():
+            for child in list(parent):
+                if local(child.tag) == 'image':
+                    parent.remove(child)
+                    stats.add('images removed')
+
+    strip_metadata(root, stats)
+    dedupe_defs(root, keep, stats)
+    remove_unused_defs(root, keep, stats)
+    collapse_groups(root, keep, stats)
+    strip_ids(root, keep, stats)
+    round_geometry(root, precision, max_error, stats)
+    return serialize(root).encode('utf-8'), keep, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a minified production copy of the tree SVG')
+    parser.add_argument('input', nargs='?', type=Path, default=SVG_PATH)
+    parser.add_argument('-o', '--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--precision', type=int, default=3,
+                        help='decimals kept in coordinates (default: 3)')
+    parser.add_argument('--max-error', type=float, default=0.01,
+                        help='largest allowed displacement in document units (default: 0.01)')
+    parser.add_argument('--strip-images', action='store_true',
+                        help='also drop embedded <image> elements')
+    args = parser.parse_args()
+
+    source_data = args.input.read_bytes()
+    output_data, keep, stats = optimize(source_data, args.precision, args.max_error, args.strip_images)
+
+    problems, worst = verify(source_data, output_data, keep, args.max_error)
+    if problems:
+        for problem in problems:
+            print(f"ERROR: {problem}", file=sys.stderr)
+        sys.exit(1)
+
+    args.output.write_bytes(output_data)
+
+    before, after = len(source_data), len(output_data)
+    gz_before, gz_after = len(zlib.compress(source_data, 9)), len(zlib.compress(output_data, 9))
+    print(f"Optimized {args.input.name} -> {args.output.name}")
+    for key, count in sorted(stats.counts.items()):
+        print(f"  {key}: {count}")
+    print(f"  max geometric error: {worst:.6f} (limit {args.max_error})")
+    print(f"\n  raw:     {before:>8,} -> {after:>8,} bytes ({100 * (before - after) / before:.1f}% smaller)")
+    print(f"  deflate: {gz_before:>8,} -> {gz_after:>8,} bytes ({100 * (gz_before - gz_after) / gz_before:.1f}% smaller)")
+
+
+if __name__ == '__main__':
+    main()
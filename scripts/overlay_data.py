@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Point container and lock overlay geometry as data instead of unrolled JSX.
+
+Writes data/overlayData.json, imported (with types) through
+data/overlayData.ts, so SkillTree.tsx maps over one array:
+
+    {
+      "lockIcon": {ellipse/rect geometry shared by every lock, in lock-local units},
+      "shapes": [
+        {"nodeId", "tree", "kind": "container", "id", "d", "textX", "textY"},
+        {"nodeId", "tree", "kind": "lock", "id", "d", "textX", "textY",
+         "translateX", "translateY"},
+        ...
+      ]
+    }
+
+Containers keep their SVG outline in `d`; textX/textY is the point number
+anchor (top center, inside the outline). Locks keep the shackle path in `d`,
+their group translation and the icon center in textX/textY.
+
+Usage:
+    python overlay_data.py            # regenerate data/overlayData.json from the SVG
+    python overlay_data.py --check    # exit 1 if the committed file is stale
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from svg_index import load_index
+from svg_labels import LabelTable
+from svg_paths import PathBatch
+from svg_transforms import is_translation, parse_transform
+
+OUTPUT_PATH = Path(__file__).parent.parent / 'data' / 'overlayData.json'
+
+# Point numbers sit this far below the top edge of their container
+TEXT_OFFSET_Y = 5
+
+ELLIPSE_ATTRS = ('cx', 'cy', 'rx', 'ry')
+RECT_ATTRS = ('x', 'y', 'width', 'height', 'rx', 'ry')
+
+
+def text_anchors(path_ds):
+    """Point number (textX, textY) for each container outline, in one batch."""
+    bounds = PathBatch.from_strings(path_ds).bounds()
+    return [(round(float(min_x + max_x) / 2, 2), round(float(min_y) + TEXT_OFFSET_Y, 2))
+            for min_x, min_y, max_x, _ in bounds]
+
+
+def container_shapes(labels, ids=None):
+    """Container entries, optionally only those whose overlay id is in `ids`."""
+    containers = [(parsed, element) for parsed, element in labels.items('container')
+                  if element.tag == 'path' and element.get('d')
+                  and (ids is None or parsed.container_id in ids)]
+    anchors = text_anchors([element.get('d') for _, element in containers])
+    shapes = []
+    for (parsed, element), (text_x, text_y) in zip(containers, anchors):
+        shapes.append({
+            'nodeId': parsed.skill_id,
+            'tree': parsed.tree,
+            'kind': 'container',
+            'id': parsed.container_id,
+            'd': element.get('d'),
+            'textX': text_x,
+            'textY': text_y,
+        })
+    return shapes
+
+
+def lock_shapes(index, labels, ids=None):
+    """(shapes, lockIcon). Every lock must share the same ellipse and rect."""
+    shapes = []
+    icon = None
+    for parsed, element in labels.items('lock'):
+        if ids is not None and parsed.lock_id not in ids:
+            continue
+        parts = {child.tag: child for child in index.children(element)}
+        missing = {'ellipse', 'rect', 'path'} - set(parts)
+        if missing:
+            raise ValueError(f"{parsed.lock_id}: lock group has no {', '.join(sorted(missing))}")
+
+        matrix = parse_transform(element.get('transform'))
+        if not is_translation(matrix):
+            raise ValueError(f"{parsed.lock_id}: lock transform is not a translation")
+        translate_x, translate_y = matrix[4], matrix[5]
+
+        lock_icon = {
+            'ellipse': {name: float(parts['ellipse'].get(name)) for name in ELLIPSE_ATTRS},
+            'rect': {name: float(parts['rect'].get(name)) for name in RECT_ATTRS},
+        }
+        if icon is None:
+            icon = lock_icon
+        elif lock_icon != icon:
+            raise ValueError(f"{parsed.lock_id}: lock icon geometry differs from the first lock")
+
+        shapes.append({
+            'nodeId': parsed.skill_id,
+            'tree': parsed.tree,
+            'kind': 'lock',
+            'id': parsed.lock_id,
+            'd': parts['path'].get('d'),
+            'textX': round(lock_icon['ellipse']['cx'] + translate_x, 5),
+            'textY': round(lock_icon['ellipse']['cy'] + translate_y, 5),
+            'translateX': translate_x,
+            'translateY': translate_y,
+        })
+    return shapes, icon
+
+
+def build(index=None):
+    index = index or load_index()
+    labels = LabelTable(index)
+    locks, icon = lock_shapes(index, labels)
+    return {'lockIcon': icon, 'shapes': container_shapes(labels) + locks}
+
+
+def render(data):
+    return json.dumps(data, indent=2) + '\n'
+
+
+def write(path=OUTPUT_PATH, index=None):
+    """Regenerate the overlay data file; returns True if it changed."""
+    data = build(index)
+    text = render(data)
+    path = Path(path)
+    changed = not path.exists() or path.read_text(encoding='utf-8') != text
+    if changed:
+        path.write_text(text, encoding='utf-8')
+    kinds = [shape['kind'] for shape in data['shapes']]
+    print(f"{path.name}: {kinds.count('container')} containers, {kinds.count('lock')} locks"
+          f"{'' if changed else ' (unchanged)'}")
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write container/lock overlay data from the SVG')
+    parser.add_argument('--check', action='store_true', help='fail if data/overlayData.json is stale')
+    parser.add_argument('-o', '--output', type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    if args.check:
+        current = args.output.read_text(encoding='utf-8') if args.output.exists() else ''
+        if current != render(build()):
+            print(f"{args.output.name} is out of date; run python scripts/overlay_data.py", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ {args.output.name} is up to date")
+        return
+    write(args.output)
+
+
+if __name__ == '__main__':
+    main()
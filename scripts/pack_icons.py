@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Pack the processed icons of public/icons into sprite atlases.
+
+Every icon is placed on a shelf (rows filled left to right, tallest first)
+with a transparent gutter of --padding pixels on all sides, so filtering at
+a sprite's edge never samples its neighbour. An atlas grows up to
+--max-size pixels on each side before a new one is started; with the 128 px
+icons the whole set fits in one image.
+
+Writes public/icons/atlas/atlas-<n>.png (and .webp unless --no-webp) and
+public/icons/atlas.json, which the client reads through utils/iconAtlas.ts:
+
+    {"padding": 2,
+     "atlases": [{"png": "/icons/atlas/atlas-0.png", "webp": "...", "width", "height", "bytes"}],
+     "icons": {"/icons/skill_icon_1.png": {"atlas": 0, "x", "y", "w", "h"}}}
+
+Usage:
+    python pack_icons.py
+    python pack_icons.py --padding 4 --max-size 1024 --no-webp
+"""
+
+from PIL import Image
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from png_optimize import write_png
+from process_icons import OUTPUT_DIR, WEBP_OPTIONS, public_url, write_json_if_changed
+
+ATLAS_DIR_NAME = 'atlas'
+ATLAS_MANIFEST_NAME = 'atlas.json'
+
+def shelf_pack(sizes, max_size, padding):
+    """
+    Place (width, height) boxes on shelves.
+
+    Returns ([(atlas, x, y)] in input order, [(width, height)] per atlas),
+    where x, y is the top-left corner of the box inside its gutter.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+    placements = [None] * len(sizes)
+    atlases = []
+    atlas, x, y, shelf_height, width = -1, 0, 0, 0, 0
+
+    for i in order:
+        cell_width, cell_height = (side + 2 * padding for side in sizes[i])
+        if cell_width > max_size or cell_height > max_size:
+            raise ValueError(f"a {sizes[i][0]}x{sizes[i][1]} icon does not fit in a {max_size}px atlas")
+        if atlas >= 0 and x + cell_width > max_size:
+            # Next shelf
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if atlas < 0 or y + cell_height > max_size:
+            if atlas >= 0:
+                atlases.append((width, y))
+            atlas, x, y, shelf_height, width = atlas + 1, 0, 0, 0, 0
+        placements[i] = (atlas, x + padding, y + padding)
+        x += cell_width
+        shelf_height = max(shelf_height, cell_height)
+        width = max(width, x)
+    if atlas >= 0:
+        atlases.append((width, y + shelf_height))
+    return placements, atlases
+
+def pack(icons_dir=OUTPUT_DIR, padding=2, max_size=2048, webp=True):
+    """Pack every PNG directly in icons_dir and write the atlases and their map."""
+    filenames = sorted(f for f in os.listdir(icons_dir) if f.endswith('.png'))
+    if not filenames:
+        print(f"No PNG files found in {icons_dir}")
+        sys.exit(1)
+
+    images = []
+    for filename in filenames:
+        with Image.open(os.path.join(icons_dir, filename)) as img:
+            images.append(img.convert('RGBA'))
+    placements, atlas_sizes = shelf_pack([img.size for img in images], max_size, padding)
+
+    atlas_dir = os.path.join(icons_dir, ATLAS_DIR_NAME)
+    os.makedirs(atlas_dir, exist_ok=True)
+    sheets = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in atlas_sizes]
+    icons = {}
+    for filename, img, (atlas, x, y) in zip(filenames, images, placements):
+        sheets[atlas].paste(img, (x, y))
+        icons[public_url(os.path.join(icons_dir, filename))] = {
+            'atlas': atlas, 'x': x, 'y': y, 'w': img.width, 'h': img.height}
+
+    written = set()
+    atlases = []
+    for number, sheet in enumerate(sheets):
+        png_path = os.path.join(atlas_dir, f'atlas-{number}.png')
+        write_png(sheet, png_path)
+        entry = {'png': public_url(png_path)}
+        sizes = {'png': os.path.getsize(png_path)}
+        written.add(os.path.basename(png_path))
+        if webp:
+            webp_path = os.path.join(atlas_dir, f'atlas-{number}.webp')
+            sheet.save(webp_path, 'WEBP', **WEBP_OPTIONS)
+            entry['webp'] = public_url(webp_path)
+            sizes['webp'] = os.path.getsize(webp_path)
+            written.add(os.path.basename(webp_path))
+        entry.update(width=sheet.width, height=sheet.height, bytes=sizes)
+        atlases.append(entry)
+        print(f"atlas-{number}: {sheet.width}x{sheet.height}, "
+              f"{sum(1 for icon in icons.values() if icon['atlas'] == number)} icons "
+              f"({', '.join(f'{name} {size:,} B' for name, size in sizes.items())})")
+
+    # Atlases left over from a larger or differently packed set
+    for filename in os.listdir(atlas_dir):
+        if filename.startswith('atlas-') and filename not in written:
+            os.remove(os.path.join(atlas_dir, filename))
+
+    manifest_path = os.path.join(icons_dir, ATLAS_MANIFEST_NAME)
+    write_json_if_changed(manifest_path, {'padding': padding, 'atlases': atlases, 'icons': icons})
+    print(f"Packed {len(icons)} icons into {len(atlases)} atlas(es); map written to {manifest_path}")
+    return atlases
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack processed icons into sprite atlases')
+    parser.add_argument('icons_dir', nargs='?', type=Path, default=OUTPUT_DIR,
+                        help='directory of processed PNG icons (default: public/icons)')
+    parser.add_argument('--padding', type=int, default=2,
+                        help='transparent gutter around every icon in pixels (default: 2)')
+    parser.add_argument('--max-size', type=int, default=2048,
+                        help='maximum atlas width and height in pixels (default: 2048)')
+    parser.add_argument('--no-webp', dest='webp', action='store_false', help='only write PNG atlases')
+    args = parser.parse_args()
+    pack(args.icons_dir, args.padding, args.max_size, args.webp)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Compact binary encoding of data/pathData.json for zero-parse loading.
+
+All paths are stored in one little-endian file that maps directly onto typed
+arrays over a single ArrayBuffer (every section is aligned for its type):
+
+    header      32 bytes
+                  magic 'ARPD', version u16, flags u16, path count u32,
+                  quantum f32 (grid step in SVG user units),
+                  coords offset u32, coords count u32,
+                  commands offset u32, commands count u32
+    offsets     (count + 1) x [command index u32, coord index u32]
+                  path i uses commands[cmd[i]:cmd[i+1]] and coords[crd[i]:crd[i+1]]
+    coords      int16: quantized deltas from the previous (quantized) pen position
+    commands    u8: 0 = M (1 point), 1 = L (1 point), 2 = C (3 points), 3 = Z;
+                  bit 0x80 marks a wide command whose values each take two int16
+                  words (low u16, high int16) because a delta overflowed int16
+    ids         UTF-8 path ids joined with '\\n', up to the end of the file
+
+Commands are absolute (M/L/C/Z only; H/V/S/Q/A are resolved by parse_path),
+while coordinates are delta-coded. Each delta is taken from the previously
+*quantized* point, so a decoded coordinate is never more than quantum / 2
+away from the original on either axis, regardless of path length.
+
+Usage:
+    python path_binary.py                 # encode data/pathData.json -> public/pathData.bin
+    python path_binary.py --verify        # decode the file and round-trip check it
+    python path_binary.py --quantum 0.005
+    python -m pytest test_path_binary.py  # edge cases on synthetic paths
+"""
+
+import argparse
+import json
+import math
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from svg_paths import CLOSE, LINE, parse_path
+
+REPO_ROOT = Path(__file__).parent.parent
+SOURCE_PATH = REPO_ROOT / 'data' / 'pathData.json'
+OUTPUT_PATH = REPO_ROOT / 'public' / 'pathData.bin'
+
+MAGIC = b'ARPD'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIfIIII')
+
+MOVE, LINE_TO, CUBIC_TO, CLOSE_PATH = 0, 1, 2, 3
+WIDE = 0x80
+POINTS = {MOVE: 1, LINE_TO: 1, CUBIC_TO: 3, CLOSE_PATH: 0}
+LETTERS = {MOVE: 'M', LINE_TO: 'L', CUBIC_TO: 'C', CLOSE_PATH: 'Z'}
+
+INT16_MIN, INT16_MAX = -32768, 32767
+
+
+def _align(size, alignment):
+    return (size + alignment - 1) // alignment * alignment
+
+
+def encode_path(d, quantum):
+    """(commands, coordinate words) for one path `d` string."""
+    geometry = parse_path(d)
+    commands, words = [], []
+    pen = (0, 0)
+
+    def emit(command, points):
+        nonlocal pen
+        deltas = []
+        for x, y in points:
+            qx, qy = int(round(x / quantum)), int(round(y / quantum))
+            deltas.extend((qx - pen[0], qy - pen[1]))
+            pen = (qx, qy)
+        if all(INT16_MIN <= v <= INT16_MAX for v in deltas):
+            commands.append(command)
+            words.extend(deltas)
+        else:
+            commands.append(command | WIDE)
+            for v in deltas:
+                words.extend(((v & 0xFFFF) - 0x10000 if v & 0x8000 else v & 0xFFFF, v >> 16))
+
+    if not len(geometry.segments):
+        emit(MOVE, [geometry.start])
+        return commands, words
+
+    subpath_pen = pen
+    for segment, kind, starts in zip(geometry.segments, geometry.kinds, geometry.starts):
+        if starts:
+            emit(MOVE, [segment[0]])
+            subpath_pen = pen
+        if kind == CLOSE:
+            emit(CLOSE_PATH, [])
+            # After Z the pen returns to the start of the subpath
+            pen = subpath_pen
+        elif kind == LINE:
+            emit(LINE_TO, [segment[3]])
+        else:
+            emit(CUBIC_TO, [segment[1], segment[2], segment[3]])
+    return commands, words
+
+
+def encode(path_data, quantum=0.01):
+    """Binary blob for an {id: d} mapping."""
+    # Quantize with the float32 step the decoder will read back
+    quantum = struct.unpack('<f', struct.pack('<f', quantum))[0]
+    ids = list(path_data)
+    commands, words, offsets = [], [], [(0, 0)]
+    for path_id in ids:
+        path_commands, path_words = encode_path(path_data[path_id], quantum)
+        commands.extend(path_commands)
+        words.extend(path_words)
+        offsets.append((len(commands), len(words)))
+
+    offsets_size = len(offsets) * 8
+    coords_offset = _align(HEADER.size + offsets_size, 4)
+    commands_offset = coords_offset + len(words) * 2
+    ids_offset = commands_offset + len(commands)
+
+    header = HEADER.pack(MAGIC, VERSION, 0, len(ids), quantum,
+                         coords_offset, len(words), commands_offset, len(commands))
+    parts = [
+        header,
+        np.asarray(offsets, dtype='<u4').tobytes(),
+        b'\0' * (coords_offset - HEADER.size - offsets_size),
+        np.asarray(words, dtype='<i2').tobytes(),
+        bytes(commands),
+        '\n'.join(ids).encode('utf-8'),
+    ]
+    blob = b''.join(parts)
+    assert len(blob) == ids_offset + len(parts[-1])
+    return blob
+
+
+def decode(blob):
+    """Reference decoder: {id: absolute M/L/C/Z d string}."""
+    magic, version, _, count, quantum, coords_offset, coords_count, commands_offset, commands_count = \
+        HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError(f'Not a path binary (magic {magic!r})')
+    if version != VERSION:
+        raise ValueError(f'Unsupported path binary version {version}')
+
+    offsets = np.frombuffer(blob, dtype='<u4', count=(count + 1) * 2, offset=HEADER.size).reshape(-1, 2)
+    coords = np.frombuffer(blob, dtype='<i2', count=coords_count, offset=coords_offset).astype(np.int64)
+    commands = blob[commands_offset:commands_offset + commands_count]
+    ids = blob[commands_offset + commands_count:].decode('utf-8').split('\n') if count else []
+
+    def number(units):
+        return f'{units * quantum:.{decimals}f}'.rstrip('0').rstrip('.') or '0'
+
+    decimals = max(0, math.ceil(-math.log10(quantum)) + 1)
+    result = {}
+    for i, path_id in enumerate(ids):
+        (cmd_start, word_start), (cmd_end, _) = offsets[i], offsets[i + 1]
+        word = word_start
+        pen = subpath = (0, 0)
+        parts = []
+        for command in commands[cmd_start:cmd_end]:
+            wide = command & WIDE
+            command &= ~WIDE
+            points = []
+            for _ in range(POINTS[command]):
+                if wide:
+                    dx = int(coords[word]) & 0xFFFF | int(coords[word + 1]) << 16
+                    dy = int(coords[word + 2]) & 0xFFFF | int(coords[word + 3]) << 16
+                    word += 4
+                else:
+                    dx, dy = int(coords[word]), int(coords[word + 1])
+                    word += 2
+                pen = (pen[0] + dx, pen[1] + dy)
+                points.append(pen)
+            if command == MOVE:
+                subpath = pen
+            elif command == CLOSE_PATH:
+                pen = subpath
+            parts.append(LETTERS[command] + ' '.join(f'{number(x)},{number(y)}' for x, y in points))
+        result[path_id] = ' '.join(parts)
+    return result
+
+
+def verify(path_data, blob):
+    """Round-trip check: (problems, worst control-point error, bound)."""
+    quantum = HEADER.unpack_from(blob)[4]
+    bound = quantum / 2 * math.sqrt(2) + 1e-6
+    decoded = decode(blob)
+    problems = []
+    if list(decoded) != list(path_data):
+        problems.append('path ids or order differ')
+
+    worst = 0.0
+    for path_id, d in path_data.items():
+        if path_id not in decoded:
+            continue
+        original, restored = parse_path(d), parse_path(decoded[path_id])
+        if original.segments.shape != restored.segments.shape or \
+                not np.array_equal(original.kinds, restored.kinds):
+            problems.append(f'{path_id}: segment structure differs')
+            continue
+        if len(original.segments):
+            error = float(np.linalg.norm(original.segments - restored.segments, axis=-1).max())
+        else:
+            error = float(np.linalg.norm(original.start - restored.start))
+        worst = max(worst, error)
+        if error > bound:
+            problems.append(f'{path_id}: error {error:.6f} exceeds {bound:.6f}')
+    return problems, worst, bound
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Encode data/pathData.json as a compact binary file')
+    parser.add_argument('--quantum', type=float, default=0.01,
+                        help='coordinate grid step in SVG user units (default: 0.01)')
+    parser.add_argument('--verify', action='store_true',
+                        help='decode the existing binary and compare it with pathData.json')
+    parser.add_argument('-o', '--output', type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    with open(SOURCE_PATH, encoding='utf-8') as f:
+        path_data = json.load(f)
+
+    if args.verify:
+        blob = args.output.read_bytes()
+    else:
+        blob = encode(path_data, args.quantum)
+        args.output.write_bytes(blob)
+
+    problems, worst, bound = verify(path_data, blob)
+    source_size = len(json.dumps(path_data, separators=(',', ':')).encode('utf-8'))
+    print(f"{args.output.name}: {len(path_data)} paths, {len(blob):,} bytes "
+          f"({100 * (1 - len(blob) / source_size):.1f}% smaller than minified JSON, {source_size:,} bytes)")
+    print(f"Round trip: max control-point error {worst:.6f} (bound {bound:.6f})")
+    if problems:
+        for problem in problems:
+            print(f"ERROR: {problem}", file=sys.stderr)
+        sys.exit(1)
+    print("✓ Round trip OK")
+
+
+if __name__ == '__main__':
+    main()
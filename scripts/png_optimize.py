@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Lossless PNG size optimization, using only PIL and the standard library.
+
+Every image is encoded several ways and the smallest PNG wins:
+
+    color type   RGB if fully opaque, LA/L if every pixel is gray and 8-bit
+                 palette (with tRNS alpha) if it has <= 256 colors; RGBA
+                 only when none of these applies
+    filters      each of the five PNG filters on every row, and per-row
+                 adaptive selection (smallest sum of absolute differences)
+    zlib         every filtering once at a quick level, then the two smallest
+                 at each level and strategy (default, filtered, RLE)
+
+Pillow's own optimized encoding is one more candidate. Only IHDR, PLTE,
+tRNS, IDAT and IEND are written, so ancillary chunks (text, timestamps,
+color profiles, ...) are dropped. Each result is decoded again and compared
+with the original RGBA pixels, and a file is only replaced when the result
+is smaller.
+
+Without arguments, the PWA icons (public/icon-192/256/512.png and
+apple-touch-icon.png) are regenerated from the master assets/app-icon.png
+and written optimized. process_icons.py and pack_icons.py write their PNGs
+through write_png() as well. A before/after report of every file is printed
+and saved to scripts/.cache/png-report.json.
+
+Usage:
+    python png_optimize.py                         # regenerate the PWA icons
+    python png_optimize.py ../public/icons/*.png   # optimize PNGs in place
+"""
+
+from PIL import Image
+import argparse
+import io
+import json
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+MASTER_ICON_PATH = REPO_ROOT / 'assets' / 'app-icon.png'
+REPORT_PATH = Path(__file__).parent / '.cache' / 'png-report.json'
+
+# Generated from MASTER_ICON_PATH: file in public/ -> edge length in pixels
+APP_ICONS = {
+    'icon-192.png': 192,
+    'icon-256.png': 256,
+    'icon-512.png': 512,
+    'apple-touch-icon.png': 180,
+}
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+COLOR_TYPES = {'L': 0, 'RGB': 2, 'P': 3, 'LA': 4, 'RGBA': 6}
+BYTES_PER_PIXEL = {'L': 1, 'RGB': 3, 'P': 1, 'LA': 2, 'RGBA': 4}
+FILTER_NAMES = ('none', 'sub', 'up', 'average', 'paeth')
+ZLIB_STRATEGIES = {'default': zlib.Z_DEFAULT_STRATEGY, 'filtered': zlib.Z_FILTERED, 'rle': zlib.Z_RLE}
+ZLIB_LEVELS = (9, 8, 6)
+# Filterings (per color type) refined over every zlib level and strategy
+REFINED_STREAMS = 2
+
+def reductions(img):
+    """
+    {mode name: image} of the lossless representations of an RGBA image
+    worth trying: every reduced color type, or RGBA itself if none applies.
+    """
+    candidates = {}
+    opaque = img.getchannel('A').getextrema() == (255, 255)
+    red, green, blue, _ = img.split()
+    gray = red.tobytes() == green.tobytes() == blue.tobytes()
+    if opaque:
+        candidates['RGB'] = img.convert('RGB')
+    if gray:
+        candidates['LA'] = Image.merge('LA', (red, img.getchannel('A')))
+        if opaque:
+            candidates['L'] = red
+    palette = to_palette(img)
+    if palette is not None:
+        candidates['P'] = palette
+    return candidates or {'RGBA': img}
+
+def to_palette(img):
+    """Exact 8-bit palette image with a tRNS table, or None above 256 colors."""
+    colors = img.getcolors(256)
+    if colors is None:
+        return None
+    # Translucent entries first, so the tRNS table can stop at the last of them
+    colors = sorted((color for _, color in colors), key=lambda color: (color[3] == 255, color))
+    index = {bytes(color): i for i, color in enumerate(colors)}
+    raw = img.tobytes()
+    palette = Image.frombytes('P', img.size, bytes(index[raw[i:i + 4]] for i in range(0, len(raw), 4)))
+    palette.putpalette([channel for color in colors for channel in color[:3]])
+    palette.info['transparency'] = bytes(color[3] for color in colors if color[3] < 255)
+    return palette
+
+def filter_rows(raw, stride, bpp):
+    """[rows] for each of the five PNG filters (filter type byte not included)."""
+    height = len(raw) // stride
+    filtered = [[] for _ in FILTER_NAMES]
+    prev = bytes(stride)
+    for y in range(height):
+        row = raw[y * stride:(y + 1) * stride]
+        left = bytes(bpp) + row[:-bpp]
+        upper_left = bytes(bpp) + prev[:-bpp]
+        filtered[0].append(row)
+        filtered[1].append(bytes((x - a) & 255 for x, a in zip(row, left)))
+        filtered[2].append(bytes((x - b) & 255 for x, b in zip(row, prev)))
+        filtered[3].append(bytes((x - ((a + b) >> 1)) & 255 for x, a, b in zip(row, left, prev)))
+        paeth = bytearray(stride)
+        for i, (x, a, b, c) in enumerate(zip(row, left, prev, upper_left)):
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            predictor = a if pa <= pb and pa <= pc else b if pb <= pc else c
+            paeth[i] = (x - predictor) & 255
+        filtered[4].append(bytes(paeth))
+        prev = row
+    return filtered
+
+# Filtered byte -> its magnitude read as a signed value
+SIGNED_MAGNITUDE = bytes(min(value, 256 - value) for value in range(256))
+
+def row_cost(row):
+    """libpng's heuristic: sum of the filtered bytes' magnitudes as signed values."""
+    return sum(row.translate(SIGNED_MAGNITUDE))
+
+def filtered_streams(raw, stride, bpp):
+    """{filter name: scanline bytes with filter type bytes} for each fixed filter and 'adaptive'."""
+    filtered = filter_rows(raw, stride, bpp)
+    streams = {name: b''.join(bytes((filter_type,)) + row for row in filtered[filter_type])
+               for filter_type, name in enumerate(FILTER_NAMES)}
+    adaptive = []
+    for rows in zip(*filtered):
+        filter_type = min(range(len(rows)), key=lambda i: row_cost(rows[i]))
+        adaptive.append(bytes((filter_type,)) + rows[filter_type])
+    streams['adaptive'] = b''.join(adaptive)
+    return streams
+
+def chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+def png_bytes(img, idat):
+    """PNG file of an image with the given compressed pixel data and only critical chunks."""
+    header = struct.pack('>IIBBBBB', img.width, img.height, 8, COLOR_TYPES[img.mode], 0, 0, 0)
+    chunks = [chunk(b'IHDR', header)]
+    if img.mode == 'P':
+        chunks.append(chunk(b'PLTE', bytes(img.getpalette()[:3 * len(img.getcolors(256))])))
+        if img.info.get('transparency'):
+            chunks.append(chunk(b'tRNS', img.info['transparency']))
+    chunks.append(chunk(b'IDAT', idat))
+    chunks.append(chunk(b'IEND', b''))
+    return PNG_SIGNATURE + b''.join(chunks)
+
+def compress(data, level, strategy):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 15, 9, strategy)
+    return compressor.compress(data) + compressor.flush()
+
+def encode(img):
+    """
+    Smallest lossless PNG encoding of an image.
+
+    Returns (png bytes, {'mode', 'filter', 'level', 'strategy'} of the winner).
+    """
+    img = img.convert('RGBA') if img.mode != 'RGBA' else img
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', optimize=True)
+    best, best_info = buffer.getvalue(), {'mode': 'RGBA', 'filter': 'pillow', 'level': 9, 'strategy': 'pillow'}
+
+    for mode, candidate in reductions(img).items():
+        raw = candidate.tobytes()
+        bpp = BYTES_PER_PIXEL[mode]
+        streams = filtered_streams(raw, candidate.width * bpp, bpp)
+        # Rank the filterings with one quick compression each (level 6 orders them
+        # like level 9 at a fraction of the time), then search zlib settings on the best
+        ranked = sorted(streams, key=lambda name: len(compress(streams[name], 6, zlib.Z_FILTERED)))
+        for filter_name in ranked[:REFINED_STREAMS]:
+            for level in ZLIB_LEVELS:
+                for strategy_name, strategy in ZLIB_STRATEGIES.items():
+                    data = png_bytes(candidate, compress(streams[filter_name], level, strategy))
+                    if len(data) < len(best):
+                        best, best_info = data, {'mode': mode, 'filter': filter_name,
+                                                 'level': level, 'strategy': strategy_name}
+
+    with Image.open(io.BytesIO(best)) as decoded:
+        if decoded.convert('RGBA').tobytes() != img.tobytes():
+            raise ValueError(f"{best_info['mode']}/{best_info['filter']} encoding does not round-trip")
+    return best, best_info
+
+def write_png(img, path):
+    """Write an image as an optimized PNG (only if the bytes differ). Returns the report record."""
+    data, info = encode(img)
+    before = os.path.getsize(path) if os.path.exists(path) else None
+    if before is None or Path(path).read_bytes() != data:
+        Path(path).write_bytes(data)
+    return {'file': str(path), 'before': before, 'after': len(data), **info}
+
+def optimize_file(path):
+    """Re-encode a PNG in place if that makes it smaller. Returns the report record."""
+    original = Path(path).read_bytes()
+    with Image.open(io.BytesIO(original)) as img:
+        data, info = encode(img)
+    if len(data) < len(original):
+        Path(path).write_bytes(data)
+    else:
+        data, info = original, {'mode': None, 'filter': 'unchanged', 'level': None, 'strategy': None}
+    return {'file': str(path), 'before': len(original), 'after': len(data), **info}
+
+def regenerate_app_icons(master_path=MASTER_ICON_PATH, output_dir=REPO_ROOT / 'public'):
+    """Resize the master icon to every APP_ICONS size. Returns the report records."""
+    with Image.open(master_path) as master:
+        master = master.convert('RGBA')
+    records = []
+    for filename, size in APP_ICONS.items():
+        if size > max(master.size):
+            raise ValueError(f"{master_path.name} is {master.width}x{master.height}, too small for {filename}")
+        icon = master if master.size == (size, size) else master.resize((size, size), Image.Resampling.LANCZOS)
+        records.append(write_png(icon, output_dir / filename))
+    return records
+
+def print_report(records, report_path=REPORT_PATH):
+    name_width = max(len(os.path.basename(record['file'])) for record in records)
+    print(f"{'file':<{name_width}}{'before':>10}{'after':>10}{'saved':>8}  encoding")
+    before_total = after_total = 0
+    for record in records:
+        before = record['before'] if record['before'] is not None else record['after']
+        before_total += before
+        after_total += record['after']
+        saved = 100 * (1 - record['after'] / before) if before else 0.0
+        encoding = '/'.join(str(record[key]) for key in ('mode', 'filter', 'level', 'strategy') if record[key])
+        print(f"{os.path.basename(record['file']):<{name_width}}{before:>10,}{record['after']:>10,}"
+              f"{saved:>7.1f}%  {encoding}")
+    if before_total:
+        print(f"{'total':<{name_width}}{before_total:>10,}{after_total:>10,}"
+              f"{100 * (1 - after_total / before_total):>7.1f}%")
+
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(records, indent=2) + '\n', encoding='utf-8')
+
+def main():
+    parser = argparse.ArgumentParser(description='Losslessly shrink PNGs (PIL and the standard library only)')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='PNGs to optimize in place (default: regenerate the PWA icons from the master)')
+    parser.add_argument('--master', type=Path, default=MASTER_ICON_PATH,
+                        help='master image of the PWA icons (default: assets/app-icon.png)')
+    parser.add_argument('--report', type=Path, default=REPORT_PATH,
+                        help='where to save the JSON report (default: scripts/.cache/png-report.json)')
+    args = parser.parse_args()
+
+    if args.files:
+        missing = [str(path) for path in args.files if not path.is_file()]
+        if missing:
+            print(f"Error: not found: {', '.join(missing)}")
+            sys.exit(1)
+        records = [optimize_file(path) for path in args.files]
+    else:
+        records = regenerate_app_icons(args.master)
+    print_report(records, args.report)
+
+if __name__ == '__main__':
+    main()
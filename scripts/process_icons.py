@@ -2,12 +2,72 @@
 """
 Process all icon images to be 128x128 with consistent padding.
 Finds the non-transparent bounding box and centers the content with uniform padding.
+
+Pristine sources live in assets/icons and are never modified; the processed
+icons are written to public/icons. assets/icons/manifest.json records, per
+icon, the source hash and parameters that produced the current output and
+the output's hash, so a rerun only processes new or changed sources (or
+outputs that were edited or deleted). Sources that disappear take their
+output with them. PNGs are written through png_optimize.py (smallest lossless
+encoding).
+
+Each source is decoded once and also written at every size in
+VARIANT_SIZES as PNG and WebP to public/icons/variants (sizes that would
+enlarge the source content are skipped). public/icons/variants.json maps each
+icon path to its variants and byte sizes so the client can request the
+smallest adequate file (utils/iconVariants.ts).
+
+Every processed icon also gets a placeholder: an 8x8 thumbnail as an inline
+PNG data URI and its dominant color (alpha-weighted). They are written to
+data/iconPlaceholders.json, which is bundled with the app, so nodes can
+show the icon's silhouette before the image itself arrives.
+
+Icons are spread over a process pool (one worker per core by default) and
+reported in file order. A file that fails is listed in the summary at the
+end instead of stopping the batch; the exit status is 1 if any failed.
+
+Usage:
+    python process_icons.py                    # assets/icons -> public/icons, all cores
+    python process_icons.py path/to/sources -o path/to/output -j 4
+    python process_icons.py --force            # reprocess everything
+    python process_icons.py --sizes 64 128 --formats webp
+    python process_icons.py --report           # plus a JSON layout report of public/icons
 """
 
 from PIL import Image
+import argparse
+import base64
+import hashlib
+import json
 import numpy as np
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from png_optimize import encode as encode_png, write_png
+
+SOURCE_DIR = Path(__file__).parent.parent / 'assets' / 'icons'
+OUTPUT_DIR = Path(__file__).parent.parent / 'public' / 'icons'
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+REPORT_PATH = Path(__file__).parent / '.cache' / 'icon-report.json'
+PUBLIC_DIR = Path(__file__).parent.parent / 'public'
+
+# Extra sizes written to <output>/variants, listed in <output>/variants.json
+VARIANT_SIZES = (48, 96, 128, 256)
+VARIANT_FORMATS = ('png', 'webp')
+VARIANTS_DIR_NAME = 'variants'
+VARIANTS_MANIFEST_NAME = 'variants.json'
+# Lossless WebP is smaller than lossy q90 for these flat icons and about 2 ms each
+WEBP_OPTIONS = {'lossless': True, 'quality': 50, 'method': 2}
+
+# Inline placeholders, bundled with the app
+PLACEHOLDERS_PATH = Path(__file__).parent.parent / 'data' / 'iconPlaceholders.json'
+PLACEHOLDER_SIZE = 8
+
+# Report icons whose visual center is further than this from the canvas center
+CENTER_TOLERANCE = 1.5
 
 def get_bounding_box(img):
     """Get the bounding box of non-transparent pixels."""
@@ -19,59 +79,98 @@ def get_bounding_box(img):
     bbox = img.getbbox()
     return bbox
 
+def alpha_moments(alpha):
+    """
+    Alpha mass and weighted center of (..., H, W) alpha arrays.
+
+    One reduction projects the alpha onto rows and columns; the first
+    moments are then dot products with 0..H-1 and 0..W-1, so no per-pixel
+    coordinate arrays are built. Returns (mass, center_x, center_y) with the
+    leading shape of `alpha`; centers are NaN where the mass is zero.
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    columns = alpha.sum(axis=-2)            # (..., W)
+    rows = alpha.sum(axis=-1)               # (..., H)
+    mass = rows.sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        center_x = columns @ np.arange(alpha.shape[-1], dtype=np.float64) / mass
+        center_y = rows @ np.arange(alpha.shape[-2], dtype=np.float64) / mass
+    return mass, center_x, center_y
+
 def get_visual_center(img):
     """Calculate the visual center of mass based on non-transparent pixels."""
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
 
-    # Convert to numpy array
-    data = np.array(img)
-    alpha = data[:, :, 3]
-
-    # Find all non-transparent pixels
-    y_coords, x_coords = np.where(alpha > 0)
-
-    if len(x_coords) == 0:
-        return None
-
     # Weight by alpha values for better center calculation
-    weights = alpha[y_coords, x_coords].astype(float)
-
-    # Calculate weighted center
-    center_x = np.average(x_coords, weights=weights)
-    center_y = np.average(y_coords, weights=weights)
-
-    return (center_x, center_y)
-
-def process_icon(input_path, output_path, target_size=128, padding=16):
+    mass, center_x, center_y = alpha_moments(np.asarray(img)[:, :, 3])
+    if mass == 0:
+        return None
+    return (float(center_x), float(center_y))
+
+def alpha_bboxes(alpha):
+    """(N, 4) content boxes (left, upper, right, lower) of a (N, H, W) alpha stack, -1 if empty."""
+    visible = alpha > 0
+    columns = visible.any(axis=1)           # (N, W)
+    rows = visible.any(axis=2)              # (N, H)
+    height, width = alpha.shape[1:]
+    boxes = np.stack([columns.argmax(axis=1), rows.argmax(axis=1),
+                      width - columns[:, ::-1].argmax(axis=1), height - rows[:, ::-1].argmax(axis=1)], axis=1)
+    boxes[~columns.any(axis=1)] = -1
+    return boxes
+
+def analyze_icons(paths):
     """
-    Process an icon to be target_size x target_size with consistent padding.
-    Uses visual center of mass for perfect centering.
+    Per-icon layout report: content bbox, visual center and fill ratio.
 
-    Args:
-        input_path: Path to input image
-        output_path: Path to save processed image
-        target_size: Final image size (default 128)
-        padding: Padding in pixels from edge to content (default 16)
+    Icons of the same size are stacked into one (N, H, W) alpha array, so the
+    boxes and moments of a whole group come from a handful of array
+    operations. fillRatio is the alpha-weighted share of the canvas covered.
     """
-    # Open the image
-    img = Image.open(input_path)
-
+    groups = {}
+    for path in paths:
+        with Image.open(path) as img:
+            alpha = np.asarray(img.convert('RGBA'))[:, :, 3]
+        groups.setdefault(alpha.shape, []).append((path, alpha))
+
+    report = {}
+    for (height, width), members in groups.items():
+        stack = np.stack([alpha for _, alpha in members])
+        boxes = alpha_bboxes(stack)
+        mass, center_x, center_y = alpha_moments(stack)
+        for i, (path, _) in enumerate(members):
+            empty = mass[i] == 0
+            report[os.path.basename(path)] = {
+                'width': width,
+                'height': height,
+                'bbox': None if empty else [int(v) for v in boxes[i]],
+                'center': None if empty else [round(float(center_x[i]), 2), round(float(center_y[i]), 2)],
+                'centerOffset': None if empty else [round(float(center_x[i]) - width / 2, 2),
+                                                    round(float(center_y[i]) - height / 2, 2)],
+                'fillRatio': round(float(mass[i]) / (255 * width * height), 4),
+            }
+    return {name: report[name] for name in sorted(report)}
+
+def crop_to_content(img):
+    """RGBA crop of the non-transparent content, or None if there is none."""
     # Convert to RGBA if not already
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
 
     # Get bounding box of non-transparent content
     bbox = get_bounding_box(img)
+    return img.crop(bbox) if bbox else None
 
-    if bbox is None:
-        # Image is completely transparent, create blank image
-        new_img = Image.new('RGBA', (target_size, target_size), (0, 0, 0, 0))
-        new_img.save(output_path, 'PNG')
-        return
-
-    # Crop to content
-    cropped = img.crop(bbox)
+def center_icon(cropped, target_size, padding):
+    """
+    Scale cropped content into target_size minus padding and center its
+    visual mass on a transparent canvas. Returns (canvas, width, height)
+    with the size the content was scaled to.
+    """
+    # Create new transparent background of target size
+    new_img = Image.new('RGBA', (target_size, target_size), (0, 0, 0, 0))
+    if cropped is None:
+        return new_img, 0, 0
 
     # Calculate the maximum size the content can be (with padding on all sides)
     max_content_size = target_size - (2 * padding)
@@ -90,9 +189,6 @@ def process_icon(input_path, output_path, target_size=128, padding=16):
     # Get the visual center of the resized content
     visual_center = get_visual_center(resized)
 
-    # Create new transparent background of target size
-    new_img = Image.new('RGBA', (target_size, target_size), (0, 0, 0, 0))
-
     if visual_center:
         # Calculate offset to center the visual mass at the center of target canvas
         center_x, center_y = visual_center
@@ -108,39 +204,349 @@ def process_icon(input_path, output_path, target_size=128, padding=16):
 
     # Paste the resized content onto the calculated position
     new_img.paste(resized, (x_offset, y_offset), resized)
+    return new_img, new_width, new_height
+
+def process_icon(input_path, output_path, target_size=128, padding=16, cropped=None):
+    """
+    Process an icon to be target_size x target_size with consistent padding.
+    Uses visual center of mass for perfect centering.
 
-    # Save the result
-    new_img.save(output_path, 'PNG')
-    print(f"Processed: {os.path.basename(input_path)} -> {new_width}x{new_height} visually centered in {target_size}x{target_size}")
+    Args:
+        input_path: Path to input image
+        output_path: Path to save processed image
+        target_size: Final image size (default 128)
+        padding: Padding in pixels from edge to content (default 16)
+        cropped: Content already decoded with crop_to_content(), if any
 
-def main():
-    # Get the icons directory
-    icons_dir = '/Users/baptiste/github/Igaveitashot/skill-tree-planner/public/icons'
+    Returns a one-line description of the result for the progress output.
+    """
+    if cropped is None:
+        with Image.open(input_path) as img:
+            cropped = crop_to_content(img)
+
+    new_img, new_width, new_height = center_icon(cropped, target_size, padding)
+
+    # Save the result (smallest lossless encoding)
+    write_png(new_img, output_path)
+    if cropped is None:
+        return f"{os.path.basename(input_path)} -> blank {target_size}x{target_size} (no visible pixels)"
+    return f"{os.path.basename(input_path)} -> {new_width}x{new_height} visually centered in {target_size}x{target_size}"
+
+def dominant_color(rgba):
+    """
+    Most common color of an (H, W, 4) array as '#rrggbb', or None if blank.
 
-    if not os.path.exists(icons_dir):
-        print(f"Error: Icons directory not found: {icons_dir}")
+    Colors are bucketed at 4 bits per channel and every pixel counts with its
+    alpha, so faint antialiased edges barely matter; the result is the
+    alpha-weighted mean of the heaviest bucket.
+    """
+    rgb = rgba[:, :, :3].reshape(-1, 3).astype(np.int64)
+    alpha = rgba[:, :, 3].reshape(-1).astype(np.float64)
+    if not alpha.any():
+        return None
+    buckets = (rgb[:, 0] >> 4) << 8 | (rgb[:, 1] >> 4) << 4 | rgb[:, 2] >> 4
+    heaviest = np.bincount(buckets, weights=alpha, minlength=4096).argmax()
+    members = buckets == heaviest
+    color = (rgb[members] * alpha[members, None]).sum(axis=0) / alpha[members].sum()
+    return '#' + ''.join(f'{int(round(channel)):02x}' for channel in color)
+
+def placeholder(img):
+    """{'thumb': PNG data URI of a tiny area-averaged thumbnail, 'color': dominant color}"""
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    thumb = img.resize((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+    data, _ = encode_png(thumb)
+    return {'thumb': 'data:image/png;base64,' + base64.b64encode(data).decode('ascii'),
+            'color': dominant_color(np.asarray(img))}
+
+def variant_name(filename, size, image_format):
+    return f"{os.path.splitext(filename)[0]}-{size}.{image_format}"
+
+def write_variants(cropped, filename, variants_dir, sizes, formats, target_size=128, padding=16):
+    """
+    Write every size/format variant of one decoded icon into variants_dir.
+
+    Padding scales with the size. Sizes above target_size are skipped when
+    they would enlarge the source content, and the target_size PNG is the
+    main output, so it is not duplicated. Returns [(file, size, format)].
+    """
+    written = []
+    for size in sizes:
+        size_padding = round(padding * size / target_size)
+        if cropped is not None and size > target_size and \
+                (size - 2 * size_padding) > max(cropped.size):
+            continue
+        canvas, _, _ = center_icon(cropped, size, size_padding)
+        for image_format in formats:
+            if size == target_size and image_format == 'png':
+                continue
+            name = variant_name(filename, size, image_format)
+            if image_format == 'webp':
+                canvas.save(os.path.join(variants_dir, name), 'WEBP', **WEBP_OPTIONS)
+            else:
+                write_png(canvas, os.path.join(variants_dir, name))
+            written.append((name, size, image_format))
+    return written
+
+def process_file(job):
+    """
+    Pool worker: decode one source once, then write whatever the job asks for
+    (the main output and/or its variants) and compute the placeholder of the
+    main output. Returns (ok, message, variants, placeholder); never raises.
+    """
+    input_path = job['input']
+    try:
+        with Image.open(input_path) as img:
+            cropped = crop_to_content(img)
+        messages = []
+        if job['primary']:
+            messages.append(process_icon(input_path, job['output'], job['target_size'], job['padding'], cropped))
+        variants = None
+        if job['variants_dir']:
+            variants = write_variants(cropped, os.path.basename(input_path), job['variants_dir'],
+                                      job['sizes'], job['formats'], job['target_size'], job['padding'])
+            sizes = sorted({size for _, size, _ in variants})
+            messages.append(f"{os.path.basename(input_path)} -> variants {', '.join(map(str, sizes)) or 'none'}")
+        preview = None
+        if job['placeholder']:
+            with Image.open(job['output']) as img:
+                preview = placeholder(img)
+            if not messages:
+                messages.append(f"{os.path.basename(input_path)} -> placeholder")
+        return True, '; '.join(messages), variants, preview
+    except Exception as e:
+        return False, f"{os.path.basename(input_path)}: {type(e).__name__}: {e}", None, None
+
+def chunk_size(count, workers):
+    """A few chunks per worker: low IPC overhead, still balanced at the end."""
+    return max(1, count // (workers * 4))
+
+def file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def load_manifest(source_dir):
+    try:
+        with open(os.path.join(source_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'version': MANIFEST_VERSION, 'icons': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'version': MANIFEST_VERSION, 'icons': {}}
+    return manifest
+
+def write_json_if_changed(path, data, **options):
+    text = json.dumps(data, indent=2, **options) + '\n'
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            if f.read() == text:
+                return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def save_manifest(source_dir, manifest):
+    write_json_if_changed(os.path.join(source_dir, MANIFEST_NAME), manifest, sort_keys=True)
+
+def is_current(entry, source_hash, params, output_path):
+    """True if `entry` says output_path was made from this source with these params, untouched since."""
+    return (entry is not None and entry['source'] == source_hash
+            and all(entry.get(name) == value for name, value in params.items())
+            and entry['output'] == file_hash(output_path))
+
+def variants_current(entry, variant_params, variants_dir):
+    """True if the entry's variants were made with these sizes/formats and are untouched since."""
+    variants = entry.get('variants') if entry else None
+    return (variants is not None
+            and all(variants.get(name) == value for name, value in variant_params.items())
+            and all(item['hash'] == file_hash(os.path.join(variants_dir, item['file']))
+                    for item in variants['files']))
+
+def public_url(path):
+    """URL of a file under public/ ('/icons/...'), or its plain path elsewhere."""
+    path = Path(path).resolve()
+    try:
+        return '/' + path.relative_to(PUBLIC_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+def variants_manifest(icons, output_dir, variants_dir, target_size, variant_params):
+    """{icon URL: [{size, format, src, bytes}]} for the client, main output included."""
+    result = {}
+    for filename, entry in sorted(icons.items()):
+        output_path = os.path.join(output_dir, filename)
+        items = [{'size': target_size, 'format': 'png', 'src': public_url(output_path),
+                  'bytes': os.path.getsize(output_path)}]
+        for item in (entry.get('variants') or {}).get('files', []):
+            path = os.path.join(variants_dir, item['file'])
+            items.append({'size': item['size'], 'format': item['format'], 'src': public_url(path),
+                          'bytes': os.path.getsize(path)})
+        result[public_url(output_path)] = sorted(items, key=lambda item: (item['size'], item['format']))
+    return {**variant_params, 'icons': result}
+
+def placeholders_manifest(icons, output_dir):
+    """{icon URL: {thumb, color}} for every icon with a placeholder."""
+    return {public_url(os.path.join(output_dir, filename)): entry['placeholder']
+            for filename, entry in sorted(icons.items()) if entry.get('placeholder')}
+
+def process_all(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR, jobs=None, target_size=128, padding=16,
+                force=False, sizes=VARIANT_SIZES, formats=VARIANT_FORMATS, placeholders_path=PLACEHOLDERS_PATH):
+    """
+    Process the new or changed PNGs of source_dir into output_dir, plus their
+    size/format variants in output_dir/variants (no variants if `sizes` is
+    empty) and their placeholders in placeholders_path (None to skip).
+    Returns [(filename, error)] for the failures.
+    """
+    if not os.path.isdir(source_dir):
+        print(f"Error: Icons directory not found: {source_dir}")
         sys.exit(1)
+    if os.path.realpath(source_dir) == os.path.realpath(output_dir):
+        print("Error: sources and outputs must be separate directories (resampling an output again degrades it)")
+        sys.exit(1)
+    os.makedirs(output_dir, exist_ok=True)
+    variants_dir = os.path.join(output_dir, VARIANTS_DIR_NAME) if sizes and formats else None
+    if variants_dir:
+        os.makedirs(variants_dir, exist_ok=True)
 
     # Process all PNG files in the icons directory
-    png_files = [f for f in os.listdir(icons_dir) if f.endswith('.png')]
+    png_files = sorted(f for f in os.listdir(source_dir) if f.endswith('.png'))
 
     if not png_files:
-        print(f"No PNG files found in {icons_dir}")
+        print(f"No PNG files found in {source_dir}")
         sys.exit(1)
 
-    print(f"Found {len(png_files)} icon files to process")
-    print(f"Target size: 128x128 with 16px padding\n")
-
-    for filename in sorted(png_files):
-        input_path = os.path.join(icons_dir, filename)
-        output_path = input_path  # Overwrite the original
-
+    manifest = load_manifest(source_dir)
+    icons = manifest['icons']
+    params = {'targetSize': target_size, 'padding': padding}
+    variant_params = {'sizes': sorted(sizes), 'formats': sorted(formats)}
+    source_hashes = {filename: file_hash(os.path.join(source_dir, filename)) for filename in png_files}
+
+    work = []
+    for filename in png_files:
+        entry = icons.get(filename)
+        output_path = os.path.join(output_dir, filename)
+        primary = force or not is_current(entry, source_hashes[filename], params, output_path)
+        variants = bool(variants_dir) and (primary or not variants_current(entry, variant_params, variants_dir))
+        preview = bool(placeholders_path) and (primary or 'placeholder' not in entry)
+        if primary or variants or preview:
+            work.append({'input': os.path.join(source_dir, filename), 'output': output_path,
+                         'target_size': target_size, 'padding': padding, 'primary': primary,
+                         'variants_dir': variants_dir if variants else None,
+                         'sizes': variant_params['sizes'], 'formats': variant_params['formats'],
+                         'placeholder': preview})
+
+    # Outputs of deleted sources go too, unless someone replaced them by hand
+    removed = sorted(set(icons) - set(png_files))
+    for filename in removed:
+        entry = icons.pop(filename)
+        owned = [(os.path.join(output_dir, filename), entry['output'])]
+        owned += [(os.path.join(output_dir, VARIANTS_DIR_NAME, item['file']), item['hash'])
+                  for item in (entry.get('variants') or {}).get('files', [])]
+        for path, digest in owned:
+            if file_hash(path) == digest:
+                os.remove(path)
+        print(f"Removed: {filename} (source deleted)")
+
+    print(f"Found {len(png_files)} source icons: {len(work)} to process, {len(png_files) - len(work)} up to date")
+    errors = []
+    if work:
+        workers = min(jobs or os.cpu_count() or 1, len(work))
+        print(f"Target size: {target_size}x{target_size} with {padding}px padding "
+              f"({workers} worker{'s' if workers > 1 else ''})\n")
+
+        if workers == 1:
+            results = map(process_file, work)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(process_file, work, chunksize=chunk_size(len(work), workers))
+
+        width = len(str(len(work)))
         try:
-            process_icon(input_path, output_path, target_size=128, padding=16)
-        except Exception as e:
-            print(f"Error processing {filename}: {e}")
+            # map() yields in submission order, so progress stays in file order
+            for number, (job, (ok, message, variants, preview)) in enumerate(zip(work, results), 1):
+                print(f"[{number:>{width}}/{len(work)}] {'Processed' if ok else 'Error'}: {message}", flush=True)
+                filename = os.path.basename(job['input'])
+                if not ok:
+                    icons.pop(filename, None)
+                    errors.append((filename, message))
+                    continue
+                entry = icons.setdefault(filename, {})
+                if job['primary']:
+                    entry.update(source=source_hashes[filename], output=file_hash(job['output']), **params)
+                if variants is not None:
+                    entry['variants'] = {**variant_params, 'files': [
+                        {'file': name, 'size': size, 'format': image_format,
+                         'hash': file_hash(os.path.join(variants_dir, name))}
+                        for name, size, image_format in variants]}
+                if preview is not None:
+                    entry['placeholder'] = preview
+        finally:
+            if workers > 1:
+                pool.shutdown()
+            save_manifest(source_dir, manifest)
+
+        print(f"\nProcessed {len(work) - len(errors)} of {len(work)} icons")
+        if errors:
+            print(f"{len(errors)} icon(s) failed:")
+            for filename, message in errors:
+                print(f"  {message}")
+    else:
+        save_manifest(source_dir, manifest)
+
+    if variants_dir:
+        write_json_if_changed(os.path.join(output_dir, VARIANTS_MANIFEST_NAME),
+                              variants_manifest(icons, output_dir, variants_dir, target_size, variant_params))
+    if placeholders_path:
+        write_json_if_changed(placeholders_path, placeholders_manifest(icons, output_dir))
+    return errors
+
+def write_report(icons_dir, report_path):
+    """Analyze every PNG in icons_dir and write the layout report as JSON."""
+    paths = [os.path.join(icons_dir, f) for f in sorted(os.listdir(icons_dir)) if f.endswith('.png')]
+    report = analyze_icons(paths)
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    print(f"\nWrote layout report for {len(report)} icons to {report_path}")
+
+    off_center = [(max(abs(v) for v in entry['centerOffset']), name) for name, entry in report.items()
+                  if entry['centerOffset'] and max(abs(v) for v in entry['centerOffset']) > CENTER_TOLERANCE]
+    empty = [name for name, entry in report.items() if entry['bbox'] is None]
+    for offset, name in sorted(off_center, reverse=True):
+        print(f"  {name}: visual center {offset:.1f}px off the canvas center")
+    for name in empty:
+        print(f"  {name}: no visible pixels")
+    return report
 
-    print(f"\nProcessed {len(png_files)} icons successfully!")
+def main():
+    parser = argparse.ArgumentParser(description='Crop, resize and visually center icon PNGs')
+    parser.add_argument('source_dir', nargs='?', type=Path, default=SOURCE_DIR,
+                        help='directory of pristine PNG icons (default: assets/icons)')
+    parser.add_argument('-o', '--output-dir', type=Path, default=OUTPUT_DIR,
+                        help='where processed icons are written (default: public/icons)')
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--size', type=int, default=128, help='output size in pixels (default: 128)')
+    parser.add_argument('--padding', type=int, default=16, help='padding in pixels (default: 16)')
+    parser.add_argument('--force', action='store_true', help='reprocess icons that are up to date')
+    parser.add_argument('--sizes', type=int, nargs='*', default=list(VARIANT_SIZES),
+                        help='variant sizes in pixels (default: 48 96 128 256; none to skip variants)')
+    parser.add_argument('--formats', nargs='+', choices=('png', 'webp'), default=list(VARIANT_FORMATS),
+                        help='variant formats (default: png webp)')
+    parser.add_argument('--no-placeholders', dest='placeholders', action='store_const', const=None,
+                        default=PLACEHOLDERS_PATH, help='do not write data/iconPlaceholders.json')
+    parser.add_argument('--report', nargs='?', const=REPORT_PATH, type=Path, metavar='FILE',
+                        help='then write a JSON layout report (bbox, visual center, fill ratio) of the '
+                             'processed icons (default: scripts/.cache/icon-report.json)')
+    args = parser.parse_args()
+
+    errors = process_all(args.source_dir, args.output_dir, args.jobs, args.size, args.padding, args.force,
+                         args.sizes, args.formats, args.placeholders)
+    if args.report:
+        write_report(args.output_dir, args.report)
+    if errors:
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
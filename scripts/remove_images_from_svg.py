@@ -4,6 +4,9 @@ Remove all embedded images from the SVG file to reduce file size
 """
 
 import xml.etree.ElementTree as ET
+from pathlib import Path
+
+svg_path = Path(__file__).parent.parent / 'assets' / 'ArcRaidersTree.svg'
 
 # Parse the SVG
 ET.register_namespace('', 'http://www.w3.org/2000/svg')
@@ -11,7 +14,7 @@ ET.register_namespace('sodipodi', 'http://sodipodi.sourceforge.net/DTD/sodipodi-
 ET.register_namespace('inkscape', 'http://www.inkscape.org/namespaces/inkscape')
 ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
 
-tree = ET.parse('skill-tree-planner/assets/ArcRaidersTree.svg')
+tree = ET.parse(svg_path)
 root = tree.getroot()
 
 # Define namespaces
@@ -35,6 +38,6 @@ for parent in root.iter():
         print(f"  Removed image: {image.get('id')}")
 
 # Write back
-tree.write('skill-tree-planner/assets/ArcRaidersTree.svg', encoding='utf-8', xml_declaration=True)
+tree.write(svg_path, encoding='utf-8', xml_declaration=True)
 
 print(f"\n✓ Removed {count} images from SVG file")
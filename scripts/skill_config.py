@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Indexed skill tree config shared by the scripts/ tools.
+
+data/config/skillTreeConfig.json is read once into flat node records that
+are reachable by id (config.nodes), per tree in file order
+(config.trees['A'].nodes) and, for nodes taking more than one point, from
+config.multi_point and each tree's multi_point list. The model is pickled
+under scripts/.cache keyed on the JSON content hash, like the SVG index, so
+a rerun skips the JSON parse and the indexing.
+
+The other config copies load through the same function: the proto
+skillTreeConfig.json has the same shape, and editor override files (tree
+settings plus nodeOverrides, e.g. config/skill-tree-config.json) are
+applied on top of a base config the way SkillTree.tsx applies them.
+
+Usage:
+    from skill_config import load_config
+
+    config = load_config()
+    node = config.nodes['tree-a-node-0']
+    for node in config.trees['B'].multi_point:
+        print(node.id, node.max_points)
+
+    proto = load_config(PROTO_CONFIG_PATH)
+    edited = load_config(PROTO_OVERRIDES_PATH, base=PROTO_CONFIG_PATH)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = REPO_ROOT / 'data' / 'config' / 'skillTreeConfig.json'
+PROTO_CONFIG_PATH = REPO_ROOT / 'data' / 'proto' / 'skillTreeConfig.json'
+OVERRIDES_PATH = REPO_ROOT / 'config' / 'skill-tree-config.json'
+PROTO_OVERRIDES_PATH = REPO_ROOT / 'data' / 'proto' / 'config.json'
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Bump whenever SkillNode/SkillTree/SkillConfig change shape so stale pickles are ignored
+CACHE_VERSION = 1
+
+# Tree fields an override file may set
+TREE_SETTINGS = ('name', 'color', 'visible')
+
+# Configs already loaded by this process, by (resolved path, content hash)
+_loaded = {}
+
+
+class SkillNode:
+    """Flat, picklable record for one skill node."""
+
+    __slots__ = ('id', 'svg_id', 'tree', 'name', 'description', 'branch', 'position', 'tier',
+                 'prerequisites', 'x', 'y', 'radius', 'is_key_node', 'max_points',
+                 'points_required_in_tree', 'icon_path', 'data')
+
+    def __init__(self, data):
+        self.data = data          # the node's JSON object, overrides applied
+        self.id = data['id']
+        self.svg_id = data.get('svgId')
+        self.tree = data.get('tree')
+        self.name = data.get('name')
+        self.description = data.get('description')
+        self.branch = data.get('branch')
+        self.position = data.get('position')
+        self.tier = data.get('tier')
+        self.prerequisites = data.get('prerequisites', [])   # ids (AND) or lists of ids (OR groups)
+        self.x = data['x']
+        self.y = data['y']
+        self.radius = data['radius']
+        self.is_key_node = data.get('isKeyNode', False)
+        self.max_points = data.get('maxPoints', 1)
+        self.points_required_in_tree = data.get('pointsRequiredInTree', 0)
+        self.icon_path = data.get('iconPath')
+
+    def __repr__(self):
+        return f'<SkillNode {self.id} max_points={self.max_points}>'
+
+
+class SkillTree:
+    """One tree: its settings, nodes in file order and connector paths."""
+
+    __slots__ = ('id', 'name', 'color', 'visible', 'transform', 'nodes', 'paths', 'multi_point')
+
+    def __init__(self, tree_id, data):
+        self.id = data.get('id', tree_id)
+        self.name = data.get('name')
+        self.color = data.get('color')
+        self.visible = data.get('visible', True)
+        self.transform = data.get('transform')
+        self.nodes = [SkillNode(node) for node in data.get('nodes', ())]
+        self.paths = list(data.get('paths', ()))   # {id, svgId, from, to, tree} objects
+        self.multi_point = [node for node in self.nodes if node.max_points > 1]
+
+    def __repr__(self):
+        return f'<SkillTree {self.id} nodes={len(self.nodes)}>'
+
+
+class SkillConfig:
+    """Lookup tables over every tree and node of one skill tree config."""
+
+    def __init__(self, data, config_hash, config_path):
+        self.data = data
+        self.config_hash = config_hash
+        self.config_path = str(config_path)
+        self.version = data.get('version')
+        self.max_skill_points = data.get('maxSkillPoints')
+
+        self.trees = {tree_id: SkillTree(tree_id, tree) for tree_id, tree in data['trees'].items()}
+        self.nodes = {}
+        self.multi_point = []
+        for tree in self.trees.values():
+            for node in tree.nodes:
+                self.nodes.setdefault(node.id, node)
+            self.multi_point.extend(tree.multi_point)
+
+    def get(self, node_id, default=None):
+        return self.nodes.get(node_id, default)
+
+    def __iter__(self):
+        """Every node, tree by tree in file order."""
+        return (node for tree in self.trees.values() for node in tree.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+def is_overrides(data):
+    """True for editor override files: tree settings without nodes, plus nodeOverrides."""
+    return 'nodeOverrides' in data or any('nodes' not in tree for tree in data.get('trees', {}).values())
+
+
+def apply_overrides(base, overrides):
+    """A full config: `base` with the override file's tree settings and node overrides applied."""
+    node_overrides = overrides.get('nodeOverrides') or {}
+    trees = {}
+    for tree_id, tree in base['trees'].items():
+        settings = overrides.get('trees', {}).get(tree_id, {})
+        trees[tree_id] = {**tree, **{key: settings[key] for key in TREE_SETTINGS if key in settings},
+                          'nodes': [{**node, **node_overrides.get(node['id'], {})} for node in tree['nodes']]}
+    return {**base, 'trees': trees}
+
+
+def _cache_file(config_path, config_hash):
+    # Both skillTreeConfig.json copies share a stem, so the path is part of the name
+    path_key = hashlib.sha256(str(Path(config_path).resolve()).encode('utf-8')).hexdigest()[:8]
+    return CACHE_DIR / f'config-{Path(config_path).stem}-{path_key}-{config_hash[:16]}.pickle'
+
+
+def load_config(config_path=CONFIG_PATH, base=None, use_cache=True):
+    """
+    Load a skill tree config, reusing the on-disk cache when the content hash
+    matches. Override files are applied to `base` (default: the main
+    config). The cache is best effort: unreadable or stale pickles are rebuilt
+    and write failures are ignored. Raises ValueError for invalid JSON.
+    """
+    config_path = Path(config_path)
+    raw = config_path.read_bytes()
+    data = None
+    config_hash = hashlib.sha256(raw).hexdigest()
+    base_raw = None
+    # Only parse up front when the file may be an override file
+    if base is not None or b'"nodeOverrides"' in raw or b'"nodes"' not in raw:
+        data = json.loads(raw)
+        if is_overrides(data):
+            base_raw = Path(base or CONFIG_PATH).read_bytes()
+            config_hash = hashlib.sha256(raw + b'\0' + base_raw).hexdigest()
+
+    key = (str(config_path.resolve()), config_hash)
+    if key in _loaded:
+        return _loaded[key]
+
+    cache_file = _cache_file(config_path, config_hash)
+    config = None
+    if use_cache and cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                version, config = pickle.load(f)
+            if version != CACHE_VERSION or config.config_hash != config_hash:
+                config = None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            config = None
+
+    if config is None:
+        data = json.loads(raw) if data is None else data
+        if base_raw is not None:
+            data = apply_overrides(json.loads(base_raw), data)
+        config = SkillConfig(data, config_hash, config_path)
+        if use_cache:
+            _write_cache(cache_file, config)
+
+    _loaded[key] = config
+    return config
+
+
+def _write_cache(cache_file, config):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Drop pickles of earlier revisions of the same file
+        prefix = cache_file.name.rsplit('-', 1)[0]
+        for stale in CACHE_DIR.glob(f'{prefix}-*.pickle'):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+        # build.py runs stages in parallel, so each writer needs its own temp file
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=f'{cache_file.stem}-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((CACHE_VERSION, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+if __name__ == '__main__':
+    import time
+
+    paths = [Path(arg) for arg in sys.argv[1:]] or [CONFIG_PATH, PROTO_CONFIG_PATH, OVERRIDES_PATH]
+    for path in paths:
+        start = time.perf_counter()
+        config = load_config(path)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{path.relative_to(REPO_ROOT) if path.is_absolute() else path}: {len(config)} nodes in "
+              f"{len(config.trees)} trees, {len(config.multi_point)} multi-point ({elapsed:.1f} ms)")
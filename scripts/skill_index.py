@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Prerequisite graph of the skill tree config, precomputed for the frontend.
+
+Writes data/skillIndex.json (compact JSON), imported through
+data/skillIndex.ts, so data/skillLogic.ts never scans the node list to
+resolve a prerequisite or find a dependent. Nodes are referred to by their
+position in `ids` (config order):
+
+    {
+      "ids": ["tree-a-node-0", ...],
+      "indexOf": {"tree-a-node-0": 0, ...},
+      "trees": {"A": [node indices], ...},
+      "prerequisites": [[[group], ...] per node],   each group must be complete;
+                                                    one group for AND lists, one
+                                                    per alternative for OR lists
+      "dependents": [[direct dependents] per node],
+      "ancestors": [[transitive prerequisites] per node],
+      "cascade": [[transitive dependents, prerequisites first] per node],
+      "order": [every node index, prerequisites first]
+    }
+
+`cascade` is every node that can become invalid when a node is emptied (the
+ones with another complete OR group stay valid, so it is the set to
+recheck), listed so each node comes after its prerequisites and one pass
+settles it. Only structure is stored: point limits and gates can be
+changed by editor overrides at runtime, so they are read from the nodes.
+
+Usage:
+    python skill_index.py            # regenerate data/skillIndex.json from the config
+    python skill_index.py --check    # exit 1 if the committed file is stale
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from skill_config import load_config
+
+OUTPUT_PATH = Path(__file__).parent.parent / 'data' / 'skillIndex.json'
+
+
+def prerequisite_groups(node):
+    """The node's prerequisites as alternative groups of required ids."""
+    prerequisites = node.prerequisites
+    if not prerequisites:
+        return []
+    if isinstance(prerequisites[0], list):
+        return [list(group) for group in prerequisites]
+    return [list(prerequisites)]
+
+
+def topological_order(count, prerequisites, dependents):
+    """Node indices with every prerequisite before its dependents (config order among peers)."""
+    waiting = [len({p for group in groups for p in group}) for groups in prerequisites]
+    ready = [i for i in range(count) if not waiting[i]]
+    order = []
+    while ready:
+        ready.sort(reverse=True)
+        node = ready.pop()
+        order.append(node)
+        for dependent in dependents[node]:
+            waiting[dependent] -= 1
+            if not waiting[dependent]:
+                ready.append(dependent)
+    if len(order) != count:
+        raise ValueError(f"prerequisite cycle through {count - len(order)} node(s)")
+    return order
+
+
+def closure(order, edges):
+    """Transitive closure of `edges` ({node: direct neighbours}), visiting nodes in `order`."""
+    reached = {}
+    for node in order:
+        found = set(edges[node])
+        for neighbour in edges[node]:
+            found |= reached[neighbour]
+        reached[node] = found
+    return reached
+
+
+def build(config=None):
+    config = load_config() if config is None else config
+    nodes = list(config)
+    index_of = {node.id: i for i, node in enumerate(nodes)}
+
+    prerequisites = []
+    for node in nodes:
+        groups = []
+        for group in prerequisite_groups(node):
+            unknown = [node_id for node_id in group if node_id not in index_of]
+            if unknown:
+                raise ValueError(f"{node.id}: unknown prerequisite(s) {', '.join(unknown)}")
+            groups.append([index_of[node_id] for node_id in group])
+        prerequisites.append(groups)
+
+    direct = [sorted({p for group in groups for p in group}) for groups in prerequisites]
+    dependents = [[] for _ in nodes]
+    for i, required in enumerate(direct):
+        for p in required:
+            dependents[p].append(i)
+
+    order = topological_order(len(nodes), prerequisites, dependents)
+    ancestors = closure(order, dict(enumerate(direct)))
+    cascade = closure(order[::-1], dict(enumerate(dependents)))
+    position = {node: i for i, node in enumerate(order)}
+
+    return {
+        'ids': [node.id for node in nodes],
+        'indexOf': index_of,
+        'trees': {tree_id: [index_of[node.id] for node in tree.nodes] for tree_id, tree in config.trees.items()},
+        'prerequisites': prerequisites,
+        'dependents': dependents,
+        'ancestors': [sorted(ancestors[i]) for i in range(len(nodes))],
+        'cascade': [sorted(cascade[i], key=position.__getitem__) for i in range(len(nodes))],
+        'order': order,
+    }
+
+
+def render(data):
+    return json.dumps(data, separators=(',', ':')) + '\n'
+
+
+def write(path=OUTPUT_PATH, config=None):
+    """Regenerate the skill index file; returns True if it changed."""
+    data = build(config)
+    text = render(data)
+    path = Path(path)
+    changed = not path.exists() or path.read_text(encoding='utf-8') != text
+    if changed:
+        path.write_text(text, encoding='utf-8')
+    edges = sum(len(dependents) for dependents in data['dependents'])
+    print(f"{path.name}: {len(data['ids'])} nodes, {edges} prerequisite edges, {len(text):,} bytes"
+          f"{'' if changed else ' (unchanged)'}")
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write the prerequisite/dependent index of the skill config')
+    parser.add_argument('--check', action='store_true', help='fail if data/skillIndex.json is stale')
+    parser.add_argument('-o', '--output', type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    if args.check:
+        current = args.output.read_text(encoding='utf-8') if args.output.exists() else ''
+        if current != render(build()):
+            print(f"{args.output.name} is out of date; run python scripts/skill_index.py", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ {args.output.name} is up to date")
+        return
+    write(args.output)
+
+
+if __name__ == '__main__':
+    main()
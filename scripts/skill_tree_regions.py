@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Generators for the marker-delimited regions of components/SkillTree.tsx.
+
+    point-containers   children of <g id="all-point-containers">  (map over containerShapes)
+    lock-icons         children of <g id="all-lock-icons">        (map over lockShapes)
+    point-numbers      static point number layer                  (point_numbers_tsx.txt)
+
+The container and lock geometry itself lives in data/overlayData.json,
+written from the SVG by overlay_data.py, so these regions stay a few lines
+long. Each generator returns the region body relative to its begin marker;
+the region engine in tsx_edit.py does the indenting, splicing and writing.
+
+Usage:
+    python skill_tree_regions.py                      # regenerate every known region in the file
+    python skill_tree_regions.py lock-icons --dry-run
+"""
+
+import argparse
+from pathlib import Path
+
+from tsx_edit import SKILL_TREE_TSX, RegionError, find_regions, read_text, update_regions
+
+SCRIPTS_DIR = Path(__file__).parent
+POINT_NUMBERS_PATH = SCRIPTS_DIR / 'point_numbers_tsx.txt'
+
+# Element whose children become the region when a file has no markers yet
+ANCHORS = {
+    'point-containers': '<g id="all-point-containers">',
+    'lock-icons': '<g id="all-lock-icons">',
+}
+
+# Containers and locks are rendered from data/overlayData.json (overlay_data.py)
+CONTAINER_MAP = """\
+{containerShapes.map((shape) => {
+  if (!shouldShowContainer(shape.nodeId)) return null;
+  const pos = getNodeTransformedPosition(shape.nodeId, shape.tree);
+  return (
+    <g key={shape.id} transform={getContainerTransform(shape.tree, pos.x, pos.y)}>
+      <path id={shape.id} d={shape.d} fill="#090c19" stroke={getNodeColor(shape.nodeId)} strokeWidth="0.7" opacity="1" />
+    </g>
+  );
+})}"""
+
+LOCK_MAP = """\
+{lockShapes.map((lock) => {
+  if (!shouldShowLock(lock.nodeId)) return null;
+  const pos = getNodeTransformedPosition(lock.nodeId, lock.tree);
+  const color = getLockColor(lock.nodeId);
+  return (
+    <g
+      key={lock.id}
+      id={lock.id}
+      style={{ display: "inline" }}
+      transform={getLockTransform(lock.tree, lock.translateX, lock.translateY, pos.x, pos.y)}
+    >
+      <ellipse
+        style={{ opacity: 1, mixBlendMode: "normal", fill: color, fillOpacity: 1, fillRule: "nonzero", stroke: color, strokeWidth: 0.9, strokeDasharray: "none", strokeOpacity: 1 }}
+        {...lockIcon.ellipse}
+      />
+      <rect
+        style={{ opacity: 1, fill: "#090c19", fillOpacity: 1, stroke: "none", strokeWidth: 0.899999 }}
+        {...lockIcon.rect}
+      />
+      <path
+        style={{ opacity: 1, fill: "none", fillOpacity: 1, stroke: "#090c19", strokeWidth: 0.8, strokeLinecap: "round" }}
+        d={lock.d}
+      />
+    </g>
+  );
+})}"""
+
+
+def container_map():
+    """Render every container from containerShapes."""
+    return CONTAINER_MAP
+
+
+def lock_map():
+    """Render every lock from lockShapes and the shared lockIcon geometry."""
+    return LOCK_MAP
+
+
+def point_number_layer(text=None):
+    """The pre-rendered point number <svg> layer, verbatim."""
+    return read_text(POINT_NUMBERS_PATH) if text is None else text
+
+
+GENERATORS = {
+    'point-containers': container_map,
+    'lock-icons': lock_map,
+    'point-numbers': point_number_layer,
+}
+
+
+def regenerate(names=None, dry_run=False, path=SKILL_TREE_TSX):
+    """
+    Regenerate the named regions (default: every region with markers or an anchor)
+    in a single atomic write. Returns the names of the regions that changed.
+    """
+    if names is None:
+        present = find_regions(read_text(path))
+        names = [name for name in GENERATORS if name in present or name in ANCHORS]
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        raise SystemExit(f"Unknown region(s): {', '.join(unknown)} (known: {', '.join(GENERATORS)})")
+    return update_regions(path, {name: GENERATORS[name] for name in names}, dry_run, ANCHORS)
+
+
+def main(names=None, description='Regenerate generated regions of SkillTree.tsx'):
+    parser = argparse.ArgumentParser(description=description)
+    if names is None:
+        parser.add_argument('regions', nargs='*', help=f"regions to regenerate ({', '.join(GENERATORS)})")
+    parser.add_argument('--dry-run', action='store_true', help='print a unified diff instead of writing')
+    args = parser.parse_args()
+    try:
+        regenerate(names or args.regions or None, args.dry_run)
+    except RegionError as e:
+        raise SystemExit(f"ERROR: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Single-pass index over assets/ArcRaidersTree.svg shared by the scripts/ tools.
+
+The SVG is parsed once into flat element records (id, inkscape:label, layer,
+parent links and resolved transforms). The index is pickled under
+scripts/.cache keyed on the SVG content hash, so a rerun loads it without
+touching the XML parser again.
+
+Usage:
+    from svg_index import load_index
+
+    index = load_index()
+    path = index.get('path69')
+    layer = index.layer('Tree C')
+    for child in index.children(layer):
+        print(child.id, child.label)
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from svg_transforms import IDENTITY, multiply, parse_transform
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SVG_PATH = REPO_ROOT / 'assets' / 'ArcRaidersTree.svg'
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Bump whenever SvgElement/SvgIndex change shape so stale pickles are ignored
+CACHE_VERSION = 1
+
+NAMESPACES = {
+    'svg': 'http://www.w3.org/2000/svg',
+    'inkscape': 'http://www.inkscape.org/namespaces/inkscape',
+    'sodipodi': 'http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd',
+    'xlink': 'http://www.w3.org/1999/xlink',
+    'xml': 'http://www.w3.org/XML/1998/namespace',
+}
+_PREFIXES = {uri: prefix for prefix, uri in NAMESPACES.items()}
+
+# Processes that already loaded an index reuse it instead of hitting the disk
+_loaded = {}
+
+
+def _short_name(name):
+    """Turn '{uri}local' into 'prefix:local' ('local' for the SVG namespace)."""
+    if not name.startswith('{'):
+        return name
+    uri, local = name[1:].split('}', 1)
+    prefix = _PREFIXES.get(uri)
+    if prefix is None or prefix == 'svg':
+        return local
+    return f'{prefix}:{local}'
+
+
+class SvgElement:
+    """Flat, picklable record for one SVG element."""
+
+    __slots__ = ('index', 'tag', 'id', 'label', 'attrib', 'text',
+                 'parent', 'children', 'layer', 'ctm')
+
+    def __init__(self, index, tag, attrib, text, parent):
+        self.index = index
+        self.tag = tag
+        self.attrib = attrib
+        self.id = attrib.get('id')
+        self.label = attrib.get('inkscape:label')
+        self.text = text
+        self.parent = parent      # index of the parent element, None for the root
+        self.children = []        # indices of child elements, in document order
+        self.layer = None         # index of the enclosing Inkscape layer, if any
+        self.ctm = IDENTITY       # transform from element coordinates to the document
+
+    def get(self, name, default=None):
+        return self.attrib.get(name, default)
+
+    def __repr__(self):
+        label = f' {self.label!r}' if self.label else ''
+        return f'<SvgElement {self.tag} id={self.id!r}{label}>'
+
+
+class SvgIndex:
+    """Lookup tables over every element of one SVG document."""
+
+    def __init__(self, elements, svg_hash, svg_path):
+        self.elements = elements
+        self.svg_hash = svg_hash
+        self.svg_path = str(svg_path)
+
+        self.by_id = {}
+        self.by_label = {}
+        self.layers = {}
+        for element in elements:
+            if element.id:
+                self.by_id.setdefault(element.id, element)
+            if element.label:
+                self.by_label.setdefault(element.label, []).append(element)
+            if element.tag == 'g' and element.get('inkscape:groupmode') == 'layer':
+                self.layers.setdefault(element.label or element.id, element)
+
+    @property
+    def root(self):
+        return self.elements[0]
+
+    def get(self, element_id, default=None):
+        return self.by_id.get(element_id, default)
+
+    def find_label(self, label):
+        """First element carrying the given inkscape:label, or None."""
+        matches = self.by_label.get(label)
+        return matches[0] if matches else None
+
+    def find_all_label(self, label):
+        return list(self.by_label.get(label, ()))
+
+    def layer(self, label):
+        return self.layers.get(label)
+
+    def layer_of(self, element):
+        return None if element.layer is None else self.elements[element.layer]
+
+    def parent(self, element):
+        return None if element.parent is None else self.elements[element.parent]
+
+    def ancestors(self, element):
+        """Parents of the element, nearest first."""
+        while element.parent is not None:
+            element = self.elements[element.parent]
+            yield element
+
+    def children(self, element):
+        return [self.elements[i] for i in element.children]
+
+    def descendants(self, element):
+        """All elements below the given one, in document order."""
+        stack = list(reversed(element.children))
+        while stack:
+            child = self.elements[stack.pop()]
+            yield child
+            stack.extend(reversed(child.children))
+
+    def layer_children(self, label):
+        layer = self.layer(label)
+        return self.children(layer) if layer is not None else []
+
+    def iter(self, tag=None):
+        if tag is None:
+            return iter(self.elements)
+        return (element for element in self.elements if element.tag == tag)
+
+
+def build_index(data, svg_hash, svg_path):
+    """Parse the raw SVG bytes into an SvgIndex in one walk of the tree."""
+    root = ET.fromstring(data)
+    elements = []
+
+    # Iterative depth-first walk: (xml element, parent index, layer index, parent ctm)
+    stack = [(root, None, None, IDENTITY)]
+    while stack:
+        node, parent, layer, parent_ctm = stack.pop()
+        attrib = {_short_name(key): value for key, value in node.attrib.items()}
+        text = node.text.strip() if node.text and node.text.strip() else None
+        element = SvgElement(len(elements), _short_name(node.tag), attrib, text, parent)
+
+        transform = attrib.get('transform')
+        element.ctm = multiply(parent_ctm, parse_transform(transform)) if transform else parent_ctm
+        element.layer = layer
+        elements.append(element)
+        if parent is not None:
+            elements[parent].children.append(element.index)
+
+        child_layer = layer
+        if element.tag == 'g' and attrib.get('inkscape:groupmode') == 'layer':
+            child_layer = element.index
+        for child in reversed(list(node)):
+            stack.append((child, element.index, child_layer, element.ctm))
+
+    return SvgIndex(elements, svg_hash, svg_path)
+
+
+def _cache_file(svg_path, svg_hash):
+    return CACHE_DIR / f'{Path(svg_path).stem}-{svg_hash[:16]}.pickle'
+
+
+def load_index(svg_path=SVG_PATH, use_cache=True):
+    """
+    Load the index for an SVG file, reusing the on-disk cache when the content
+    hash matches. The cache is best effort: unreadable or stale pickles are
+    rebuilt and write failures are ignored.
+    """
+    svg_path = Path(svg_path)
+    data = svg_path.read_bytes()
+    svg_hash = hashlib.sha256(data).hexdigest()
+
+    key = (str(svg_path.resolve()), svg_hash)
+    if key in _loaded:
+        return _loaded[key]
+
+    cache_file = _cache_file(svg_path, svg_hash)
+    index = None
+    if use_cache and cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                version, index = pickle.load(f)
+            if version != CACHE_VERSION or index.svg_hash != svg_hash:
+                index = None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            index = None
+
+    if index is None:
+        index = build_index(data, svg_hash, svg_path)
+        if use_cache:
+            _write_cache(cache_file, index)
+
+    _loaded[key] = index
+    return index
+
+
+def _write_cache(cache_file, index):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Drop pickles of earlier revisions of the same SVG
+        for stale in CACHE_DIR.glob(f'{Path(index.svg_path).stem}-*.pickle'):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+        # build.py runs stages in parallel, so each writer needs its own temp file
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=f'{cache_file.stem}-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((CACHE_VERSION, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+if __name__ == '__main__':
+    import time
+
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else SVG_PATH
+    start = time.perf_counter()
+    index = load_index(path)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Indexed {len(index.elements)} elements from {path.name} in {elapsed:.1f} ms")
+    print(f"  ids: {len(index.by_id)}, labels: {len(index.by_label)}, layers: {len(index.layers)}")
+    for label, layer in index.layers.items():
+        print(f"  layer {label!r} ({layer.id}): {len(layer.children)} children, transform={layer.get('transform')}")
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Typed grammar for the inkscape:label conventions used in ArcRaidersTree.svg.
+
+Every tool that needs to understand a label goes through parse_label(), so
+"Tree A container node 2-6 3-3" always normalizes to tree 'A', kind
+'container' and skill id 'tree-a-node-2-6-3-3'. Recognized labels:
+
+    Tree A                                   kind 'tree'
+    Tree A node 2-6 3-3                      kind 'node'
+    Tree A container node 2-6 3-3            kind 'container'
+    Tree A lock 1-3                          kind 'lock'
+    Tree A path 0                            kind 'path' (bottom connector)
+    Tree A path node 1-3 to node 3-1         kind 'path'
+    Tree BoundingBoxes / Tree Titles         kind 'bounding-boxes' / 'titles'
+
+A "Tree A" shape inside the BoundingBoxes or Titles layer is recorded as
+kind 'bounding-box' / 'title' by LabelTable.
+
+LabelTable indexes the elements of an SvgIndex by (tree, kind, node) in a
+single scan, so "container for tree-b-node-3-2" is a dict lookup.
+"""
+
+import re
+import sys
+from typing import NamedTuple, Optional
+
+TREES = ('A', 'B', 'C', 'D')
+
+_NODE = r'\d+(?:-\d+)*(?:[ ]\d+(?:-\d+)*)*'
+
+LABEL_RE = re.compile(
+    rf'''^Tree\ (?:
+        (?P<special>BoundingBoxes|Titles)
+      | (?P<tree>[A-D])
+        (?:\ (?:
+            (?P<kind>node|container\ node|lock)\ (?P<node>{_NODE})
+          | path\ (?:
+                node\ (?P<from>{_NODE})\ to\ node\ (?P<to>{_NODE})
+              | (?P<root>{_NODE})
+            )
+        ))?
+    )$''',
+    re.VERBOSE,
+)
+
+SKILL_ID_RE = re.compile(r'^tree-([a-d])-(node|path)-(.+)$')
+
+_SPECIAL_KINDS = {'BoundingBoxes': 'bounding-boxes', 'Titles': 'titles'}
+_KINDS = {'node': 'node', 'container node': 'container', 'lock': 'lock'}
+# Per-tree shapes drawn inside the special layers
+_LAYER_SHAPE_KINDS = {'bounding-boxes': 'bounding-box', 'titles': 'title'}
+
+
+def normalize_node(node):
+    """'2-6 3-3' -> '2-6-3-3' (the form used in skill ids and container ids)."""
+    return node.strip().replace(' ', '-')
+
+
+class TreeLabel(NamedTuple):
+    """One parsed inkscape:label."""
+
+    raw: str
+    kind: str
+    tree: Optional[str] = None
+    node: Optional[str] = None      # node part as written in the label, e.g. '2-6 3-3'
+    target: Optional[str] = None    # destination node for 'path node X to node Y'
+
+    @property
+    def key(self):
+        """Normalized node part used for lookups ('0-to-1-1' for connector paths)."""
+        if self.node is None:
+            return None
+        if self.target is not None:
+            return f'{normalize_node(self.node)}-to-{normalize_node(self.target)}'
+        return normalize_node(self.node)
+
+    @property
+    def skill_id(self):
+        """Config id: 'tree-a-node-2-6-3-3' for nodes, 'tree-a-path-0-to-1-1' for paths."""
+        if self.tree is None or self.node is None:
+            return None
+        if self.kind == 'path':
+            return f'tree-{self.tree.lower()}-path-{self.key}'
+        return node_skill_id(self.tree, self.node)
+
+    @property
+    def target_id(self):
+        if self.tree is None or self.target is None:
+            return None
+        return node_skill_id(self.tree, self.target)
+
+    @property
+    def container_id(self):
+        """Element id of the container overlay in SkillTree.tsx."""
+        if self.tree is None or self.node is None:
+            return None
+        return f'container-{self.tree.lower()}-{normalize_node(self.node)}'
+
+    @property
+    def lock_id(self):
+        """Element id of the lock overlay in SkillTree.tsx (keeps the label's spaces)."""
+        if self.tree is None or self.node is None:
+            return None
+        return f'lock-{self.tree.lower()}-{self.node}'
+
+
+def node_skill_id(tree, node):
+    return f'tree-{tree.lower()}-node-{normalize_node(node)}'
+
+
+def split_skill_id(skill_id):
+    """'tree-b-node-3-2' -> ('B', 'node', '3-2'); None for anything else."""
+    match = SKILL_ID_RE.match(skill_id)
+    if not match:
+        return None
+    tree, kind, key = match.groups()
+    return tree.upper(), kind, key
+
+
+def parse_label(label):
+    """Parse an inkscape:label into a TreeLabel, or None if it is not a tree label."""
+    if not label:
+        return None
+    match = LABEL_RE.match(label.strip())
+    if not match:
+        return None
+
+    if match.group('special'):
+        return TreeLabel(label, _SPECIAL_KINDS[match.group('special')])
+
+    tree = match.group('tree')
+    if match.group('kind'):
+        return TreeLabel(label, _KINDS[match.group('kind')], tree, match.group('node'))
+    if match.group('from'):
+        return TreeLabel(label, 'path', tree, match.group('from'), match.group('to'))
+    if match.group('root'):
+        return TreeLabel(label, 'path', tree, match.group('root'))
+    return TreeLabel(label, 'tree', tree)
+
+
+class LabelTable:
+    """(tree, kind, node key) -> element lookup over one SvgIndex."""
+
+    def __init__(self, index):
+        self.index = index
+        self.labels = {}        # element index -> TreeLabel
+        self.entries = {}       # (tree, kind, key) -> element
+        self.duplicates = []    # (TreeLabel, element) pairs that lost to an earlier element
+
+        tree_layers = {}
+        special_layers = {}
+        for element in index.elements:
+            parsed = parse_label(element.label)
+            if parsed is None:
+                continue
+
+            if parsed.kind == 'tree' and element.tag == 'g':
+                tree_layers[element.index] = parsed.tree
+                self.labels[element.index] = parsed
+                self.entries.setdefault((parsed.tree, 'tree', None), element)
+                continue
+            if parsed.kind in _LAYER_SHAPE_KINDS:
+                special_layers[element.index] = _LAYER_SHAPE_KINDS[parsed.kind]
+            elif parsed.kind == 'tree' and element.layer in special_layers:
+                parsed = parsed._replace(kind=special_layers[element.layer])
+            self.labels[element.index] = parsed
+
+            # Tree layers are authoritative: a path copied from Tree B into the
+            # Tree C layer keeps its "Tree B path ..." label but belongs to C.
+            tree = tree_layers.get(element.layer, parsed.tree)
+            if tree != parsed.tree:
+                parsed = parsed._replace(tree=tree)
+                self.labels[element.index] = parsed
+
+            key = (parsed.tree, parsed.kind, parsed.key)
+            if key in self.entries:
+                self.duplicates.append((parsed, element))
+            else:
+                self.entries[key] = element
+
+        self.tree_layers = {tree: index.elements[i] for i, tree in tree_layers.items()}
+
+    def label(self, element):
+        return self.labels.get(element.index)
+
+    def find(self, tree, kind, node=None):
+        """Element for ('B', 'container', '3-2'); node may use spaces or dashes."""
+        key = normalize_node(node) if node is not None else None
+        return self.entries.get((tree.upper() if tree else None, kind, key))
+
+    def get(self, kind, skill_id):
+        """Element of the given kind for a config id, e.g. ('container', 'tree-b-node-3-2')."""
+        parts = split_skill_id(skill_id)
+        if parts is None:
+            return None
+        tree, _, key = parts
+        return self.entries.get((tree, kind, key))
+
+    def items(self, kind=None, tree=None):
+        """(TreeLabel, element) pairs in document order, optionally filtered."""
+        for (entry_tree, entry_kind, _), element in sorted(self.entries.items(),
+                                                           key=lambda item: item[1].index):
+            if kind is not None and entry_kind != kind:
+                continue
+            if tree is not None and entry_tree != tree:
+                continue
+            yield self.labels[element.index], element
+
+
+def load_labels(index=None):
+    """Build the LabelTable for the shared SVG index."""
+    if index is None:
+        from svg_index import load_index
+        index = load_index()
+    return LabelTable(index)
+
+
+if __name__ == '__main__':
+    table = load_labels()
+    counts = {}
+    for parsed, _ in table.items():
+        counts[parsed.kind] = counts.get(parsed.kind, 0) + 1
+
+    print(f"Parsed {len(table.labels)} tree labels into {len(table.entries)} lookup entries")
+    for kind, count in sorted(counts.items()):
+        print(f"  {kind}: {count}")
+    for parsed, element in table.duplicates:
+        print(f"  duplicate: {parsed.raw!r} ({element.id}) in tree {parsed.tree}")
+
+    for skill_id in sys.argv[1:]:
+        for kind in ('node', 'container', 'lock'):
+            element = table.get(kind, skill_id)
+            if element is not None:
+                print(f"{skill_id} {kind}: {element.id}")
@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+SVG path-data parser with NumPy-vectorized geometry.
+
+parse_path() tokenizes a `d` string and resolves every command (absolute or
+relative M/L/H/V/C/S/Q/T/A/Z) to absolute cubic Bezier segments. Lines and
+quadratics are converted exactly, arcs are split into <= 90 degree cubic
+pieces. PathBatch stacks the segments of many paths into one (N, 4, 2)
+array so bounding boxes, centroids, start/end points and lengths for all
+paths are computed in a single vectorized pass.
+
+Usage:
+    from svg_paths import PathBatch
+
+    batch = PathBatch.from_strings(path_data.values())
+    boxes = batch.bounds()        # (P, 4): min_x, min_y, max_x, max_y
+    centers = batch.centroids()   # (P, 2), arc-length weighted
+"""
+
+import math
+import re
+import sys
+
+import numpy as np
+
+# Segment kinds: every segment is stored as a cubic, the kind only matters
+# when writing the path back out
+LINE, CUBIC, CLOSE = 0, 1, 2
+
+_TOKEN_RE = re.compile(r'[MmZzLlHhVvCcSsQqTtAa]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+_ARG_COUNTS = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0}
+
+# 10-point Gauss-Legendre rule on [0, 1] for arc-length integrals
+_GL_X, _GL_W = np.polynomial.legendre.leggauss(10)
+_GL_T = (_GL_X + 1) / 2
+_GL_W = _GL_W / 2
+
+
+class PathGeometry:
+    """Absolute cubic segments of one path."""
+
+    __slots__ = ('segments', 'kinds', 'starts', 'start')
+
+    def __init__(self, segments, kinds, starts, start):
+        self.segments = segments    # (k, 4, 2) float64 control points
+        self.kinds = kinds          # (k,) uint8: LINE, CUBIC or CLOSE
+        self.starts = starts        # (k,) bool: segment opens a new subpath
+        self.start = start          # first moveto point, kept for segment-less paths
+
+    def __len__(self):
+        return len(self.segments)
+
+    def to_d(self, precision=5):
+        """Serialize as an absolute M/L/C/Z path."""
+        def fmt(point):
+            return ','.join(_format_number(v, precision) for v in point)
+
+        parts = []
+        if not len(self.segments):
+            return f'M {fmt(self.start)}'
+        for segment, kind, starts in zip(self.segments, self.kinds, self.starts):
+            if starts:
+                parts.append(f'M {fmt(segment[0])}')
+            if kind == CLOSE:
+                parts.append('Z')
+            elif kind == LINE:
+                parts.append(f'L {fmt(segment[3])}')
+            else:
+                parts.append(f'C {fmt(segment[1])} {fmt(segment[2])} {fmt(segment[3])}')
+        return ' '.join(parts)
+
+    def to_relative_d(self, precision=3):
+        """
+        Serialize as a compact relative m/l/h/v/c/z path.
+
+        Coordinates are snapped to a 10**-precision grid first and every
+        offset is taken from the previous *snapped* point, so rounding errors
+        never accumulate along the path: each absolute control point ends up
+        within half a grid step of the original.
+        """
+        scale = 10 ** precision
+
+        def snap(point):
+            return (int(round(point[0] * scale)), int(round(point[1] * scale)))
+
+        writer = _CompactWriter(precision)
+        if not len(self.segments):
+            writer.command('M', snap(self.start))
+            return writer.text()
+
+        current = subpath_start = None
+        for segment, kind, starts in zip(self.segments, self.kinds, self.starts):
+            if starts:
+                point = snap(segment[0])
+                if current is None:
+                    writer.command('M', point)
+                else:
+                    writer.command('m', (point[0] - current[0], point[1] - current[1]))
+                current = subpath_start = point
+            if kind == CLOSE:
+                writer.command('z', ())
+                current = subpath_start
+                continue
+            end = snap(segment[3])
+            dx, dy = end[0] - current[0], end[1] - current[1]
+            if kind == LINE:
+                if dy == 0:
+                    writer.command('h', (dx,))
+                elif dx == 0:
+                    writer.command('v', (dy,))
+                else:
+                    writer.command('l', (dx, dy))
+            else:
+                c1, c2 = snap(segment[1]), snap(segment[2])
+                writer.command('c', (c1[0] - current[0], c1[1] - current[1],
+                                     c2[0] - current[0], c2[1] - current[1], dx, dy))
+            current = end
+        return writer.text()
+
+
+class _CompactWriter:
+    """Joins path commands with the fewest separators SVG allows."""
+
+    def __init__(self, precision):
+        self.precision = precision
+        self.parts = []
+        self.last_command = None
+        self.last_number = None
+
+    def number(self, units):
+        text = f'{units / 10 ** self.precision:.{self.precision}f}'.rstrip('0').rstrip('.')
+        if text in ('', '-0'):
+            text = '0'
+        if text.startswith('0.'):
+            text = text[1:]
+        elif text.startswith('-0.'):
+            text = '-' + text[2:]
+        return text
+
+    def command(self, letter, values):
+        # A repeated command letter may be omitted (after 'm' the implicit command is 'l')
+        implicit = {'m': 'l', 'M': 'L'}.get(self.last_command, self.last_command)
+        if not (values and letter == implicit and self.last_number is not None):
+            self.parts.append(letter)
+            self.last_number = None
+        for units in values:
+            text = self.number(units)
+            previous = self.last_number
+            if previous is not None and not (text[0] == '-' or (text[0] == '.' and '.' in previous)):
+                self.parts.append(' ')
+            self.parts.append(text)
+            self.last_number = text
+        self.last_command = letter
+
+    def text(self):
+        return ''.join(self.parts)
+
+
+def _format_number(value, precision):
+    text = f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+    return '0' if text in ('', '-0') else text
+
+
+def tokenize(d):
+    """Split path data into command letters and number strings."""
+    return _TOKEN_RE.findall(d)
+
+
+class _Tokens:
+    def __init__(self, d):
+        self.items = tokenize(d)
+        self.pos = 0
+
+    def has_number(self):
+        return self.pos < len(self.items) and not self.items[self.pos].isalpha()
+
+    def number(self):
+        if not self.has_number():
+            raise ValueError(f'Expected a number at token {self.pos}')
+        value = self.items[self.pos]
+        self.pos += 1
+        return float(value)
+
+    def flag(self):
+        """Arc flags may be packed without separators ('a5,5 0 0110,10')."""
+        if not self.has_number():
+            raise ValueError(f'Expected an arc flag at token {self.pos}')
+        value = self.items[self.pos]
+        if value[0] not in '01':
+            raise ValueError(f'Invalid arc flag {value!r}')
+        if len(value) > 1:
+            self.items[self.pos] = value[1:]
+        else:
+            self.pos += 1
+        return value[0] == '1'
+
+
+def _line(p0, p1):
+    return (p0, (p0[0] + (p1[0] - p0[0]) / 3, p0[1] + (p1[1] - p0[1]) / 3),
+            (p0[0] + 2 * (p1[0] - p0[0]) / 3, p0[1] + 2 * (p1[1] - p0[1]) / 3), p1)
+
+
+def _arc(p0, rx, ry, angle, large_arc, sweep, p1):
+    """Endpoint-parameterized arc -> list of cubic segments (SVG spec F.6.5)."""
+    if p0 == p1:
+        return []
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return [_line(p0, p1)]
+
+    phi = math.radians(angle % 360)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (p0[0] - p1[0]) / 2, (p0[1] - p1[1]) / 2
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+
+    # Scale radii up if they cannot span the endpoints
+    lam = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if lam > 1:
+        scale = math.sqrt(lam)
+        rx, ry = rx * scale, ry * scale
+
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    den = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coef = math.sqrt(max(0.0, num / den)) if den else 0.0
+    if large_arc == sweep:
+        coef = -coef
+    cxp = coef * rx * y1p / ry
+    cyp = -coef * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (p0[0] + p1[0]) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (p0[1] + p1[1]) / 2
+
+    def angle_of(ux, uy):
+        return math.atan2(uy, ux)
+
+    theta1 = angle_of((x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = angle_of((-x1p - cxp) / rx, (-y1p - cyp) / ry) - theta1
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    pieces = max(1, math.ceil(abs(delta) / (math.pi / 2) - 1e-9))
+    step = delta / pieces
+    k = 4 / 3 * math.tan(step / 4)
+
+    def point(t):
+        ct, st = math.cos(t), math.sin(t)
+        return (cx + rx * ct * cos_phi - ry * st * sin_phi,
+                cy + rx * ct * sin_phi + ry * st * cos_phi)
+
+    def derivative(t):
+        ct, st = math.cos(t), math.sin(t)
+        return (-rx * st * cos_phi - ry * ct * sin_phi,
+                -rx * st * sin_phi + ry * ct * cos_phi)
+
+    segments = []
+    start = p0
+    for i in range(pieces):
+        t0 = theta1 + i * step
+        t1 = t0 + step
+        d0, d1 = derivative(t0), derivative(t1)
+        end = p1 if i == pieces - 1 else point(t1)
+        segments.append((start,
+                         (start[0] + k * d0[0], start[1] + k * d0[1]),
+                         (end[0] - k * d1[0], end[1] - k * d1[1]),
+                         end))
+        start = end
+    return segments
+
+
+def parse_path(d):
+    """Resolve a path `d` string into a PathGeometry of absolute cubic segments."""
+    tokens = _Tokens(d or '')
+    segments, kinds, starts = [], [], []
+    current = (0.0, 0.0)
+    subpath_start = current
+    first_move = None
+    new_subpath = True
+    last_control = None      # reflected control point for S/T
+    last_command = None
+    command = None
+
+    def add(segment, kind):
+        nonlocal new_subpath
+        segments.append(segment)
+        kinds.append(kind)
+        starts.append(new_subpath)
+        new_subpath = False
+
+    while tokens.pos < len(tokens.items):
+        if not tokens.has_number():
+            command = tokens.items[tokens.pos]
+            tokens.pos += 1
+        elif command is None:
+            raise ValueError('Path data must start with a moveto command')
+        elif command in 'Mm':
+            # Extra coordinate pairs after a moveto are implicit linetos
+            command = 'L' if command == 'M' else 'l'
+
+        upper = command.upper()
+        relative = command != upper
+        ox, oy = current if relative else (0.0, 0.0)
+
+        if upper == 'Z':
+            if current != subpath_start:
+                add(_line(current, subpath_start), CLOSE)
+            elif segments and not new_subpath:
+                # Zero-length close still marks the subpath as closed
+                add(_line(current, current), CLOSE)
+            current = subpath_start
+            new_subpath = True
+            last_control = None
+            last_command = 'Z'
+            if tokens.has_number():
+                raise ValueError('Closepath takes no arguments')
+            continue
+
+        if not tokens.has_number():
+            raise ValueError(f'Command {command!r} is missing its arguments')
+
+        if upper == 'M':
+            current = (ox + tokens.number(), oy + tokens.number())
+            subpath_start = current
+            if first_move is None:
+                first_move = current
+            new_subpath = True
+            last_control = None
+        elif upper == 'L':
+            end = (ox + tokens.number(), oy + tokens.number())
+            add(_line(current, end), LINE)
+            current = end
+            last_control = None
+        elif upper == 'H':
+            end = ((current[0] if relative else 0.0) + tokens.number(), current[1])
+            add(_line(current, end), LINE)
+            current = end
+            last_control = None
+        elif upper == 'V':
+            end = (current[0], (current[1] if relative else 0.0) + tokens.number())
+            add(_line(current, end), LINE)
+            current = end
+            last_control = None
+        elif upper == 'C':
+            c1 = (ox + tokens.number(), oy + tokens.number())
+            c2 = (ox + tokens.number(), oy + tokens.number())
+            end = (ox + tokens.number(), oy + tokens.number())
+            add((current, c1, c2, end), CUBIC)
+            current, last_control = end, c2
+        elif upper == 'S':
+            if last_command in ('C', 'S') and last_control is not None:
+                c1 = (2 * current[0] - last_control[0], 2 * current[1] - last_control[1])
+            else:
+                c1 = current
+            c2 = (ox + tokens.number(), oy + tokens.number())
+            end = (ox + tokens.number(), oy + tokens.number())
+            add((current, c1, c2, end), CUBIC)
+            current, last_control = end, c2
+        elif upper in ('Q', 'T'):
+            if upper == 'Q':
+                q = (ox + tokens.number(), oy + tokens.number())
+            elif last_command in ('Q', 'T') and last_control is not None:
+                q = (2 * current[0] - last_control[0], 2 * current[1] - last_control[1])
+            else:
+                q = current
+            end = (ox + tokens.number(), oy + tokens.number())
+            # Degree elevation: exact cubic for the quadratic
+            c1 = (current[0] + 2 / 3 * (q[0] - current[0]), current[1] + 2 / 3 * (q[1] - current[1]))
+            c2 = (end[0] + 2 / 3 * (q[0] - end[0]), end[1] + 2 / 3 * (q[1] - end[1]))
+            add((current, c1, c2, end), CUBIC)
+            current, last_control = end, q
+        elif upper == 'A':
+            rx, ry, angle = tokens.number(), tokens.number(), tokens.number()
+            large_arc, sweep = tokens.flag(), tokens.flag()
+            end = (ox + tokens.number(), oy + tokens.number())
+            for segment in _arc(current, rx, ry, angle, large_arc, sweep, end):
+                add(segment, CUBIC)
+            current = end
+            last_control = None
+        else:
+            raise ValueError(f'Unknown path command {command!r}')
+
+        last_command = upper
+
+    if segments:
+        array = np.asarray(segments, dtype=np.float64).reshape(-1, 4, 2)
+    else:
+        array = np.empty((0, 4, 2), dtype=np.float64)
+    return PathGeometry(array, np.asarray(kinds, dtype=np.uint8),
+                        np.asarray(starts, dtype=bool),
+                        np.asarray(first_move if first_move is not None else (0.0, 0.0)))
+
+
+def cubic_points(segments, t):
+    """Evaluate (N, 4, 2) cubics at parameters t: shape (N, len(t), 2)."""
+    t = np.asarray(t, dtype=np.float64)[None, :, None]
+    mt = 1 - t
+    p0, p1, p2, p3 = (segments[:, i, None, :] for i in range(4))
+    return mt ** 3 * p0 + 3 * mt * mt * t * p1 + 3 * mt * t * t * p2 + t ** 3 * p3
+
+
+def cubic_derivatives(segments, t):
+    t = np.asarray(t, dtype=np.float64)[None, :, None]
+    mt = 1 - t
+    p0, p1, p2, p3 = (segments[:, i, None, :] for i in range(4))
+    return 3 * (mt * mt * (p1 - p0) + 2 * mt * t * (p2 - p1) + t * t * (p3 - p2))
+
+
+def segment_bounds(segments):
+    """Exact (N, 4) bounds of cubic segments, including curve extrema."""
+    if not len(segments):
+        return np.empty((0, 4))
+    p0, p1, p2, p3 = (segments[:, i, :] for i in range(4))
+
+    # B'(t)/3 = a t^2 + b t + c, solved per axis
+    a = p3 - 3 * p2 + 3 * p1 - p0
+    b = 2 * (p2 - 2 * p1 + p0)
+    c = p1 - p0
+    disc = b * b - 4 * a * c
+    sqrt_disc = np.sqrt(np.maximum(disc, 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        quadratic = np.abs(a) > 1e-12
+        r1 = np.where(quadratic, (-b + sqrt_disc) / (2 * a), -c / b)
+        r2 = np.where(quadratic, (-b - sqrt_disc) / (2 * a), np.nan)
+    r1 = np.where(quadratic & (disc < 0), np.nan, r1)
+    r2 = np.where(quadratic & (disc < 0), np.nan, r2)
+
+    def at(t):
+        t = np.where((t > 0) & (t < 1), t, 0.0)
+        mt = 1 - t
+        return mt ** 3 * p0 + 3 * mt * mt * t * p1 + 3 * mt * t * t * p2 + t ** 3 * p3
+
+    candidates = np.stack([p0, p3, at(r1), at(r2)])   # (4, N, 2); invalid roots fall back to p0
+    mins = candidates.min(axis=0)
+    maxs = candidates.max(axis=0)
+    return np.concatenate([mins, maxs], axis=1)
+
+
+def flatten(geometry, tolerance):
+    """
+    Polylines within `tolerance` of the path: a list of ((n, 2) points, closed).
+
+    Each cubic is split into uniform pieces using Wang's bound,
+    n = ceil(sqrt(3/4 * max|P[i] - 2 P[i+1] + P[i+2]| / tolerance)),
+    which guarantees every chord stays within the tolerance of the curve.
+    """
+    segments = geometry.segments
+    if not len(segments):
+        return [(np.asarray(geometry.start, dtype=np.float64).reshape(1, 2), False)]
+
+    second = segments[:, :2] - 2 * segments[:, 1:3] + segments[:, 2:]
+    bound = np.linalg.norm(second, axis=2).max(axis=1)
+    pieces = np.maximum(1, np.ceil(np.sqrt(0.75 * bound / tolerance))).astype(np.int64)
+    pieces[geometry.kinds != CUBIC] = 1
+
+    polylines = []
+    points = None
+    for segment, kind, starts, count in zip(segments, geometry.kinds, geometry.starts, pieces):
+        if starts or points is None:
+            if points is not None:
+                polylines.append((np.array(points), False))
+            points = [segment[0]]
+        if kind == CLOSE:
+            polylines.append((np.array(points), True))
+            points = None
+            continue
+        t = np.arange(1, count + 1) / count
+        points.extend(cubic_points(segment[None], t)[0])
+    if points is not None:
+        polylines.append((np.array(points), False))
+    return polylines
+
+
+def polyline_geometry(polylines):
+    """PathGeometry of straight segments through ((n, 2) points, closed) polylines."""
+    segments, kinds, starts = [], [], []
+    for points, closed in polylines:
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) < 2:
+            continue
+        for i, (p0, p1) in enumerate(zip(points[:-1], points[1:])):
+            segments.append(_line(tuple(p0), tuple(p1)))
+            kinds.append(LINE)
+            starts.append(i == 0)
+        if closed:
+            segments.append(_line(tuple(points[-1]), tuple(points[0])))
+            kinds.append(CLOSE)
+            starts.append(False)
+    array = np.array(segments, dtype=np.float64).reshape(-1, 4, 2)
+    start = polylines[0][0][0] if polylines else (0.0, 0.0)
+    return PathGeometry(array, np.asarray(kinds, dtype=np.uint8),
+                        np.asarray(starts, dtype=bool), np.asarray(start, dtype=np.float64))
+
+
+class PathBatch:
+    """Segments of many paths stacked into one array for vectorized queries."""
+
+    def __init__(self, geometries, ids=None):
+        self.geometries = list(geometries)
+        self.ids = list(ids) if ids is not None else list(range(len(self.geometries)))
+        counts = np.array([len(g) for g in self.geometries], dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.counts = counts
+        if self.geometries and counts.sum():
+            self.segments = np.concatenate([g.segments for g in self.geometries if len(g)])
+        else:
+            self.segments = np.empty((0, 4, 2))
+        self.path_index = np.repeat(np.arange(len(self.geometries)), counts)
+        self.move_points = np.array([g.start for g in self.geometries]).reshape(-1, 2)
+
+    @classmethod
+    def from_strings(cls, ds, ids=None):
+        return cls([parse_path(d) for d in ds], ids)
+
+    @classmethod
+    def from_dict(cls, path_data):
+        """{id: d} mapping (e.g. data/pathData.json) -> batch keyed by id."""
+        return cls.from_strings(path_data.values(), path_data.keys())
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def _reduce(self, values, ufunc, empty):
+        """Per-path reduction of per-segment values; segment-less paths get `empty`."""
+        out = np.array(empty, dtype=np.float64)
+        has = self.counts > 0
+        if has.any():
+            out[has] = ufunc.reduceat(values, self.offsets[:-1][has], axis=0)
+        return out
+
+    def bounds(self):
+        """(P, 4) exact bounding boxes: min_x, min_y, max_x, max_y."""
+        seg = segment_bounds(self.segments)
+        empty = np.concatenate([self.move_points, self.move_points], axis=1)
+        mins = self._reduce(seg[:, :2], np.minimum, empty[:, :2])
+        maxs = self._reduce(seg[:, 2:], np.maximum, empty[:, 2:])
+        return np.concatenate([mins, maxs], axis=1)
+
+    def segment_lengths(self):
+        speeds = np.linalg.norm(cubic_derivatives(self.segments, _GL_T), axis=2)
+        return speeds @ _GL_W
+
+    def lengths(self):
+        """(P,) arc lengths."""
+        return self._reduce(self.segment_lengths(), np.add, np.zeros(len(self)))
+
+    def centroids(self):
+        """(P, 2) arc-length weighted centroids; bbox center for degenerate paths."""
+        if len(self.segments):
+            points = cubic_points(self.segments, _GL_T)
+            speeds = np.linalg.norm(cubic_derivatives(self.segments, _GL_T), axis=2)
+            weights = speeds * _GL_W
+            moments = np.einsum('nk,nkd->nd', weights, points)
+            lengths = weights.sum(axis=1)
+        else:
+            moments = np.empty((0, 2))
+            lengths = np.empty(0)
+        total_moments = self._reduce(moments, np.add, np.zeros((len(self), 2)))
+        total_lengths = self._reduce(lengths, np.add, np.zeros(len(self)))
+
+        boxes = self.bounds()
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = total_moments / total_lengths[:, None]
+        return np.where(total_lengths[:, None] > 1e-12, result, centers)
+
+    def start_points(self):
+        """(P, 2) first point of every path."""
+        return self.move_points.copy()
+
+    def end_points(self):
+        """(P, 2) final pen position of every path."""
+        out = self.move_points.copy()
+        has = self.counts > 0
+        if has.any():
+            out[has] = self.segments[self.offsets[1:][has] - 1, 3]
+        return out
+
+    def points(self):
+        """All absolute control points, (N * 4, 2), with their path index."""
+        return self.segments.reshape(-1, 2), np.repeat(self.path_index, 4)
+
+
+if __name__ == '__main__':
+    import json
+    from pathlib import Path
+
+    path_file = Path(sys.argv[1]) if len(sys.argv) > 1 else \
+        Path(__file__).parent.parent / 'data' / 'pathData.json'
+    with open(path_file, encoding='utf-8') as f:
+        path_data = json.load(f)
+
+    batch = PathBatch.from_dict(path_data)
+    boxes = batch.bounds()
+    lengths = batch.lengths()
+    centroids = batch.centroids()
+
+    print(f"Parsed {len(batch)} paths into {len(batch.segments)} cubic segments")
+    for path_id, box, length, center in list(zip(batch.ids, boxes, lengths, centroids))[:10]:
+        print(f"  {path_id}: bbox=({box[0]:.2f}, {box[1]:.2f}, {box[2]:.2f}, {box[3]:.2f}) "
+              f"length={length:.2f} centroid=({center[0]:.2f}, {center[1]:.2f})")
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+SVG transform engine shared by the scripts/ tools.
+
+Parses transform lists (matrix/translate/scale/rotate/skewX/skewY) into
+(a, b, c, d, e, f) tuples, composes them down the group hierarchy and
+applies the result to whole coordinate arrays with one matrix multiply:
+
+    x' = a*x + c*y + e
+    y' = b*x + d*y + f
+
+The current transform matrix (CTM) of every element is resolved once when
+the SVG index is built and cached with it, so tree_matrices() is a lookup.
+bake_element() writes absolute coordinates for an element, removing the
+need for nested transforms in the frontend overlay layers.
+
+The parser is pure Python so svg_index can use it without importing NumPy;
+NumPy is only loaded by the vectorized helpers.
+"""
+
+import math
+import re
+import sys
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+_TRANSFORM_RE = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
+_NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def multiply(m1, m2):
+    """Compose two SVG matrices (a, b, c, d, e, f): result applies m2 then m1."""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * e2 + c1 * f2 + e1,
+        b1 * e2 + d1 * f2 + f1,
+    )
+
+
+def compose(*matrices):
+    """multiply(m1, multiply(m2, ...)): outermost transform first."""
+    result = IDENTITY
+    for matrix in matrices:
+        result = multiply(result, matrix)
+    return result
+
+
+def invert(matrix):
+    a, b, c, d, e, f = matrix
+    det = a * d - b * c
+    if abs(det) < 1e-15:
+        raise ValueError(f'Transform {matrix} is not invertible')
+    return (d / det, -b / det, -c / det, a / det,
+            (c * f - d * e) / det, (b * e - a * f) / det)
+
+
+def parse_transform(text):
+    """Parse an SVG transform list into a single (a, b, c, d, e, f) matrix."""
+    matrix = IDENTITY
+    if not text:
+        return matrix
+
+    for name, args in _TRANSFORM_RE.findall(text):
+        values = [float(v) for v in _NUMBER_RE.findall(args)]
+        if name == 'matrix':
+            if len(values) != 6:
+                raise ValueError(f'matrix() needs 6 values: {text!r}')
+            step = tuple(values)
+        elif name == 'translate':
+            tx = values[0] if values else 0.0
+            ty = values[1] if len(values) > 1 else 0.0
+            step = (1.0, 0.0, 0.0, 1.0, tx, ty)
+        elif name == 'scale':
+            sx = values[0] if values else 1.0
+            sy = values[1] if len(values) > 1 else sx
+            step = (sx, 0.0, 0.0, sy, 0.0, 0.0)
+        elif name == 'rotate':
+            angle = math.radians(values[0])
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            step = (cos_a, sin_a, -sin_a, cos_a, 0.0, 0.0)
+            if len(values) >= 3:
+                cx, cy = values[1], values[2]
+                step = compose((1.0, 0.0, 0.0, 1.0, cx, cy), step, (1.0, 0.0, 0.0, 1.0, -cx, -cy))
+        elif name == 'skewX':
+            step = (1.0, 0.0, math.tan(math.radians(values[0])), 1.0, 0.0, 0.0)
+        else:  # skewY
+            step = (1.0, math.tan(math.radians(values[0])), 0.0, 1.0, 0.0, 0.0)
+        matrix = multiply(matrix, step)
+
+    return matrix
+
+
+def _format_number(value, precision):
+    text = f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+    return '0' if text in ('', '-0') else text
+
+
+def to_string(matrix, precision=8):
+    """Shortest SVG transform attribute for a matrix ('' for the identity)."""
+    e, f = matrix[4], matrix[5]
+    if is_translation(matrix):
+        if abs(e) < 1e-12 and abs(f) < 1e-12:
+            return ''
+        return f'translate({_format_number(e, precision)},{_format_number(f, precision)})'
+    return f"matrix({','.join(_format_number(v, precision) for v in matrix)})"
+
+
+def is_translation(matrix, tolerance=1e-12):
+    a, b, c, d, _, _ = matrix
+    return (abs(a - 1) < tolerance and abs(d - 1) < tolerance
+            and abs(b) < tolerance and abs(c) < tolerance)
+
+
+def scale_factor(matrix):
+    """Largest stretch the matrix applies to any vector (its spectral norm)."""
+    a, b, c, d, _, _ = matrix
+    s = (a * a + b * b + c * c + d * d) / 2
+    t = math.sqrt(max(0.0, s * s - (a * d - b * c) ** 2))
+    return math.sqrt(s + t)
+
+
+def apply(matrix, points):
+    """Transform an (N, 2) array of points with one matrix multiply."""
+    import numpy as np
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    a, b, c, d, e, f = matrix
+    return points @ np.array([[a, b], [c, d]]) + np.array([e, f])
+
+
+def apply_segments(matrix, segments):
+    """Transform (N, 4, 2) cubic control points; affine maps preserve Beziers."""
+    return apply(matrix, segments.reshape(-1, 2)).reshape(segments.shape)
+
+
+class TransformResolver:
+    """CTM lookups over an SvgIndex, keyed by tree layer or element."""
+
+    def __init__(self, index, labels=None):
+        if labels is None:
+            from svg_labels import LabelTable
+            labels = LabelTable(index)
+        self.index = index
+        self.labels = labels
+
+    def ctm(self, element):
+        """Transform from the element's own coordinates (after its transform
+        attribute) to the document; resolved when the index was built."""
+        return element.ctm
+
+    def tree_matrix(self, tree):
+        """CTM of a tree layer: maps config node coordinates to the document."""
+        layer = self.labels.find(tree, 'tree')
+        if layer is None:
+            raise KeyError(f'No layer labeled "Tree {tree}" in {self.index.svg_path}')
+        return layer.ctm
+
+    def tree_matrices(self):
+        return {tree: layer.ctm for tree, layer in sorted(self.labels.tree_layers.items())}
+
+    def apply_tree(self, tree, points):
+        return apply(self.tree_matrix(tree), points)
+
+
+def tree_matrices(index=None):
+    """{'A': (a, b, c, d, e, f), ...} for every tree layer in the shared SVG."""
+    if index is None:
+        from svg_index import load_index
+        index = load_index()
+    return TransformResolver(index).tree_matrices()
+
+
+def config_tree_matrices(config):
+    """Parse the per-tree `transform` strings of a skill tree config (skill_config.SkillConfig)."""
+    return {tree_id: parse_transform(tree.transform)
+            for tree_id, tree in config.trees.items() if tree.transform}
+
+
+def tree_matrix_mismatches(index, config, tolerance=1e-6):
+    """[(tree, svg_matrix, config_matrix or None)] for trees whose config transform drifted."""
+    config_matrices = config_tree_matrices(config)
+    mismatches = []
+    for tree, matrix in tree_matrices(index).items():
+        config_matrix = config_matrices.get(tree)
+        if config_matrix is None or any(abs(x - y) >= tolerance for x, y in zip(matrix, config_matrix)):
+            mismatches.append((tree, matrix, config_matrix))
+    return mismatches
+
+
+def bake_element(element, matrix=None, precision=5):
+    """
+    Geometry attributes for `element` with `matrix` (default: its CTM) baked
+    into absolute coordinates. Circles, ellipses and rects stay primitives
+    under translations and become paths under anything else.
+    """
+    from svg_paths import parse_path
+
+    matrix = element.ctm if matrix is None else matrix
+    tag = element.tag
+
+    def fmt(value):
+        return _format_number(value, precision)
+
+    if tag == 'path':
+        geometry = parse_path(element.get('d', ''))
+        geometry.segments = apply_segments(matrix, geometry.segments)
+        geometry.start = apply(matrix, geometry.start)[0]
+        return 'path', {'d': geometry.to_d(precision)}
+
+    if tag in ('circle', 'ellipse'):
+        cx, cy = float(element.get('cx', 0)), float(element.get('cy', 0))
+        if tag == 'circle':
+            rx = ry = float(element.get('r', 0))
+        else:
+            rx, ry = float(element.get('rx', 0)), float(element.get('ry', 0))
+        if is_translation(matrix):
+            x, y = cx + matrix[4], cy + matrix[5]
+            if tag == 'circle':
+                return 'circle', {'cx': fmt(x), 'cy': fmt(y), 'r': fmt(rx)}
+            return 'ellipse', {'cx': fmt(x), 'cy': fmt(y), 'rx': fmt(rx), 'ry': fmt(ry)}
+        d = (f'M {cx + rx},{cy} A {rx},{ry} 0 0 1 {cx},{cy + ry} A {rx},{ry} 0 0 1 {cx - rx},{cy} '
+             f'A {rx},{ry} 0 0 1 {cx},{cy - ry} A {rx},{ry} 0 0 1 {cx + rx},{cy} Z')
+        geometry = parse_path(d)
+        geometry.segments = apply_segments(matrix, geometry.segments)
+        geometry.start = apply(matrix, geometry.start)[0]
+        return 'path', {'d': geometry.to_d(precision)}
+
+    if tag == 'rect':
+        x, y = float(element.get('x', 0)), float(element.get('y', 0))
+        w, h = float(element.get('width', 0)), float(element.get('height', 0))
+        if is_translation(matrix):
+            attrs = {'x': fmt(x + matrix[4]), 'y': fmt(y + matrix[5]),
+                     'width': fmt(w), 'height': fmt(h)}
+            for corner in ('rx', 'ry'):
+                if element.get(corner):
+                    attrs[corner] = element.get(corner)
+            return 'rect', attrs
+        corners = apply(matrix, [(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+        points = ' L '.join(f'{fmt(px)},{fmt(py)}' for px, py in corners)
+        return 'path', {'d': f'M {points} Z'}
+
+    raise ValueError(f'Cannot bake <{tag}> elements')
+
+
+BAKEABLE_TAGS = ('path', 'circle', 'ellipse', 'rect')
+
+
+def bake_group(index, element, precision=5):
+    """(element, tag, attrs) for every bakeable shape at or below `element`,
+    each with its own CTM, so a transformed <g> can be flattened."""
+    shapes = [element] if element.tag in BAKEABLE_TAGS else []
+    shapes += [child for child in index.descendants(element) if child.tag in BAKEABLE_TAGS]
+    for shape in shapes:
+        tag, attrs = bake_element(shape, precision=precision)
+        yield shape, tag, attrs
+
+
+if __name__ == '__main__':
+    from skill_config import load_config
+    from svg_index import load_index
+
+    index = load_index()
+    drifted = {tree: config_matrix for tree, _, config_matrix in tree_matrix_mismatches(index, load_config())}
+
+    print("Tree layer transforms (SVG CTM vs config):")
+    for tree, matrix in tree_matrices(index).items():
+        if tree not in drifted:
+            status = 'matches config'
+        else:
+            status = f'config has {to_string(drifted[tree]) if drifted[tree] else "none"}'
+        print(f"  Tree {tree}: {to_string(matrix)} ({status})")
+
+    if len(sys.argv) > 1:
+        for element_id in sys.argv[1:]:
+            element = index.get(element_id)
+            if element is None:
+                print(f"{element_id}: not found")
+                continue
+            for shape, tag, attrs in bake_group(index, element):
+                print(f"{shape.id} -> <{tag} {attrs}>")
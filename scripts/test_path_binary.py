@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for path_binary.py on synthetic paths.
+
+`python path_binary.py --verify` checks the shipped data/pathData.json; these
+cover the encoder's edge cases that the shipped data may not exercise.
+
+Usage:
+    python -m pytest test_path_binary.py
+    python test_path_binary.py
+"""
+
+import math
+import struct
+import unittest
+
+from path_binary import HEADER, WIDE, decode, encode, encode_path, verify
+from svg_paths import parse_path
+
+
+def round_trip(path_data, quantum=0.01):
+    """(problems, worst error, bound) after encoding and decoding `path_data`."""
+    return verify(path_data, encode(path_data, quantum))
+
+
+class RoundTripTest(unittest.TestCase):
+    def assertRoundTrips(self, path_data, quantum=0.01):
+        problems, worst, bound = round_trip(path_data, quantum)
+        self.assertEqual(problems, [])
+        self.assertLessEqual(worst, bound)
+        return worst, bound
+
+    def test_lines_and_cubics(self):
+        self.assertRoundTrips({
+            'lines': 'M10.123,20.456 L30.789,40.001 H50 V60.5',
+            'cubics': 'M0,0 C10,20 30,40 50,60 S90,100 110,120 Q130,140 150,160 T190,200',
+        })
+
+    def test_ids_and_order_are_kept(self):
+        path_data = {'b': 'M0,0 L1,1', 'a': 'M2,2 L3,3', 'path-ü': 'M4,4 L5,5'}
+        self.assertEqual(list(decode(encode(path_data))), list(path_data))
+
+    def test_wide_deltas(self):
+        # 400 units at 0.01 is 40,000 grid steps, past int16
+        for d in ('M0,0 L400,0', 'M0,0 L-500,3', 'M327.67,0 L0,327.68', 'M-1000,-1000 L1000,1000 L1000.01,1000'):
+            with self.subTest(d=d):
+                commands, _ = encode_path(d, 0.01)
+                self.assertTrue(any(command & WIDE for command in commands))
+                self.assertRoundTrips({'p': d})
+
+    def test_deltas_at_the_int16_limit_stay_narrow(self):
+        commands, words = encode_path('M0,0 L327.67,-327.68', 0.01)
+        self.assertFalse(any(command & WIDE for command in commands))
+        self.assertEqual(words, [0, 0, 32767, -32768])
+
+    def test_relative_move_after_close(self):
+        # After Z the pen is back at the subpath start, so m is relative to it
+        d = 'M10,10 L20,10 L20,20 Z m5,5 l1,0 l0,1 z m-3,-3 l2,2'
+        self.assertRoundTrips({'p': d})
+        decoded = parse_path(decode(encode({'p': d}))['p'])
+        # Segments 0-2 are the first subpath (two lines and the close)
+        self.assertAlmostEqual(decoded.segments[3][0][0], 15, places=6)
+        self.assertAlmostEqual(decoded.segments[3][0][1], 15, places=6)
+
+    def test_wide_move_after_close(self):
+        self.assertRoundTrips({'p': 'M0,0 L400,0 L400,400 Z m-350,10 l1,1 z'})
+
+    def test_arcs(self):
+        self.assertRoundTrips({
+            'arc': 'M0,0 A10,5 30 1 0 20,10',
+            'relative-arcs': 'M50,50 a25,25 0 0 1 50,0 a25,25 0 1 1 -50,0 z',
+            'degenerate-radius': 'M0,0 A0,0 0 0 1 10,10',
+        })
+
+    def test_empty_and_segmentless_paths(self):
+        path_data = {'empty': '', 'move-only': 'M5.5,6.25', 'moves': 'M1,1 M2,2', 'normal': 'M0,0 L1,1'}
+        self.assertRoundTrips(path_data)
+        self.assertEqual(set(decode(encode(path_data))), set(path_data))
+
+    def test_no_paths(self):
+        self.assertEqual(decode(encode({})), {})
+
+    def test_error_bound_scales_with_quantum(self):
+        d = 'M0.1234,9.8765 C1.1111,2.2222 3.3333,4.4444 5.5555,6.6666 L7.7777,8.8888 Z'
+        for quantum in (0.5, 0.1, 0.01, 0.001):
+            with self.subTest(quantum=quantum):
+                worst, bound = self.assertRoundTrips({'p': d}, quantum)
+                # Bound is half a (float32) grid step on each axis
+                stored = struct.unpack('<f', struct.pack('<f', quantum))[0]
+                self.assertAlmostEqual(bound, stored / 2 * math.sqrt(2) + 1e-6)
+
+    def test_quantum_is_stored_as_float32(self):
+        blob = encode({'p': 'M0,0 L1,1'}, 0.003)
+        quantum = HEADER.unpack_from(blob)[4]
+        self.assertEqual(quantum, struct.unpack('<f', struct.pack('<f', 0.003))[0])
+
+    def test_error_does_not_accumulate(self):
+        # Deltas are taken from the quantized pen, so many tiny steps stay within the bound
+        d = 'M0,0 ' + ' '.join('l0.0049,0.0051' for _ in range(500))
+        self.assertRoundTrips({'p': d})
+
+    def test_bad_blobs_are_rejected(self):
+        blob = bytearray(encode({'p': 'M0,0 L1,1'}))
+        with self.assertRaises(ValueError):
+            decode(b'XXXX' + bytes(blob[4:]))
+        blob[4:6] = struct.pack('<H', 99)
+        with self.assertRaises(ValueError):
+            decode(bytes(blob))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,29 +4,22 @@ Transform node coordinates to match the new ArcRaidersTree.svg file.
 The new SVG has transformations baked in, so we need to apply those same
 transformations to the node coordinates.
 
-Original transformations from old SVG:
-- Tree A: matrix(0.82544171,0.56448736,0.56221371,-0.82211698,81.266847,463.85256)
-- Tree D: matrix(-1,0,0,1,552.10903,48.512262)
-- Tree B/C: translate(221.93716, 39.335736)
+The per-tree matrices are read from the tree layers of the SVG (see
+svg_transforms.tree_matrices) instead of being hardcoded here, and each
+tree's nodes are transformed with a single matrix multiply.
 """
 
 import json
-import math
+import re
+from pathlib import Path
 
-def apply_matrix_transform(x, y, a, b, c, d, e, f):
-    """Apply SVG matrix transformation: matrix(a,b,c,d,e,f)"""
-    new_x = a * x + c * y + e
-    new_y = b * x + d * y + f
-    return new_x, new_y
+from svg_transforms import apply, to_string, tree_matrices
 
-def apply_translate(x, y, tx, ty):
-    """Apply SVG translate transformation"""
-    return x + tx, y + ty
+SKILL_DATA_PATH = Path(__file__).parent.parent / 'data' / 'skillData.ts'
+OUTPUT_PATH = Path(__file__).parent / 'transformed_coordinates.json'
 
 # Read skillData.ts to extract current coordinates
-import re
-
-with open('skill-tree-planner/data/skillData.ts', 'r') as f:
+with open(SKILL_DATA_PATH, 'r') as f:
     content = f.read()
 
 # Find all node definitions
@@ -34,36 +27,31 @@ node_pattern = r"{\s*id:\s*'([^']+)',.*?tree:\s*'([A-D])',.*?x:\s*([\d.]+),\s*y:
 nodes = re.findall(node_pattern, content, re.DOTALL)
 
 print("Found", len(nodes), "nodes")
+
+matrices = tree_matrices()
+print("\nTree transforms (from SVG layers):")
+for tree, matrix in matrices.items():
+    print(f"  Tree {tree}: {to_string(matrix)}")
+
 print("\nTransformed coordinates:\n")
 
-# Apply transformations
-transformed = {}
+# Group nodes per tree so each tree is one vectorized transform
+by_tree = {}
 for node_id, tree, x, y, r in nodes:
-    x, y, r = float(x), float(y), float(r)
+    by_tree.setdefault(tree, []).append((node_id, float(x), float(y), float(r)))
 
-    if tree == 'A':
-        # Apply Tree A transformation
-        new_x, new_y = apply_matrix_transform(
-            x, y,
-            0.82544171, 0.56448736, 0.56221371, -0.82211698, 81.266847, 463.85256
-        )
-    elif tree == 'D':
-        # Apply Tree D transformation (horizontal flip + translate)
-        new_x, new_y = apply_matrix_transform(
-            x, y,
-            -1, 0, 0, 1, 552.10903, 48.512262
-        )
-    elif tree in ['B', 'C']:
-        # Apply Tree B/C transformation
-        new_x, new_y = apply_translate(x, y, 221.93716, 39.335736)
-    else:
-        new_x, new_y = x, y
+transformed = {}
+for tree, tree_nodes in sorted(by_tree.items()):
+    points = [(x, y) for _, x, y, _ in tree_nodes]
+    matrix = matrices.get(tree)
+    new_points = apply(matrix, points) if matrix is not None else points
 
-    transformed[node_id] = (new_x, new_y, r)
-    print(f"{node_id} (Tree {tree}): x={x:.6f}, y={y:.6f} -> x={new_x:.6f}, y={new_y:.6f}, r={r:.6f}")
+    for (node_id, x, y, r), (new_x, new_y) in zip(tree_nodes, new_points):
+        transformed[node_id] = (float(new_x), float(new_y), r)
+        print(f"{node_id} (Tree {tree}): x={x:.6f}, y={y:.6f} -> x={new_x:.6f}, y={new_y:.6f}, r={r:.6f}")
 
 # Save to JSON for easy use
-with open('skill-tree-planner/scripts/transformed_coordinates.json', 'w') as f:
+with open(OUTPUT_PATH, 'w') as f:
     json.dump({k: {'x': v[0], 'y': v[1], 'radius': v[2]} for k, v in transformed.items()}, f, indent=2)
 
 print("\n✓ Saved transformed coordinates to transformed_coordinates.json")
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Offset-based editing of generated spans in components/*.tsx.
+
+Instead of running one re.sub over the whole file per update, callers scan
+the file once for the spans they care about, then hand all replacements to
+splice(), which builds the new text in a single pass over the original.
+write_if_changed() only touches the file when the bytes actually differ, so
+no-op runs do not trigger Next.js HMR or rebuilds.
+
+Generated blocks live in named regions delimited by marker comments:
+
+    {/* @generated:begin lock-icons */}
+    ...
+    {/* @generated:end lock-icons */}
+
+update_regions() regenerates every requested region in memory, splices them
+in one pass and replaces the file atomically, or prints a unified diff when
+dry_run is set. Regions are replaced wholesale, so reruns are idempotent.
+
+Usage:
+    from tsx_edit import find_spans, read_text, splice, write_if_changed
+
+    text = read_text(tsx_file)
+    spans = find_spans(text, re.compile(r'id="(lock-[^"]+)"\s+transform="([^"]*)"'))
+    new_text, changed = splice(text, [(span, new_transforms[span.key]) for span in spans])
+    write_if_changed(tsx_file, new_text)
+
+    update_regions(tsx_file, {'lock-icons': lock_blocks}, dry_run=True)
+"""
+
+import difflib
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+SKILL_TREE_TSX = Path(__file__).parent.parent / 'components' / 'SkillTree.tsx'
+
+# A marker occupies its own line; both the JSX and the line comment form are accepted
+MARKER_RE = re.compile(
+    r'^([ \t]*)(?:\{/\*\s*@generated:(begin|end)\s+([\w.-]+)\s*\*/\}'
+    r'|//\s*@generated:(begin|end)\s+([\w.-]+))[ \t]*(?:\r?\n|$)',
+    re.MULTILINE)
+
+
+class Span(NamedTuple):
+    """Value of one attribute occurrence: text[start:end] == value."""
+
+    key: str
+    start: int
+    end: int
+    value: str
+
+
+def find_spans(text, pattern, key_group=1, value_group=2):
+    """Every match of `pattern` as a Span over its value group, in file order."""
+    return [Span(match.group(key_group), match.start(value_group), match.end(value_group),
+                 match.group(value_group))
+            for match in pattern.finditer(text)]
+
+
+def splice(text, replacements):
+    """
+    Apply (Span, new_value) replacements in one pass over `text`.
+
+    Returns (new_text, changed) where `changed` lists the (Span, new_value)
+    pairs whose value actually differs. Overlapping spans are rejected.
+    """
+    changed = [(span, value) for span, value in replacements if value != span.value]
+    changed.sort(key=lambda item: item[0].start)
+
+    parts = []
+    position = 0
+    for span, value in changed:
+        if span.start < position:
+            raise ValueError(f'Overlapping replacement for {span.key!r} at offset {span.start}')
+        if text[span.start:span.end] != span.value:
+            raise ValueError(f'Span for {span.key!r} is stale (text changed since the scan)')
+        parts.append(text[position:span.start])
+        parts.append(value)
+        position = span.end
+    parts.append(text[position:])
+    return ''.join(parts), changed
+
+
+class RegionError(ValueError):
+    pass
+
+
+class Region(NamedTuple):
+    """Content between a begin/end marker pair: text[start:end] == content."""
+
+    name: str
+    indent: str
+    newline: str
+    start: int
+    end: int
+    content: str
+
+
+def begin_marker(name, indent=''):
+    return f'{indent}{{/* @generated:begin {name} */}}'
+
+
+def end_marker(name, indent=''):
+    return f'{indent}{{/* @generated:end {name} */}}'
+
+
+def find_regions(text):
+    """
+    {name: Region} for every marker pair in `text`.
+
+    Raises RegionError for duplicate, nested, unclosed or unmatched markers.
+    """
+    regions = {}
+    open_region = None
+    for match in MARKER_RE.finditer(text):
+        indent = match.group(1)
+        kind = match.group(2) or match.group(4)
+        name = match.group(3) or match.group(5)
+        line = line_number(text, match.start())
+        if kind == 'begin':
+            if open_region:
+                raise RegionError(f"Region {name!r} (line {line}) is nested in {open_region[0]!r}")
+            if name in regions:
+                raise RegionError(f"Duplicate region {name!r} (line {line})")
+            newline = '\r\n' if match.group(0).endswith('\r\n') else '\n'
+            open_region = (name, indent, newline, match.end())
+        else:
+            if not open_region or open_region[0] != name:
+                raise RegionError(f"End marker for {name!r} (line {line}) has no matching begin")
+            _, begin_indent, newline, start = open_region
+            regions[name] = Region(name, begin_indent, newline, start, match.start(),
+                                   text[start:match.start()])
+            open_region = None
+    if open_region:
+        raise RegionError(f"Region {open_region[0]!r} is never closed")
+    return regions
+
+
+def indent_block(content, indent, newline='\n'):
+    """Indent every non-blank line of `content` and terminate it with a newline."""
+    lines = content.strip('\r\n').splitlines() if content.strip() else []
+    return ''.join((indent + line if line.strip() else '') + newline for line in lines)
+
+
+def render_regions(text, contents):
+    """
+    Replace the body of each named region with contents[name] in one pass.
+
+    Contents are written relative to the region's begin marker indent. Returns
+    (new_text, changed_names). Every name must already have markers in `text`.
+    """
+    regions = find_regions(text)
+    missing = sorted(set(contents) - set(regions))
+    if missing:
+        raise RegionError(f"No markers for region(s): {', '.join(missing)}")
+
+    replacements = []
+    for name, content in contents.items():
+        region = regions[name]
+        span = Span(name, region.start, region.end, region.content)
+        replacements.append((span, indent_block(content, region.indent, region.newline)))
+    new_text, changed = splice(text, replacements)
+    return new_text, [span.key for span, _ in changed]
+
+
+def wrap_element_children(text, name, opening_line):
+    """
+    Insert markers for region `name` around the children of the element
+    opened on the line that contains `opening_line` (bootstraps a region in a
+    file that predates the markers). The element must close on a line at its
+    own indent.
+    """
+    match = re.search(r'^([ \t]*)' + re.escape(opening_line) + r'[^\n]*\n', text, re.MULTILINE)
+    if not match:
+        raise RegionError(f"Cannot bootstrap region {name!r}: {opening_line!r} not found")
+    indent = match.group(1)
+    tag = re.match(r'<([\w.]+)', opening_line).group(1)
+    closing = re.compile(r'^' + re.escape(indent) + re.escape(f'</{tag}>'), re.MULTILINE)
+    close = closing.search(text, match.end())
+    if not close:
+        raise RegionError(f"Cannot bootstrap region {name!r}: closing </{tag}> not found")
+    child_indent = indent + '  '
+    return ''.join([
+        text[:match.end()],
+        begin_marker(name, child_indent), '\n',
+        text[match.end():close.start()],
+        end_marker(name, child_indent), '\n',
+        text[close.start():],
+    ])
+
+
+def unified_diff(path, old_text, new_text):
+    name = Path(path).name
+    return ''.join(difflib.unified_diff(old_text.splitlines(True), new_text.splitlines(True),
+                                        f'a/{name}', f'b/{name}'))
+
+
+def update_regions(path, contents, dry_run=False, anchors=None):
+    """
+    Regenerate regions of `path` and write the result atomically.
+
+    contents maps region name -> generated text (or a callable returning it).
+    anchors optionally maps region name -> opening line of the element whose
+    children become the region when its markers are missing. With dry_run the
+    unified diff is printed instead of writing. Returns the changed region names.
+    """
+    old_text = read_text(path)
+    text = old_text
+    regions = find_regions(text)
+    for name in contents:
+        if name not in regions and anchors and name in anchors:
+            text = wrap_element_children(text, name, anchors[name])
+            print(f"Added markers for region {name!r}")
+
+    generated = {name: content() if callable(content) else content
+                 for name, content in contents.items()}
+    new_text, changed = render_regions(text, generated)
+    if text != old_text:
+        changed = sorted(set(changed) | {name for name in contents if name not in regions})
+
+    if not changed:
+        print(f"{Path(path).name}: {len(contents)} region(s) up to date")
+    elif dry_run:
+        sys.stdout.write(unified_diff(path, old_text, new_text))
+        print(f"{Path(path).name}: would update {', '.join(changed)} (dry run)")
+    else:
+        write_atomic(path, new_text)
+        print(f"{Path(path).name}: updated {', '.join(changed)}")
+    return changed
+
+
+def line_number(text, offset):
+    return text.count('\n', 0, offset) + 1
+
+
+def read_text(path):
+    # newline='' keeps CRLF files byte-identical on round trips
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def write_if_changed(path, text):
+    """Write `text` only if it differs from the file's bytes; returns True if written."""
+    path = Path(path)
+    data = text.encode('utf-8')
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def write_atomic(path, text):
+    """
+    Like write_if_changed(), but through a temporary file in the same
+    directory that replaces the target in one rename, so watchers and a
+    crashed run never see a half-written file.
+    """
+    path = Path(path)
+    data = text.encode('utf-8')
+    if path.exists() and path.read_bytes() == data:
+        return False
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if path.exists():
+            os.chmod(temp_name, path.stat().st_mode & 0o777)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+    return True
@@ -1,11 +1,4 @@
 @echo off
-echo Extracting containers from SVG...
-python "%~dp0extractContainers.py" > "%~dp0containers_output.txt"
-
-echo.
-echo Updating SkillTree.tsx with new positions...
-python "%~dp0updateContainersByDistance.py"
-
-echo.
-echo Done!
+rem Thin wrapper: the build graph in build.py only reruns stages whose inputs changed
+python "%~dp0build.py" %*
 pause
@@ -5,13 +5,16 @@ Update skillData.ts with transformed coordinates
 
 import json
 import re
+from pathlib import Path
+
+repo_root = Path(__file__).parent.parent
 
 # Load transformed coordinates
-with open('skill-tree-planner/scripts/transformed_coordinates.json', 'r') as f:
+with open(repo_root / 'scripts' / 'transformed_coordinates.json', 'r') as f:
     transformed = json.load(f)
 
 # Read skillData.ts
-with open('skill-tree-planner/data/skillData.ts', 'r') as f:
+with open(repo_root / 'data' / 'skillData.ts', 'r') as f:
     content = f.read()
 
 # Update each node's coordinates
@@ -31,7 +34,7 @@ for node_id, coords in transformed.items():
     content = re.sub(pattern, replace_coords, content, flags=re.DOTALL)
 
 # Write back
-with open('skill-tree-planner/data/skillData.ts', 'w') as f:
+with open(repo_root / 'data' / 'skillData.ts', 'w') as f:
     f.write(content)
 
 print("✓ Updated skillData.ts with transformed coordinates")
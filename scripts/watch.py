@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Watch ArcRaidersTree.svg and skillTreeConfig.json and patch only what changed.
+
+Both files are polled by (size, mtime). When the SVG is saved it is indexed
+again (a few milliseconds) and compared with the previous index element by
+element id, including resolved transforms. Each changed id is mapped to the
+generated data that depends on it:
+
+    container outline          its entry in data/overlayData.json
+    lock group or lock part    its entry in data/overlayData.json
+    path in data/pathData.json its entry there, the same entry in every
+    (or a new "Tree X path")   pathData LOD file, and public/pathData.bin
+
+Config saves are diffed per node id and the tree transforms are checked
+against the SVG again. Generated files the watcher does not patch
+(bounding boxes, the minified SVG, ...) are reported as stale; with --build
+they are handed to build.py after each change.
+
+Usage:
+    python watch.py
+    python watch.py --interval 0.1 --build
+    python -m scripts watch
+"""
+
+import argparse
+import json
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from skill_config import CONFIG_PATH, load_config
+from svg_index import SVG_PATH, load_index
+from svg_labels import LabelTable
+from tsx_edit import write_atomic
+
+REPO_ROOT = Path(__file__).parent.parent
+PATH_DATA_PATH = REPO_ROOT / 'data' / 'pathData.json'
+
+# Build stages whose outputs the watcher keeps up to date itself
+PATCHED_STAGES = {'extract-containers', 'update-containers', 'path-lods', 'path-binary'}
+
+
+def signatures(index):
+    """{element id: everything that affects the element's rendered geometry}"""
+    return {element.id: (element.tag, element.attrib, element.text, element.ctm)
+            for element in index.elements if element.id}
+
+
+def diff_ids(old, new):
+    """(added, removed, modified) element ids between two signature maps."""
+    added = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    modified = sorted(element_id for element_id in old.keys() & new.keys()
+                      if old[element_id] != new[element_id])
+    return added, removed, modified
+
+
+def overlay_owners(labels):
+    """{element index: ('container' | 'lock', overlay id)} for every overlay shape."""
+    owners = {}
+    for parsed, element in labels.items('container'):
+        if element.tag == 'path':
+            owners[element.index] = ('container', parsed.container_id)
+    for parsed, element in labels.items('lock'):
+        owners[element.index] = ('lock', parsed.lock_id)
+    return owners
+
+
+def owner_of(index, owners, element):
+    """Overlay shape an element belongs to (itself or an enclosing lock group)."""
+    for candidate in (element, *index.ancestors(element)):
+        if candidate.index in owners:
+            return owners[candidate.index]
+    return None
+
+
+def tree_of(labels, element):
+    parsed = labels.label(element)
+    if parsed is not None and parsed.tree:
+        return parsed.tree
+    layer = labels.index.layer_of(element)
+    parsed = labels.label(layer) if layer is not None else None
+    return parsed.tree if parsed is not None else None
+
+
+def write_bytes_if_changed(path, data):
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+class Watcher:
+    """Previous SVG index and config, and the patches that bring outputs up to date."""
+
+    def __init__(self, build_stale=False):
+        self.build_stale = build_stale
+        self.index = load_index()
+        self.labels = LabelTable(self.index)
+        self.signatures = signatures(self.index)
+        self.config = load_config()
+
+    def svg_changed(self):
+        """
+        Re-index the SVG and patch the outputs of the ids that changed.
+        Returns True whenever the SVG content changed, patched or not, so the
+        stages the watcher cannot patch are still reported or rebuilt.
+        """
+        try:
+            index = load_index()
+        except ET.ParseError as e:
+            # Usually a save still in progress; the next poll picks up the rest
+            print(f"SVG does not parse yet ({e}); waiting for the next save")
+            return False
+        if index.svg_hash == self.index.svg_hash:
+            print("SVG saved without changes")
+            return False
+        labels = LabelTable(index)
+        new_signatures = signatures(index)
+        added, removed, modified = diff_ids(self.signatures, new_signatures)
+        if not (added or removed or modified):
+            self.index, self.labels = index, labels
+            print("SVG saved without element changes")
+            return True
+
+        old_index, old_labels = self.index, self.labels
+        self.index, self.labels, self.signatures = index, labels, new_signatures
+        print(f"SVG: {len(added)} added, {len(removed)} removed, {len(modified)} modified element(s)")
+
+        new_owners, old_owners = overlay_owners(labels), overlay_owners(old_labels)
+        overlay_ids = set()
+        path_ids = []
+        for element_id in added + modified:
+            element = index.get(element_id)
+            owner = owner_of(index, new_owners, element)
+            if owner:
+                overlay_ids.add(owner)
+            if element.tag == 'path':
+                path_ids.append(element_id)
+        for element_id in removed:
+            owner = owner_of(old_index, old_owners, old_index.get(element_id))
+            if owner:
+                overlay_ids.add(owner)
+
+        structural = set(new_owners.values()) != set(old_owners.values())
+        if overlay_ids or structural:
+            self.patch_overlay(overlay_ids, structural)
+        if path_ids or removed:
+            self.patch_path_data(path_ids, removed)
+        return True
+
+    def patch_overlay(self, owners, rebuild=False):
+        """Replace the overlayData.json entries of the changed containers and locks."""
+        import overlay_data
+
+        path = overlay_data.OUTPUT_PATH
+        data = json.loads(path.read_text(encoding='utf-8'))
+        container_ids = {overlay_id for kind, overlay_id in owners if kind == 'container'}
+        lock_ids = {overlay_id for kind, overlay_id in owners if kind == 'lock'}
+
+        shapes = overlay_data.container_shapes(self.labels, container_ids)
+        locks, icon = overlay_data.lock_shapes(self.index, self.labels, lock_ids)
+        shapes += locks
+        positions = {shape['id']: i for i, shape in enumerate(data['shapes'])}
+        # New, removed or relabeled shapes and a redrawn lock icon change the
+        # order or the shared geometry, so those fall back to a full rebuild
+        if rebuild or (icon is not None and icon != data['lockIcon']) or \
+                any(shape['id'] not in positions for shape in shapes):
+            data = overlay_data.build(self.index)
+            label = 'rebuilt'
+        else:
+            for shape in shapes:
+                data['shapes'][positions[shape['id']]] = shape
+            label = ', '.join(sorted(overlay_id for _, overlay_id in owners))
+
+        if write_atomic(path, overlay_data.render(data)):
+            print(f"  {path.name}: {label}")
+            return True
+        return False
+
+    def patch_path_data(self, path_ids, removed):
+        """Copy changed path geometry into pathData.json and its derived files."""
+        path_data = json.loads(PATH_DATA_PATH.read_text(encoding='utf-8'))
+        updated = {}
+        for path_id in path_ids:
+            element = self.index.get(path_id)
+            parsed = self.labels.label(element)
+            # New paths only join pathData when they are labeled connectors
+            known = path_id in path_data or (parsed is not None and parsed.kind == 'path')
+            if known and element.get('d') and path_data.get(path_id) != element.get('d'):
+                path_data[path_id] = element.get('d')
+                updated.setdefault(tree_of(self.labels, element) or '?', []).append(path_id)
+        for path_id in removed:
+            if path_id in path_data:
+                print(f"  WARNING: {path_id} was removed from the SVG but is still in {PATH_DATA_PATH.name}")
+        if not updated:
+            return False
+
+        write_atomic(PATH_DATA_PATH, json.dumps(path_data, indent=2) + '\n')
+        for tree, ids in sorted(updated.items()):
+            print(f"  {PATH_DATA_PATH.name}: tree {tree}: {', '.join(ids)}")
+
+        import generatePathLods
+        import path_binary
+        changed_ids = [path_id for ids in updated.values() for path_id in ids]
+        written = generatePathLods.patch(path_data, changed_ids)
+        if write_bytes_if_changed(path_binary.OUTPUT_PATH, path_binary.encode(path_data)):
+            written.append(path_binary.OUTPUT_PATH.name)
+        if written:
+            print(f"  updated {', '.join(written)}")
+        return True
+
+    def config_changed(self):
+        """
+        Report per-node config changes and recheck the tree transforms.
+        Returns True whenever the config content changed, including edits
+        outside the nodes (tree transforms, maxSkillPoints, ...).
+        """
+        try:
+            config = load_config()
+        except ValueError as e:
+            print(f"Config does not parse yet ({e}); waiting for the next save")
+            return False
+        if config.config_hash == self.config.config_hash:
+            print("Config saved without changes")
+            return False
+        old_nodes = {node.id: node.data for node in self.config}
+        new_nodes = {node.id: node.data for node in config}
+        self.config = config
+
+        added, removed, modified = diff_ids(old_nodes, new_nodes)
+        for title, ids in (('added', added), ('removed', removed), ('modified', modified)):
+            if ids:
+                print(f"Config: {title} {', '.join(ids)}")
+        if not (added or removed or modified):
+            print("Config saved without node changes")
+
+        from svg_transforms import to_string, tree_matrix_mismatches
+        for tree, matrix, config_matrix in tree_matrix_mismatches(self.index, config):
+            print(f"  WARNING: tree {tree} transform is {to_string(matrix)} in the SVG but "
+                  f"{to_string(config_matrix) if config_matrix else 'missing'} in the config")
+        return True
+
+    def stale_stages(self, changed_files):
+        """Default build stages reading a changed file that the watcher does not patch."""
+        from build import STAGES
+        return [stage.name for stage in STAGES
+                if stage.default and stage.name not in PATCHED_STAGES
+                and any(relative in stage.inputs for relative in changed_files)]
+
+    def after_change(self, changed_files):
+        stages = self.stale_stages(changed_files)
+        if not stages:
+            return
+        if self.build_stale:
+            from build import build
+            build(stages)
+        else:
+            print(f"  stale (run build.py): {', '.join(stages)}")
+
+
+def file_key(path):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def watch(interval=0.25, build_stale=False):
+    """Poll the SVG and config until interrupted."""
+    watcher = Watcher(build_stale)
+    handlers = {SVG_PATH: watcher.svg_changed, CONFIG_PATH: watcher.config_changed}
+    keys = {path: file_key(path) for path in handlers}
+    print(f"Watching {SVG_PATH.name} and {CONFIG_PATH.name} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            changed_files = []
+            for path, handler in handlers.items():
+                key = file_key(path)
+                if key is None or key == keys[path]:
+                    continue
+                keys[path] = key
+                start = time.perf_counter()
+                if handler():
+                    changed_files.append(path.relative_to(REPO_ROOT).as_posix())
+                print(f"  ({(time.perf_counter() - start) * 1000:.0f} ms)", flush=True)
+            if changed_files:
+                watcher.after_change(changed_files)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Patch generated data as the SVG and config are saved')
+    parser.add_argument('--interval', type=float, default=0.25, help='polling interval in seconds')
+    parser.add_argument('--build', action='store_true',
+                        help='also run the build.py stages the watcher does not patch itself')
+    args = parser.parse_args()
+    watch(args.interval, args.build)
+
+
+if __name__ == '__main__':
+    main()
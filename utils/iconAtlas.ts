@@ -0,0 +1,59 @@
+/**
+ * Sprite atlases of the skill icons
+ *
+ * scripts/pack_icons.py packs every icon in public/icons into one or a few
+ * atlas images (PNG and WebP) and maps each icon path to its rectangle in
+ * public/icons/atlas.json, so a full tree needs one image request instead of
+ * one per icon.
+ */
+
+import iconAtlasJson from '@/public/icons/atlas.json';
+
+interface IconAtlas {
+  png: string;
+  webp?: string;
+  width: number;
+  height: number;
+}
+
+interface IconAtlasManifest {
+  padding: number;
+  atlases: IconAtlas[];
+  icons: Record<string, { atlas: number; x: number; y: number; w: number; h: number }>;
+}
+
+export interface IconSprite {
+  href: string; // Atlas image
+  atlasWidth: number;
+  atlasHeight: number;
+  x: number; // Sprite rectangle in atlas pixels
+  y: number;
+  width: number;
+  height: number;
+}
+
+const iconAtlas = iconAtlasJson as IconAtlasManifest;
+
+/**
+ * Atlas rectangle of an icon, or null for icons that are not packed or whose
+ * sprite is smaller than `displaySize` CSS pixels at the device pixel ratio
+ * (those are better served by a larger variant, see utils/iconVariants.ts).
+ */
+export function getIconSprite(iconPath: string, displaySize = 0): IconSprite | null {
+  const sprite = iconAtlas.icons[iconPath];
+  if (!sprite) return null;
+
+  const pixelRatio = typeof window !== 'undefined' ? window.devicePixelRatio || 1 : 1;
+  if (displaySize * pixelRatio > Math.max(sprite.w, sprite.h)) return null;
+
+  const atlas = iconAtlas.atlases[sprite.atlas];
+  return {
+    href: atlas.webp ?? atlas.png,
+    atlasWidth: atlas.width,
+    atlasHeight: atlas.height,
+    x: sprite.x,
+    y: sprite.y,
+    width: sprite.w,
+    height: sprite.h,
+  };
+}
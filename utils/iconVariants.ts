@@ -0,0 +1,41 @@
+/**
+ * Size/format variants of the skill icons
+ *
+ * scripts/process_icons.py writes every icon in public/icons at several sizes
+ * (PNG and WebP) and lists them in public/icons/variants.json, keyed by the
+ * icon path stored on nodes ("/icons/skill_icon_1.png").
+ */
+
+import iconVariantsJson from '@/public/icons/variants.json';
+
+export type IconFormat = 'png' | 'webp';
+
+export interface IconVariant {
+  size: number; // Edge length in pixels
+  format: IconFormat;
+  src: string;
+  bytes: number;
+}
+
+interface IconVariantManifest {
+  sizes: number[];
+  formats: IconFormat[];
+  icons: Record<string, IconVariant[]>;
+}
+
+const iconVariants = iconVariantsJson as IconVariantManifest;
+
+/**
+ * Smallest variant of an icon that covers `displaySize` CSS pixels at the
+ * device pixel ratio, falling back to the largest one and then to the
+ * original path for icons without variants.
+ */
+export function getIconVariantSrc(iconPath: string, displaySize: number, format: IconFormat = 'webp'): string {
+  const variants = iconVariants.icons[iconPath]?.filter((variant) => variant.format === format);
+  if (!variants || variants.length === 0 || !(displaySize > 0)) return iconPath;
+
+  const pixelRatio = typeof window !== 'undefined' ? window.devicePixelRatio || 1 : 1;
+  const needed = displaySize * pixelRatio;
+  const match = variants.find((variant) => variant.size >= needed) ?? variants[variants.length - 1];
+  return match.src;
+}